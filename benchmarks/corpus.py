@@ -0,0 +1,54 @@
+"""Synthetic job corpus shared by the benchmarks."""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from job_checker.models import Job
+
+
+TITLES = [
+    "DevOps Engineer", "Senior Platform Engineer", "Cloud Infrastructure Engineer", "SRE Intern",
+    "Staff Site Reliability Engineer", "Sales Engineer", "Platform Engineer, Kubernetes",
+    "Infrastructure Engineer II", "Cloud Solutions Architect", "Lead DevOps Engineer",
+    "Backend Engineer", "Data Engineer",
+]
+COMPANIES = ["stripe", "datadog", "cloudflare", "Acme Corp", "squareup", "hashicorp", "vercel"]
+LOCATIONS = [
+    "Remote - US", "Austin, TX", "Remote", "San Francisco, CA", "", "Round Rock, Texas",
+    "New York, NY", "United States", "London, UK", "Toronto, Canada",
+]
+SOURCES = ["greenhouse", "lever", "remotive", "wwr"]
+FILLER = [
+    "We are looking for a motivated engineer to join our growing team",
+    "You will collaborate with product, design and security to ship reliable systems",
+    "Benefits include health insurance, 401k matching and a learning budget",
+    "Our stack includes aws, terraform, kubernetes and github actions",
+    "Experience with python, linux and observability tooling such as prometheus is a plus",
+    "This is a full-time position open to candidates across the United States",
+]
+
+
+def make_jobs(n: int, seed: int = 0) -> List[Job]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    jobs: List[Job] = []
+    for i in range(n):
+        description = None
+        if rng.random() < 0.7:
+            description = ". ".join(rng.choice(FILLER) for _ in range(rng.randint(10, 40)))
+        posted = (now - timedelta(hours=rng.uniform(0, 96))).isoformat()
+        jobs.append(
+            Job(
+                source=rng.choice(SOURCES),
+                id=str(i),
+                title=rng.choice(TITLES),
+                company=rng.choice(COMPANIES),
+                location=rng.choice(LOCATIONS),
+                url=f"https://example.com/jobs/{i}",
+                description=description,
+                posted_at_iso=posted,
+            )
+        )
+    return jobs
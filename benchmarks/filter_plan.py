@@ -0,0 +1,91 @@
+"""Per-10k-job cost of apply_keyword_filters against the pre-FilterPlan baseline.
+
+Run from the repository root:
+
+    python benchmarks/filter_plan.py [--jobs 10000] [--config config.yml]
+
+The baseline is the original function (benchmarks/baseline_filtering.py) on
+baseline Job records with raw descriptions. The current function runs on the
+same records after ingestion, which happens once at fetch time; its cost is
+reported on its own line. Each current line is compared with the baseline
+called the same way. The filters have changed since the baseline, so the pass
+counts are shown next to the timings.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks import baseline_filtering  # noqa: E402
+from benchmarks.corpus import make_jobs  # noqa: E402
+from job_checker.config import load_config  # noqa: E402
+from job_checker.fetching import ingest_job  # noqa: E402
+from job_checker.filtering import apply_keyword_filters  # noqa: E402
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--config", default="config.yml")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    jobs = make_jobs(args.jobs)
+    baseline_jobs = [
+        baseline_filtering.Job(j.source, j.id, j.title, j.company, j.location, j.url, j.description, j.posted_at_iso)
+        for j in jobs
+    ]
+    ingested = [ingest_job(job) for job in jobs]
+    per_10k = 10_000 / len(jobs)
+    passed = {}
+
+    def baseline_batch() -> None:
+        passed["baseline"] = len(baseline_filtering.apply_keyword_filters(baseline_jobs, cfg))
+
+    def baseline_per_job() -> None:
+        for job in baseline_jobs:
+            baseline_filtering.apply_keyword_filters([job], cfg)
+
+    def ingest() -> None:
+        for job in jobs:
+            ingest_job(job)
+
+    def current_batch() -> None:
+        passed["current"] = len(apply_keyword_filters(ingested, cfg))
+
+    def current_per_job() -> None:
+        for job in ingested:
+            apply_keyword_filters([job], cfg)
+
+    # Warm caches (plan, matcher, parsed timestamps) for both sides
+    baseline_batch()
+    current_batch()
+    # (label, fn, pass count key, label of the baseline line to compare with)
+    rows = [
+        ("baseline, one batch", baseline_batch, "baseline", None),
+        ("current, one batch", current_batch, "current", "baseline, one batch"),
+        ("baseline, one call per job", baseline_per_job, "baseline", None),
+        ("current, one call per job", current_per_job, "current", "baseline, one call per job"),
+        ("ingestion (once per fetch)", ingest, None, None),
+    ]
+    timings = {}
+    print(f"{len(jobs)} synthetic jobs, config {args.config}")
+    for label, fn, key, reference in rows:
+        seconds = timings[label] = _timed(fn) * per_10k
+        count = f"{passed[key]:>6} pass" if key else " " * 11
+        speedup = f"  ({timings[reference] / seconds:5.1f}x vs baseline)" if reference else ""
+        print(f"  {label:<28} {seconds * 1000:9.1f} ms / 10k jobs  {count}{speedup}".rstrip())
+
+
+if __name__ == "__main__":
+    main()
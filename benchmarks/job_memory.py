@@ -0,0 +1,121 @@
+"""Memory held by a window of ingested jobs: slotted Job vs. the former frozen dataclass.
+
+Run from the repository root:
+
+    python benchmarks/job_memory.py [--jobs 100000] [--config config.yml]
+
+Every job is decoded from its own JSON record inside the measured region, so
+its strings are separate objects that die with the record unless the job keeps
+them, as when parsing a source payload. Memory is measured again after one
+apply_keyword_filters pass over the window, which reads every surviving
+description, as each poll cycle does.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.corpus import make_jobs  # noqa: E402
+from job_checker.config import Config, load_config  # noqa: E402
+from job_checker.fetching import ingest_job  # noqa: E402
+from job_checker.filtering import apply_keyword_filters  # noqa: E402
+from job_checker.models import Job  # noqa: E402
+from job_checker.textnorm import normalize_description  # noqa: E402
+from job_checker.timeparse import parse_timestamp  # noqa: E402
+
+
+@dataclass(frozen=True)
+class DataclassJob:
+    """The Job layout before it was slotted, as ingestion used to fill it."""
+
+    source: str
+    id: str
+    title: str
+    company: str
+    location: str
+    url: str
+    description: Optional[str] = None
+    posted_at_iso: Optional[str] = None
+    posted_at: Optional[datetime] = None
+    description_lower: Optional[str] = None
+
+    @property
+    def packed_description(self) -> Optional[str]:
+        # This layout never compressed; the filters read it for Job's stored form
+        return self.description
+
+
+def _records(n: int) -> List[str]:
+    fields = ("source", "id", "title", "company", "location", "url", "description", "posted_at_iso")
+    return [json.dumps({name: getattr(job, name) for name in fields}) for job in make_jobs(n)]
+
+
+def _build_dataclass(row: str) -> DataclassJob:
+    record = json.loads(row)
+    description = normalize_description(record["description"])
+    return DataclassJob(
+        **{**record, "description": description},
+        posted_at=parse_timestamp(record["posted_at_iso"], record["source"]),
+        description_lower=description.lower() if description else None,
+    )
+
+
+def _build_slotted(row: str) -> Job:
+    return ingest_job(Job(**json.loads(row)))
+
+
+def _measure(records: List[str], build: Callable[[str], object], cfg: Config) -> Tuple[int, int, float]:
+    """(bytes held by the built jobs, bytes held after a filter pass, seconds to build them untraced)."""
+    gc.collect()
+    start = time.perf_counter()
+    jobs = [build(record) for record in records]
+    elapsed = time.perf_counter() - start
+    # Warms the plan and the location memo, so they are not counted below
+    apply_keyword_filters(jobs, cfg)
+    del jobs
+    gc.collect()
+    tracemalloc.start()
+    jobs = [build(record) for record in records]
+    held, _ = tracemalloc.get_traced_memory()
+    apply_keyword_filters(jobs, cfg)
+    gc.collect()
+    after_filter, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del jobs
+    return held, after_filter, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--config", default="config.yml")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    records = _records(args.jobs)
+    rows = [
+        ("frozen dataclass", _build_dataclass),
+        ("slotted Job", _build_slotted),
+    ]
+    results = [(label, *_measure(records, build, cfg)) for label, build in rows]
+    baseline = results[0][2]
+    print(f"{len(records)} synthetic jobs, config {args.config}")
+    for label, held, after_filter, elapsed in results:
+        print(
+            f"  {label:<18} {held / 2**20:8.1f} MiB built, {after_filter / 2**20:8.1f} MiB after filtering"
+            f"  {after_filter / len(records):7.0f} B/job  ({baseline / after_filter:4.1f}x)  built in {elapsed:5.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
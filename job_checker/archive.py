@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import Job
+from .storage import SeenStore, connect
+
+SCOPE_AUSTIN = "Austin"
+SCOPE_US_REMOTE = "US Remote"
+
+# Rows per INSERT batch; each cycle's batches share one transaction
+_BATCH = 500
+_SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class ArchivedJob:
+    """One archive row, as the web API serves it."""
+
+    id: str
+    title: str
+    company: str
+    location: str
+    url: str
+    source: str
+    scope: str
+    is_stretch: bool
+    accepted: bool
+    posted_at: Optional[str]
+    first_seen: str
+    description: Optional[str]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location or "Remote",
+            "url": self.url,
+            "source": self.source,
+            "scope": self.scope,
+            "is_stretch": self.is_stretch,
+            "created_at": self.posted_at or self.first_seen,
+            "description": self.description,
+        }
+
+
+_COLUMNS = "job_id, title, company, location, url, source, scope, is_stretch, accepted, posted_at, first_seen, description"
+
+
+def fts_query(text: str) -> str:
+    """User search text as an FTS5 query: every word, as a prefix, must match."""
+    return " ".join(f'"{token}"*' for token in _SEARCH_TOKEN.findall(text))
+
+
+class JobArchive:
+    """Every posting the pipeline judged, with an FTS5 index for the web API.
+
+    Rows are keyed like the seen store, so a posting appears once however often
+    it is fetched; a later acceptance upgrades a rejected row. The FTS index
+    over title, company and description is an external-content table kept in
+    step by triggers. Without FTS5 in the local SQLite, search falls back to
+    LIKE scans.
+
+    One connection serves the poller's profile threads, or the web app's
+    request threads, under a lock.
+    """
+
+    def __init__(self, db_path: str = "job_checker.db") -> None:
+        self.db_path = db_path
+        self.fts = True
+        self._lock = threading.Lock()
+        self._conn = connect(db_path, check_same_thread=False)
+        self._ensure()
+
+    def _ensure(self) -> None:
+        with self._lock, self._conn as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS archive_jobs (
+                    id INTEGER PRIMARY KEY,
+                    key TEXT UNIQUE NOT NULL,
+                    job_id TEXT,
+                    source TEXT,
+                    title TEXT,
+                    company TEXT,
+                    location TEXT,
+                    url TEXT,
+                    description TEXT,
+                    posted_at TEXT,
+                    scope TEXT,
+                    is_stretch INTEGER,
+                    accepted INTEGER,
+                    first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_archive_listing ON archive_jobs (accepted, first_seen)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_archive_source ON archive_jobs (source COLLATE NOCASE)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_archive_scope ON archive_jobs (scope COLLATE NOCASE)")
+            try:
+                conn.execute(
+                    """
+                    CREATE VIRTUAL TABLE IF NOT EXISTS archive_fts USING fts5(
+                        title, company, description,
+                        content='archive_jobs', content_rowid='id',
+                        tokenize='unicode61 remove_diacritics 2'
+                    )
+                    """
+                )
+            except sqlite3.OperationalError:
+                self.fts = False
+                return
+            conn.executescript(
+                """
+                CREATE TRIGGER IF NOT EXISTS archive_jobs_ai AFTER INSERT ON archive_jobs BEGIN
+                    INSERT INTO archive_fts (rowid, title, company, description)
+                    VALUES (new.id, new.title, new.company, new.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS archive_jobs_ad AFTER DELETE ON archive_jobs BEGIN
+                    INSERT INTO archive_fts (archive_fts, rowid, title, company, description)
+                    VALUES ('delete', old.id, old.title, old.company, old.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS archive_jobs_au AFTER UPDATE OF title, company, description ON archive_jobs
+                BEGIN
+                    INSERT INTO archive_fts (archive_fts, rowid, title, company, description)
+                    VALUES ('delete', old.id, old.title, old.company, old.description);
+                    INSERT INTO archive_fts (rowid, title, company, description)
+                    VALUES (new.id, new.title, new.company, new.description);
+                END;
+                """
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def record(
+        self,
+        jobs: Iterable[Job],
+        accepted: bool,
+        scope_of: Callable[[Job], Tuple[str, bool]],
+    ) -> int:
+        """Upsert ``jobs`` in one transaction; returns how many rows were written.
+
+        ``scope_of`` gives (scope label, is_stretch), e.g. from split_scope.
+        """
+        rows = []
+        for job in jobs:
+            scope, is_stretch = scope_of(job)
+            posted_at = job.posted_at.isoformat() if job.posted_at else job.posted_at_iso
+            rows.append((
+                SeenStore.make_key(job), job.id, job.source, job.title, job.company, job.location,
+                job.url, job.description, posted_at, scope, int(is_stretch), int(accepted),
+            ))
+        if not rows:
+            return 0
+        with self._lock, self._conn as conn:
+            for i in range(0, len(rows), _BATCH):
+                conn.executemany(
+                    """
+                    INSERT INTO archive_jobs (
+                        key, job_id, source, title, company, location, url,
+                        description, posted_at, scope, is_stretch, accepted
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        last_seen = CURRENT_TIMESTAMP,
+                        -- An acceptance upgrades a rejected row to what the accepting pass saw
+                        scope = CASE WHEN excluded.accepted > accepted THEN excluded.scope ELSE scope END,
+                        is_stretch = CASE WHEN excluded.accepted > accepted THEN excluded.is_stretch ELSE is_stretch END,
+                        description = CASE WHEN excluded.accepted > accepted THEN excluded.description ELSE description END,
+                        posted_at = CASE WHEN excluded.accepted > accepted THEN excluded.posted_at ELSE posted_at END,
+                        accepted = MAX(accepted, excluded.accepted)
+                    """,
+                    rows[i:i + _BATCH],
+                )
+        return len(rows)
+
+    def _where(
+        self,
+        search: Optional[str],
+        company: Optional[str],
+        scope: Optional[str],
+        source: Optional[str],
+        accepted_only: bool,
+    ) -> Tuple[str, str, List[Any]]:
+        joins = ""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if accepted_only:
+            clauses.append("j.accepted = 1")
+        # FTS5 allows one MATCH per query, so column filters are combined into one expression
+        match: List[str] = []
+        for columns, value in (("", search), ("company : ", company)):
+            query = fts_query(value or "")
+            if not query:
+                continue
+            if self.fts:
+                match.append(f"{columns}({query})")
+            else:
+                fields = ("j.company",) if columns else ("j.title", "j.company", "j.description")
+                clauses.append("(" + " OR ".join(f"{f} LIKE ?" for f in fields) + ")")
+                params.extend(f"%{value}%" for _ in fields)
+        if match:
+            joins = "JOIN archive_fts ON archive_fts.rowid = j.id"
+            clauses.append("archive_fts MATCH ?")
+            params.append(" AND ".join(match))
+        if scope:
+            clauses.append("j.scope = ? COLLATE NOCASE")
+            params.append(scope)
+        if source:
+            clauses.append("j.source = ? COLLATE NOCASE")
+            params.append(source)
+        where = " AND ".join(clauses) or "1"
+        return joins, where, params
+
+    def search(
+        self,
+        search: Optional[str] = None,
+        company: Optional[str] = None,
+        scope: Optional[str] = None,
+        source: Optional[str] = None,
+        accepted_only: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[ArchivedJob], int]:
+        """One page of matching jobs, newest first, and the total match count.
+
+        ``search`` matches words (as prefixes) in title, company or description,
+        ``company`` in the company name; ``scope`` and ``source`` are case-insensitive
+        exact matches.
+        """
+        joins, where, params = self._where(search, company, scope, source, accepted_only)
+        columns = ", ".join(f"j.{c}" for c in _COLUMNS.split(", "))
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM archive_jobs j {joins} WHERE {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"""
+                SELECT {columns} FROM archive_jobs j {joins} WHERE {where}
+                ORDER BY j.first_seen DESC, j.id DESC LIMIT ? OFFSET ?
+                """,
+                [*params, limit, offset],
+            ).fetchall()
+        return [self._row(row) for row in rows], total
+
+    def posted_today(self) -> List[ArchivedJob]:
+        """Accepted jobs posted today (UTC), or first seen today when the posting date is unknown."""
+        columns = ", ".join(f"j.{c}" for c in _COLUMNS.split(", "))
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT {columns} FROM archive_jobs j
+                -- Nothing posted today was seen before today; the bound lets the listing index apply
+                WHERE j.accepted = 1 AND j.first_seen >= date('now')
+                AND date(COALESCE(j.posted_at, j.first_seen)) = date('now')
+                ORDER BY j.first_seen DESC, j.id DESC
+                """
+            ).fetchall()
+        return [self._row(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Accepted job counts: in total, posted today, and by company and by scope."""
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM archive_jobs WHERE accepted = 1").fetchone()[0]
+            today = self._conn.execute(
+                """
+                SELECT COUNT(*) FROM archive_jobs WHERE accepted = 1 AND first_seen >= date('now')
+                AND date(COALESCE(posted_at, first_seen)) = date('now')
+                """
+            ).fetchone()[0]
+            by_company = self._conn.execute(
+                "SELECT company, COUNT(*) FROM archive_jobs WHERE accepted = 1 GROUP BY company"
+            ).fetchall()
+            by_scope = self._conn.execute(
+                "SELECT scope, COUNT(*) FROM archive_jobs WHERE accepted = 1 GROUP BY scope"
+            ).fetchall()
+        return {
+            "total_jobs": total,
+            "jobs_today": today,
+            "jobs_by_company": dict(by_company),
+            "jobs_by_scope": {scope or "": count for scope, count in by_scope},
+        }
+
+    @staticmethod
+    def _row(row: Sequence[Any]) -> ArchivedJob:
+        job_id, title, company, location, url, source, scope, is_stretch, accepted, posted_at, first_seen, desc = row
+        return ArchivedJob(
+            job_id, title, company, location or "", url, source, scope or "",
+            bool(is_stretch), bool(accepted), posted_at, first_seen, desc,
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM archive_jobs WHERE accepted = 1").fetchone()[0]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+from typing import Iterable, Optional
+
+_MAGIC = b"JCBF"
+_VERSION = 1
+# magic, version, bit count, hash count, capacity, error rate, items added, sync mark
+_HEADER = struct.Struct("<4sHQHQdQq")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys.
+
+    ``in`` never answers False for an added key; it answers True for a key
+    never added with probability about ``error_rate`` while at most
+    ``capacity`` keys have been added. Bits are derived by double hashing
+    one 128-bit blake2b digest.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        self.capacity = max(1, capacity)
+        self.error_rate = min(max(error_rate, 1e-9), 0.5)
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.count = 0
+        # Caller-defined position of the last source row folded in (see SeenStore)
+        self.mark = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return ((h1 + i * h2) % m for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        added = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                added = True
+        # Re-adding a present key (or a full false positive) does not count
+        if added:
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def saturated(self) -> bool:
+        return self.count > self.capacity
+
+    def save(self, path: str) -> None:
+        """Write to ``path`` atomically, so a crash never leaves a torn file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC, _VERSION, self.num_bits, self.num_hashes,
+                    self.capacity, self.error_rate, self.count, self.mark,
+                )
+            )
+            f.write(self._bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BloomFilter"]:
+        """The filter saved at ``path``, or None if missing or unreadable."""
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                magic, version, num_bits, num_hashes, capacity, error_rate, count, mark = _HEADER.unpack(header)
+                bits = f.read()
+        except (OSError, struct.error):
+            return None
+        if magic != _MAGIC or version != _VERSION or len(bits) != (num_bits + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.error_rate = error_rate
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom.mark = mark
+        bloom._bits = bytearray(bits)
+        return bloom
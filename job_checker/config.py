@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import os
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 
 import yaml
 
+if TYPE_CHECKING:
+    from .filtering import FilterPlan
+
+# The profile whose seen history and channel names are the unprefixed ones
+DEFAULT_PROFILE = "default"
+# Sections a profile may override; app and sources stay shared, as the fetch is
+PROFILE_SECTIONS = ("filters", "locations", "telegram", "notifiers")
+
 
 @dataclass
 class AppConfig:
@@ -15,6 +24,27 @@ class AppConfig:
     adaptive_recency: bool = True
     weekday_max_post_age_hours: int = 24
     weekend_max_post_age_hours: int = 72
+    max_concurrency: int = 16
+    per_host_concurrency: int = 6
+    skip_unchanged_payloads: bool = True
+    adaptive_polling: bool = False
+    min_poll_seconds: int = 60
+    max_poll_seconds: int = 1800
+    verdict_cache_size: int = 20000
+    verdict_ttl_hours: int = 24
+    persist_verdicts: bool = True
+    collapse_duplicates: bool = True
+    duplicate_threshold: float = 0.7
+    duplicate_window_days: int = 14
+    seen_bloom_capacity: int = 1_000_000
+    seen_bloom_error_rate: float = 0.001
+    seen_retention_days: int = 0
+    seen_retention_days_by_source: Dict[str, int] = field(default_factory=dict)
+    retention_interval_minutes: int = 60
+    vacuum_interval_hours: int = 24
+    archive_jobs: bool = True
+    archive_rejected: bool = False
+    outbox_max_attempts: int = 8
 
 
 @dataclass
@@ -50,6 +80,7 @@ class SourcesConfig:
     remotive: SourceToggle = field(default_factory=lambda: SourceToggle(True))
     greenhouse: SourceToggle = field(default_factory=lambda: SourceToggle(True))
     lever: SourceToggle = field(default_factory=lambda: SourceToggle(True))
+    wwr: SourceToggle = field(default_factory=lambda: SourceToggle(False))
     jobspikr: SourceToggle = field(default_factory=lambda: SourceToggle(False))
     jobdataapi: SourceToggle = field(default_factory=lambda: SourceToggle(False))
 
@@ -60,6 +91,40 @@ class TelegramConfig:
     tag_us_remote: str = "[US-REMOTE]"
     tag_core: str = "[CORE]"
     tag_stretch: str = "[STRETCH]"
+    # Pack each group of new jobs into as few messages as fit Telegram's limit
+    digest: bool = True
+    per_chat_per_minute: float = 20.0
+    per_chat_burst: int = 3
+    # Environment variables holding the chat ids, so profiles can post to their own chats
+    core_chat_id_env: str = "TELEGRAM_CORE_CHAT_ID"
+    stretch_chat_id_env: str = "TELEGRAM_STRETCH_CHAT_ID"
+
+
+@dataclass
+class WebhookConfig:
+    enabled: bool = False
+    url: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    timeout_seconds: float = 5.0
+
+
+@dataclass
+class EmailConfig:
+    enabled: bool = False
+    host: str = "localhost"
+    port: int = 25
+    sender: str = ""
+    recipients: List[str] = field(default_factory=list)
+    starttls: bool = False
+    use_ssl: bool = False
+    timeout_seconds: float = 10.0
+
+
+@dataclass
+class NotifiersConfig:
+    telegram: bool = True
+    webhook: WebhookConfig = field(default_factory=WebhookConfig)
+    email: EmailConfig = field(default_factory=EmailConfig)
 
 
 @dataclass
@@ -69,6 +134,11 @@ class Config:
     locations: LocationsConfig
     sources: SourcesConfig
     telegram: TelegramConfig
+    notifiers: NotifiersConfig = field(default_factory=NotifiersConfig)
+    # Profile name, "" for the top-level config and the default profile
+    profile: str = ""
+    # Compiled by load_config; see filtering.filter_plan
+    plan: Optional["FilterPlan"] = field(default=None, repr=False, compare=False)
 
 
 def _read_yaml(path: str) -> Dict[str, Any]:
@@ -83,14 +153,52 @@ def _get_env_flag(name: str, default: bool) -> bool:
     return value.lower() in {"1", "true", "yes", "on"}
 
 
+def config_fingerprint(cfg: Config) -> str:
+    """Stable hash of the whole config; changes whenever config.yml does."""
+    return hashlib.sha256(repr(cfg).encode("utf-8")).hexdigest()
+
+
 def load_config(config_path: str) -> Config:
+    return _build_config(_read_yaml(config_path))
+
+
+def load_profiles(config_path: str) -> List[Config]:
+    """One Config per entry under ``profiles:``; just the top-level config without any.
+
+    Each profile has a unique ``name`` and may set keys of the filters,
+    locations, telegram and notifiers sections, replacing the top-level keys
+    of the same name. A profile named ``default`` shares the seen history of a
+    single-config setup.
+    """
     data = _read_yaml(config_path)
+    profiles = data.get("profiles") or []
+    if not profiles:
+        return [_build_config(data)]
+    configs: List[Config] = []
+    names = set()
+    for node in profiles:
+        name = str(node.get("name", "")).strip()
+        if not name or name in names:
+            raise ValueError(f"Profile names must be unique and non-empty: {name!r}")
+        names.add(name)
+        merged = dict(data)
+        for section in PROFILE_SECTIONS:
+            merged[section] = {**(data.get(section) or {}), **(node.get(section) or {})}
+        cfg = _build_config(merged)
+        cfg.profile = "" if name == DEFAULT_PROFILE else name
+        configs.append(cfg)
+    return configs
 
+
+def _build_config(data: Dict[str, Any]) -> Config:
     app = data.get("app", {})
     filters = data.get("filters", {})
     locations = data.get("locations", {})
     sources = data.get("sources", {})
     telegram = data.get("telegram", {})
+    notifiers = data.get("notifiers", {})
+    webhook = notifiers.get("webhook", {}) or {}
+    email = notifiers.get("email", {}) or {}
 
     def make_toggle(name: str, default_enabled: bool, extras: Optional[Dict[str, Any]] = None) -> SourceToggle:
         node = sources.get(name, {})
@@ -108,6 +216,29 @@ def load_config(config_path: str) -> Config:
             adaptive_recency=bool(app.get("adaptive_recency", True)),
             weekday_max_post_age_hours=int(app.get("weekday_max_post_age_hours", 24)),
             weekend_max_post_age_hours=int(app.get("weekend_max_post_age_hours", 72)),
+            max_concurrency=int(app.get("max_concurrency", 16)),
+            per_host_concurrency=int(app.get("per_host_concurrency", 6)),
+            skip_unchanged_payloads=bool(app.get("skip_unchanged_payloads", True)),
+            adaptive_polling=bool(app.get("adaptive_polling", False)),
+            min_poll_seconds=int(app.get("min_poll_seconds", 60)),
+            max_poll_seconds=int(app.get("max_poll_seconds", 1800)),
+            verdict_cache_size=int(app.get("verdict_cache_size", 20000)),
+            verdict_ttl_hours=int(app.get("verdict_ttl_hours", 24)),
+            persist_verdicts=bool(app.get("persist_verdicts", True)),
+            collapse_duplicates=bool(app.get("collapse_duplicates", True)),
+            duplicate_threshold=float(app.get("duplicate_threshold", 0.7)),
+            duplicate_window_days=int(app.get("duplicate_window_days", 14)),
+            seen_bloom_capacity=int(app.get("seen_bloom_capacity", 1_000_000)),
+            seen_bloom_error_rate=float(app.get("seen_bloom_error_rate", 0.001)),
+            seen_retention_days=int(app.get("seen_retention_days", 0)),
+            seen_retention_days_by_source={
+                str(k): int(v) for k, v in (app.get("seen_retention_days_by_source") or {}).items()
+            },
+            retention_interval_minutes=int(app.get("retention_interval_minutes", 60)),
+            vacuum_interval_hours=int(app.get("vacuum_interval_hours", 24)),
+            archive_jobs=bool(app.get("archive_jobs", True)),
+            archive_rejected=bool(app.get("archive_rejected", False)),
+            outbox_max_attempts=int(app.get("outbox_max_attempts", 8)),
         ),
         filters=FiltersConfig(
             include_keywords=list(filters.get("include_keywords", [])),
@@ -131,6 +262,7 @@ def load_config(config_path: str) -> Config:
             remotive=make_toggle("remotive", True),
             greenhouse=make_toggle("greenhouse", True),
             lever=make_toggle("lever", True),
+            wwr=make_toggle("wwr", False),
             jobspikr=make_toggle("jobspikr", False),
             jobdataapi=make_toggle("jobdataapi", False),
         ),
@@ -139,8 +271,35 @@ def load_config(config_path: str) -> Config:
             tag_us_remote=str(telegram.get("tag_us_remote", "[US-REMOTE]")),
             tag_core=str(telegram.get("tag_core", "[CORE]")),
             tag_stretch=str(telegram.get("tag_stretch", "[STRETCH]")),
+            digest=bool(telegram.get("digest", True)),
+            per_chat_per_minute=float(telegram.get("per_chat_per_minute", 20.0)),
+            per_chat_burst=int(telegram.get("per_chat_burst", 3)),
+            core_chat_id_env=str(telegram.get("core_chat_id_env", "TELEGRAM_CORE_CHAT_ID")),
+            stretch_chat_id_env=str(telegram.get("stretch_chat_id_env", "TELEGRAM_STRETCH_CHAT_ID")),
+        ),
+        notifiers=NotifiersConfig(
+            telegram=bool(notifiers.get("telegram", True)),
+            webhook=WebhookConfig(
+                enabled=bool(webhook.get("enabled", False)),
+                url=str(webhook.get("url", "")),
+                headers={str(k): str(v) for k, v in (webhook.get("headers") or {}).items()},
+                timeout_seconds=float(webhook.get("timeout_seconds", 5.0)),
+            ),
+            email=EmailConfig(
+                enabled=bool(email.get("enabled", False)),
+                host=str(email.get("host", "localhost")),
+                port=int(email.get("port", 25)),
+                sender=str(email.get("sender", "")),
+                recipients=[str(r) for r in email.get("recipients", [])],
+                starttls=bool(email.get("starttls", False)),
+                use_ssl=bool(email.get("use_ssl", False)),
+                timeout_seconds=float(email.get("timeout_seconds", 10.0)),
+            ),
         ),
     )
+    # Imported here because filtering depends on this module
+    from .filtering import compile_filter_plan
+    cfg.plan = compile_filter_plan(cfg)
     return cfg
 
 
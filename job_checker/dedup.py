@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from . import geo
+from .models import Job
+from .storage import connect
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = frozenset(
+    {"ref", "referrer", "source", "src", "gh_src", "lever-source", "lever-origin", "fbclid", "gclid", "mc_cid", "mc_eid"}
+)
+_TRACKING_PREFIXES = ("utm_",)
+
+# ATS URLs whose job id identifies the posting regardless of host or board path
+_ATS_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("greenhouse", re.compile(r"^(?:boards|job-boards)(?:\.eu)?\.greenhouse\.io/[^/]+/jobs/(\d+)")),
+    ("lever", re.compile(r"^jobs(?:\.eu)?\.lever\.co/[^/]+/([0-9a-f-]{36})")),
+    ("ashby", re.compile(r"^jobs\.ashbyhq\.com/[^/]+/([0-9a-f-]{36})")),
+    ("workable", re.compile(r"^apply\.workable\.com/[^/]+/j/([0-9a-z]+)")),
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_COMPANY_SUFFIXES = frozenset({"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "gmbh", "plc", "the"})
+_TITLE_ALIASES = {
+    "sr": ("senior",),
+    "jr": ("junior",),
+    "eng": ("engineer",),
+    "engr": ("engineer",),
+    "mgr": ("manager",),
+    "sre": ("site", "reliability", "engineer"),
+    "ii": ("2",),
+    "iii": ("3",),
+}
+_TITLE_STOPWORDS = frozenset({"a", "an", "and", "the", "of", "for", "to", "remote", "hybrid", "onsite", "us", "usa"})
+
+NUM_PERM = 64
+BANDS = 16
+_ROWS = NUM_PERM // BANDS
+_PRIME = (1 << 61) - 1
+# Fixed seed: persisted buckets are only comparable under the same permutations
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = tuple((_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM))
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+def canonical_url(url: str) -> str:
+    """URL identity for dedup: ATS job ids, or the URL without tracking params and noise."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/")
+    for ats, pattern in _ATS_PATTERNS:
+        match = pattern.match(host + path)
+        if match:
+            return f"{ats}:{match.group(1)}"
+    query = []
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        lowered = key.lower()
+        if lowered == "gh_jid" and value.isdigit():
+            # Greenhouse posting embedded on a company careers page
+            return f"greenhouse:{value}"
+        if lowered in TRACKING_PARAMS or lowered.startswith(_TRACKING_PREFIXES):
+            continue
+        query.append((key, value))
+    canonical = host + path
+    if query:
+        canonical += "?" + urlencode(sorted(query))
+    return canonical
+
+
+def company_key(company: str) -> str:
+    """Company name as a board token would spell it: "Acme Corp, Inc." -> "acme"."""
+    tokens = [t for t in _TOKEN.findall(company.lower()) if t not in _COMPANY_SUFFIXES]
+    return "".join(tokens)
+
+
+def _title_tokens(title: str) -> List[str]:
+    tokens: List[str] = []
+    for token in _TOKEN.findall(title.lower()):
+        for word in _TITLE_ALIASES.get(token, (token,)):
+            if word not in _TITLE_STOPWORDS:
+                tokens.append(word)
+    return tokens
+
+
+def shingles(job: Job) -> FrozenSet[str]:
+    """Title words and word pairs plus the location's region (or its words)."""
+    tokens = _title_tokens(job.title)
+    out: Set[str] = {"t:" + t for t in tokens}
+    out.update(f"b:{a}_{b}" for a, b in zip(tokens, tokens[1:]))
+    region = geo.location_index().classify(job.location or "")
+    if region in (geo.UNKNOWN, geo.AMBIGUOUS):
+        out.update("l:" + t for t in _TOKEN.findall((job.location or "").lower()) if t != "remote")
+    else:
+        out.add("r:" + region)
+    return frozenset(out)
+
+
+def _minhash(items: Iterable[str]) -> List[int]:
+    hashes = [_hash64(item) for item in items] or [0]
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def band_buckets(company: str, items: FrozenSet[str]) -> List[int]:
+    """LSH bucket ids; only postings of the same company can share one."""
+    signature = _minhash(sorted(items))
+    buckets = []
+    for band in range(BANDS):
+        rows = signature[band * _ROWS:(band + 1) * _ROWS]
+        buckets.append(_hash64(f"{company}|{band}|" + ",".join(map(str, rows))))
+    return buckets
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _split(items: FrozenSet[str]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    title = frozenset(s for s in items if s[0] in "tb")
+    return title, items - title
+
+
+def similar(a: FrozenSet[str], b: FrozenSet[str], threshold: float) -> bool:
+    """Titles at Jaccard >= threshold and compatible locations.
+
+    A location without anything beyond "remote" is compatible with any other;
+    otherwise at least half of the location shingles must agree, so the same
+    title in Austin and in New York stays two postings.
+    """
+    title_a, loc_a = _split(a)
+    title_b, loc_b = _split(b)
+    if jaccard(title_a, title_b) < threshold:
+        return False
+    return not loc_a or not loc_b or jaccard(loc_a, loc_b) >= 0.5
+
+
+@dataclass(frozen=True)
+class _Entry:
+    url: str
+    source: str
+    company: str
+    shingles: FrozenSet[str]
+    buckets: Tuple[int, ...]
+
+
+# Lower is preferred when several copies of one posting arrive in the same batch
+SOURCE_PREFERENCE = {"greenhouse": 0, "lever": 1, "wwr": 2, "remotive": 3, "jobspikr": 4, "jobdataapi": 5}
+
+# How long a sent posting suppresses look-alikes; a role reopened later is a new posting
+DEFAULT_WINDOW_DAYS = 14
+
+
+class DuplicateIndex:
+    """Near-duplicate index over (company, title, location) plus canonical URLs.
+
+    The same role often arrives from several sources under different URLs.
+    Each posting is reduced to a MinHash signature of its title/location
+    shingles, banded into LSH buckets scoped to its company; a lookup only
+    compares against postings sharing a bucket, so it stays sublinear as the
+    history grows. Candidates are confirmed with ``similar``. Postings are
+    only compared within one ``namespace`` (profile), and only against those
+    indexed in the last ``window_days`` (0: within a batch only). Two
+    postings from the same source with different canonical URLs are never
+    duplicates: that is one source listing two requisitions.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "job_checker.db",
+        threshold: float = 0.7,
+        namespace: str = "",
+        window_days: float = DEFAULT_WINDOW_DAYS,
+    ) -> None:
+        self.db_path = db_path
+        self.threshold = threshold
+        self.namespace = namespace
+        self.window_days = window_days
+        self._ensure()
+
+    def _ensure(self) -> None:
+        with connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dedup_jobs (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT,
+                    company TEXT,
+                    shingles TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    namespace TEXT NOT NULL DEFAULT '',
+                    source TEXT
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(dedup_jobs)")}
+            if "namespace" not in columns:
+                # Databases from before profiles; old rows belong to the default one
+                conn.execute("ALTER TABLE dedup_jobs ADD COLUMN namespace TEXT NOT NULL DEFAULT ''")
+            if "source" not in columns:
+                # Old rows keep NULL and match postings from any source
+                conn.execute("ALTER TABLE dedup_jobs ADD COLUMN source TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dedup_jobs_url ON dedup_jobs (url)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dedup_jobs_created_at ON dedup_jobs (created_at)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dedup_buckets (
+                    bucket INTEGER,
+                    job_id INTEGER,
+                    PRIMARY KEY (bucket, job_id)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.commit()
+
+    @staticmethod
+    def _entry(job: Job) -> _Entry:
+        company = company_key(job.company)
+        items = shingles(job)
+        return _Entry(canonical_url(job.url), job.source, company, items, tuple(band_buckets(company, items)))
+
+    def _matches(self, entry: _Entry, url: str, source: Optional[str], company: str, items: FrozenSet[str]) -> bool:
+        if source == entry.source and url and entry.url and url != entry.url:
+            # Same source, different requisition: a reopened or second opening
+            return False
+        return company == entry.company and similar(entry.shingles, items, self.threshold)
+
+    def _seen_before(self, conn: sqlite3.Connection, entry: _Entry) -> bool:
+        if self.window_days <= 0:
+            return False
+        since = f"-{self.window_days} days"
+        if entry.url and conn.execute(
+            """
+            SELECT 1 FROM dedup_jobs
+            WHERE url = ? AND namespace = ? AND created_at >= datetime('now', ?) LIMIT 1
+            """,
+            (entry.url, self.namespace, since),
+        ).fetchone():
+            return True
+        placeholders = ",".join("?" * len(entry.buckets))
+        rows = conn.execute(
+            f"""
+            SELECT DISTINCT j.url, j.source, j.company, j.shingles FROM dedup_buckets b
+            JOIN dedup_jobs j ON j.id = b.job_id
+            WHERE b.bucket IN ({placeholders}) AND j.namespace = ? AND j.created_at >= datetime('now', ?)
+            """,
+            (*entry.buckets, self.namespace, since),
+        ).fetchall()
+        return any(
+            self._matches(entry, url or "", source, company, frozenset(stored.split()))
+            for url, source, company, stored in rows
+        )
+
+    def partition(self, jobs: Sequence[Job]) -> Tuple[List[Job], List[Job]]:
+        """Split ``jobs`` into (unique, duplicates), in input order.
+
+        A job is a duplicate if it matches a posting indexed within the window
+        or a preferred copy in the same batch (see SOURCE_PREFERENCE).
+        """
+        entries = [self._entry(job) for job in jobs]
+        order = sorted(range(len(jobs)), key=lambda i: (SOURCE_PREFERENCE.get(jobs[i].source, len(SOURCE_PREFERENCE)), i))
+        duplicate = [False] * len(jobs)
+        batch_urls: Set[str] = set()
+        batch_buckets: Dict[int, List[_Entry]] = {}
+        with connect(self.db_path) as conn:
+            for i in order:
+                entry = entries[i]
+                in_batch = (entry.url and entry.url in batch_urls) or any(
+                    self._matches(entry, other.url, other.source, other.company, other.shingles)
+                    for bucket in entry.buckets
+                    for other in batch_buckets.get(bucket, ())
+                )
+                if in_batch or self._seen_before(conn, entry):
+                    duplicate[i] = True
+                    continue
+                if entry.url:
+                    batch_urls.add(entry.url)
+                for bucket in entry.buckets:
+                    batch_buckets.setdefault(bucket, []).append(entry)
+        unique = [job for job, dup in zip(jobs, duplicate) if not dup]
+        dups = [job for job, dup in zip(jobs, duplicate) if dup]
+        return unique, dups
+
+    def add(self, jobs: Iterable[Job]) -> None:
+        with connect(self.db_path) as conn:
+            for job in jobs:
+                entry = self._entry(job)
+                cur = conn.execute(
+                    "INSERT INTO dedup_jobs (url, company, shingles, namespace, source) VALUES (?, ?, ?, ?, ?)",
+                    (entry.url, entry.company, " ".join(sorted(entry.shingles)), self.namespace, entry.source),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO dedup_buckets (bucket, job_id) VALUES (?, ?)",
+                    [(bucket, cur.lastrowid) for bucket in entry.buckets],
+                )
+            conn.commit()
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .metrics import REGISTRY, fetch_source
+from .models import Job
+from .textnorm import normalize_description
+from .timeparse import parse_timestamp
+
+
+@dataclass(frozen=True)
+class FetchTask:
+    """One unit of fetch work: a whole source, or a single board of a source."""
+
+    name: str
+    host: str
+    fn: Callable[[], Iterable[Job]]
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    task: FetchTask
+    jobs: List[Job]
+    # (url, body sha256) for every response the task consumed
+    payloads: Tuple[Tuple[str, str], ...] = ()
+    # Every payload matched its last processed fingerprint; ``jobs`` is then empty
+    unchanged: bool = False
+
+
+@dataclass
+class _PayloadLog:
+    previous: Optional[Mapping[str, str]]
+    payloads: List[Tuple[str, str]] = field(default_factory=list)
+
+    def unchanged(self) -> bool:
+        if self.previous is None or not self.payloads:
+            return False
+        return all(self.previous.get(url) == digest for url, digest in self.payloads)
+
+
+_payload_log: ContextVar[Optional[_PayloadLog]] = ContextVar("payload_log", default=None)
+
+FETCH_SECONDS = REGISTRY.histogram(
+    "job_checker_fetch_seconds", "Time to fetch and parse one source or board", ("source",)
+)
+FETCH_JOBS = REGISTRY.counter("job_checker_fetch_jobs_total", "Jobs returned per source or board", ("source",))
+FETCH_ERRORS = REGISTRY.counter("job_checker_fetch_errors_total", "Failed fetches, per source or board", ("source",))
+FETCH_UNCHANGED = REGISTRY.counter(
+    "job_checker_fetch_unchanged_total", "Fetches skipped as byte-identical to the last one processed", ("source",)
+)
+
+
+def note_payload(url: str, digest: str) -> None:
+    """Record a response body digest against the fetch task running in this thread."""
+    log = _payload_log.get()
+    if log is not None:
+        log.payloads.append((url, digest))
+
+
+def payload_unchanged() -> bool:
+    """True when the running task skips unchanged payloads and all it fetched so far is unchanged.
+
+    Sources use it to avoid follow-up requests (e.g. detail hydration) for output
+    the engine is about to drop anyway.
+    """
+    log = _payload_log.get()
+    return log is not None and log.unchanged()
+
+
+def note_failure(source: str, error: Exception) -> None:
+    """Count and log a fetch error a source swallowed to return what it has.
+
+    Labelled with the running task's name (``source`` outside the engine), like
+    the errors ``_run_task`` catches itself.
+    """
+    name = fetch_source.get() or source
+    print(f"Fetch failed for {name}: {error}", file=sys.stderr)
+    FETCH_ERRORS.inc(source=name)
+
+
+def ingest_job(job: Job) -> Job:
+    """Normalize a freshly fetched job so nothing downstream re-parses its fields.
+
+    Parses the posting timestamp and reduces the description to bounded plain
+    text. Already-normalized jobs come back unchanged.
+    """
+    if job.normalized:
+        return job
+    changes = {}
+    if job.posted_at is None and job.posted_at_iso:
+        changes["posted_at"] = parse_timestamp(job.posted_at_iso, job.source)
+    if job.description:
+        changes["description"] = normalize_description(job.description)
+    return job.replace(normalized=True, **changes)
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+class FetchEngine:
+    """Run fetch tasks on a thread pool with a global and a per-host concurrency cap.
+
+    The global cap is the pool size; the per-host cap is a semaphore per host so
+    ~80 Greenhouse boards never hold more than ``per_host`` sockets to one API.
+
+    With ``fingerprints`` (url -> body sha256 last processed), a task whose
+    responses are all byte-identical to those comes back ``unchanged`` with no jobs.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        per_host: int = 6,
+        fingerprints: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+        self.fingerprints = fingerprints
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.Semaphore(self.per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def _run_task(self, task: FetchTask) -> FetchResult:
+        payload_log = _PayloadLog(self.fingerprints)
+        token = _payload_log.set(payload_log)
+        source_token = fetch_source.set(task.name)
+        try:
+            with self._slot(task.host):
+                started = time.perf_counter()
+                try:
+                    jobs = [ingest_job(job) for job in task.fn()]
+                finally:
+                    FETCH_SECONDS.observe(time.perf_counter() - started, source=task.name)
+        except Exception as e:
+            # Sources are best-effort; one failing board must not sink the cycle
+            print(f"Fetch failed for {task.name}: {e}", file=sys.stderr)
+            FETCH_ERRORS.inc(source=task.name)
+            jobs = []
+        finally:
+            fetch_source.reset(source_token)
+            _payload_log.reset(token)
+        payloads = tuple(payload_log.payloads)
+        if payload_log.unchanged():
+            FETCH_UNCHANGED.inc(source=task.name)
+            return FetchResult(task, [], payloads, unchanged=True)
+        FETCH_JOBS.inc(len(jobs), source=task.name)
+        return FetchResult(task, jobs, payloads)
+
+    def _stream_task(self, task: FetchTask, done: "queue.Queue[FetchResult]") -> None:
+        # stream() waits for exactly one result per task, so one must be queued
+        # even if something outside _run_task's own handler raises
+        try:
+            result = self._run_task(task)
+        except Exception as e:
+            print(f"Fetch failed for {task.name}: {e}", file=sys.stderr)
+            FETCH_ERRORS.inc(source=task.name)
+            result = FetchResult(task, [])
+        done.put(result)
+
+    def fetch(self, tasks: List[FetchTask]) -> List[FetchResult]:
+        """Run all tasks concurrently and return one result per task, in task order."""
+        if not tasks:
+            return []
+        workers = min(self.max_workers, len(tasks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+            return list(pool.map(self._run_task, tasks))
+
+    def stream(self, tasks: List[FetchTask], backlog: Optional[int] = None) -> Iterator[List[FetchResult]]:
+        """Run all tasks concurrently and yield results as they complete.
+
+        Each yield is every result finished since the last one, at least one,
+        so a slow consumer gets larger batches rather than falling behind. At
+        most ``backlog`` (default: the pool size) finished results wait for the
+        consumer; beyond that, fetch threads block until it catches up.
+        """
+        if not tasks:
+            return
+        done: "queue.Queue[FetchResult]" = queue.Queue(maxsize=backlog or self.max_workers)
+        workers = min(self.max_workers, len(tasks))
+        remaining = len(tasks)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+            for task in tasks:
+                pool.submit(self._stream_task, task, done)
+            try:
+                while remaining:
+                    batch = [done.get()]
+                    while len(batch) < remaining:
+                        try:
+                            batch.append(done.get_nowait())
+                        except queue.Empty:
+                            break
+                    remaining -= len(batch)
+                    yield batch
+            finally:
+                # Consumer stopped early: unblock the fetch threads so the pool can shut down
+                while remaining:
+                    done.get()
+                    remaining -= 1
@@ -1,199 +1,407 @@
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Iterable, List, Tuple
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Tuple
 from datetime import datetime, timezone
 import calendar
-from dateutil import parser as dateparser
 
+from . import geo
 from .config import Config
+from .geo import LocationIndex, location_index
+from .matcher import KeywordMatcher, SplitMatcher
 from .models import Job
+from .pipeline import FilterStage, StagePipeline
+from .timeparse import parse_timestamp
+from .verdicts import VerdictCache, content_key
+
+
+MANAGER_TOKENS = (" manager", "manager ", " manager ", "director", "vp ", "vice president")
+SALES_TOKENS = (
+    "sales", "account executive", "account manager", "partner", "partnership",
+    "business development", "bd ", "customer success", "marketing",
+)
+PARTNER_PHRASES = ("global partner", "alliances", "channel sales")
+CONTRACT_TOKENS = ("contract", "1099", "c2c")
+PART_TIME_TOKENS = ("part-time", "part time")
+TEMP_TOKENS = ("temporary", "temp role")
+
+# Bump whenever filter semantics change, so cached verdicts are not reused
+FILTER_LOGIC_VERSION = 2
+
+_MANAGER_SET = frozenset(MANAGER_TOKENS)
+_SALES_SET = frozenset(SALES_TOKENS)
+_PARTNER_SET = frozenset(PARTNER_PHRASES)
+_CONTRACT_SET = frozenset(CONTRACT_TOKENS)
+_PART_TIME_SET = frozenset(PART_TIME_TOKENS)
+_TEMP_SET = frozenset(TEMP_TOKENS)
+_MANAGER_OR_SALES_SET = _MANAGER_SET | _SALES_SET
+
+
+@lru_cache(maxsize=32)
+def _matcher_for(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def _lowered(keywords: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(kw.lower() for kw in keywords)
+
+
+def _hits_any(found: FrozenSet[str], keywords: FrozenSet[str]) -> bool:
+    # ``keywords`` must already be lowercased
+    return not found.isdisjoint(keywords)
 
 
 def title_contains_any(text: str, keywords: List[str]) -> bool:
-    lower = text.lower()
-    return any(kw.lower() in lower for kw in keywords)
+    return bool(_matcher_for(tuple(keywords)).find(text.lower()))
 
 
 def is_austin_location(text: str, austin_aliases: List[str]) -> bool:
-    if not text:
-        return False
-    lower = text.lower()
-    return any(alias in lower for alias in austin_aliases)
+    return location_index(tuple(austin_aliases)).classify(text or "") == geo.AUSTIN
 
 
 def is_us_remote(text: str) -> bool:
-    if not text:
-        return False
-    lower = text.lower()
-    
-    # Explicit US indicators
-    us_tokens = [
-        "remote - us",
-        "us remote",
-        "remote us",
-        "united states",
-        "usa",
-        "u.s.",
-        "within the us",
-        "eligible to work in the us",
-        "us-based",
-        "us based",
-        "united states only",
-        "us only"
-    ]
-    if any(t in lower for t in us_tokens):
-        return True
-    
-    # Reject non-US locations
-    non_us_indicators = [
-        "denmark", "copenhagen", "europe", "eu", "emea", "uk", "london", "germany", "berlin",
-        "france", "paris", "netherlands", "amsterdam", "sweden", "stockholm", "norway", "oslo",
-        "canada", "toronto", "vancouver", "montreal", "australia", "sydney", "melbourne",
-        "singapore", "tokyo", "japan", "india", "bangalore", "mumbai", "delhi"
-    ]
-    if any(indicator in lower for indicator in non_us_indicators):
-        return False
-    
-    # If explicitly mentions EU/EMEA-only, reject as US remote
-    if any(t in lower for t in ["emea", "eu only", "europe only", "uk only", "canada only", "australia only"]):
-        return False
-    
-    # Fallback: mention of "remote" without country is ambiguous; allow lower-priority paths to tag it
-    return "remote" in lower
-
-
-def _is_manager_or_sales(title_lower: str, combined_lower: str) -> bool:
-    manager_tokens = [
-        " manager", "manager ", " manager ", "director", "vp ", "vice president",
-    ]
-    sales_tokens = [
-        "sales", "account executive", "account manager", "partner", "partnership",
-        "business development", "bd ", "customer success", "marketing",
-    ]
-    if any(tok in title_lower for tok in manager_tokens):
+    # Bare "remote" without a country is ambiguous; allow lower-priority paths to tag it
+    return location_index(()).classify(text or "") in (geo.US_REMOTE, geo.AMBIGUOUS)
+
+
+def _is_manager_or_sales(title_found: FrozenSet[str], combined_found: FrozenSet[str]) -> bool:
+    if _hits_any(title_found, _MANAGER_SET):
         return True
-    if any(tok in title_lower for tok in sales_tokens):
+    if _hits_any(title_found, _SALES_SET):
         return True
     # Also scan combined text lightly
-    if any(phrase in combined_lower for phrase in ["global partner", "alliances", "channel sales"]):
+    if _hits_any(combined_found, _PARTNER_SET):
         return True
     return False
 
 
-def _is_senior_level(title_lower: str, exclude_keywords: List[str]) -> bool:
-    # Only exclude when configured via exclude_keywords
-    return any(f" {kw} " in f" {title_lower} " for kw in exclude_keywords)
-
 def split_scope(job: Job, cfg: Config) -> Tuple[str, bool]:
     """Return (scope_tag, is_stretch).
 
     scope_tag is either cfg.telegram.tag_austin or cfg.telegram.tag_us_remote.
     is_stretch uses Job.is_stretch().
     """
-    location = job.location or ""
-    if is_austin_location(location, cfg.locations.austin_aliases):
+    index = filter_plan(cfg).locations
+    region = index.classify(job.location or "")
+    # Sometimes location text is in description; try it as a fallback
+    if region == geo.UNKNOWN and job.description:
+        region = index.classify_text(job.description_lower, lowered=True)
+    if region == geo.AUSTIN:
         return cfg.telegram.tag_austin, job.is_stretch()
-    if is_us_remote(location):
+    if region in (geo.US_REMOTE, geo.AMBIGUOUS):
         return cfg.telegram.tag_us_remote, job.is_stretch()
-    # Sometimes location text is in description; try it as a fallback
-    if job.description:
-        desc = job.description
-        if is_austin_location(desc, cfg.locations.austin_aliases):
-            return cfg.telegram.tag_austin, job.is_stretch()
-        if is_us_remote(desc):
-            return cfg.telegram.tag_us_remote, job.is_stretch()
     # No scope match - job doesn't fit Austin or US-remote criteria
     return "", job.is_stretch()
 
 
-def _compute_score(text: str, include_keywords: List[str], bonus_keywords: List[str]) -> int:
-    lower = text.lower()
-    score = sum(1 for kw in include_keywords if kw.lower() in lower)
-    score += sum(1 for kw in bonus_keywords if kw.lower() in lower)
-    return score
+@dataclass(frozen=True, eq=False)
+class FilterPlan:
+    """Everything apply_keyword_filters needs from a Config, normalized and compiled once.
 
+    Built by load_config (see ``filter_plan``) and shared by the poller loop and
+    the web app for as long as the config does not change. Plans compare by
+    identity, so one can key a cache.
+    """
 
-def apply_keyword_filters(jobs: Iterable[Job], cfg: Config) -> List[Job]:
-    results: List[Job] = []
-    now = datetime.now(timezone.utc)
+    # One matcher over every keyword category the filters check, for titles
+    matcher: KeywordMatcher
+    # Only the keywords the text stages read, for company names
+    text_matcher: KeywordMatcher
+    # The same keywords plus, with us_only_remote, the gazetteer's free-text
+    # phrases as whole words: one pass over each description serves both
+    description_matcher: SplitMatcher
+    # text_matcher.find on a lowercased company name, memoized; boards repeat a few hundred
+    company_matches: Callable[[str], FrozenSet[str]]
+    title_must_include_any: FrozenSet[str]
+    # Score per include/bonus keyword; duplicates in the config count twice, as before
+    score_weights: Mapping[str, int]
+    score_keywords: FrozenSet[str]
+    exclude_text_keywords: FrozenSet[str]
+    # exclude_title_keywords as whole words; None when not configured
+    senior_title: Optional[Pattern[str]]
+    company_whitelist: FrozenSet[str]
+    company_blacklist: FrozenSet[str]
+    min_score: int
+    exclude_contract: bool
+    exclude_intern: bool
+    exclude_part_time: bool
+    exclude_temp: bool
+    us_only_remote: bool
+    # Gazetteer with the configured Austin aliases
+    locations: LocationIndex
+    weekday_max_age_hours: float
+    weekend_max_age_hours: float
+    # Hash of everything the time-independent stages depend on
+    fingerprint: str
+
+    def max_age_hours(self, now: datetime) -> float:
+        return self.weekend_max_age_hours if now.weekday() in (5, 6) else self.weekday_max_age_hours
+
+
+def compile_filter_plan(cfg: Config) -> FilterPlan:
+    f = cfg.filters
     # Adaptive recency: widen on weekends
-    max_age_hours = cfg.app.max_post_age_hours
-    if getattr(cfg.app, 'adaptive_recency', False):
-        weekday = now.weekday()  # 0=Mon .. 6=Sun
-        if weekday in (5, 6):  # Sat/Sun
-            max_age_hours = getattr(cfg.app, 'weekend_max_post_age_hours', max_age_hours)
-        else:
-            max_age_hours = getattr(cfg.app, 'weekday_max_post_age_hours', max_age_hours)
-    for job in jobs:
-        text = f"{job.title} | {job.company} | {job.description or ''}"
-        
-        # Location filtering - enforce US-only if configured
-        if getattr(cfg.locations, 'us_only_remote', False):
-            location_text = f"{job.location or ''} {job.description or ''}".lower()
-            # Reject non-US locations
-            non_us_indicators = [
-                "denmark", "copenhagen", "europe", "eu", "emea", "uk", "london", "germany", "berlin",
-                "france", "paris", "netherlands", "amsterdam", "sweden", "stockholm", "norway", "oslo",
-                "canada", "toronto", "vancouver", "montreal", "australia", "sydney", "melbourne",
-                "singapore", "tokyo", "japan", "india", "bangalore", "mumbai", "delhi"
-            ]
-            if any(indicator in location_text for indicator in non_us_indicators):
-                continue
-            # Reject if explicitly mentions non-US only
-            if any(phrase in location_text for phrase in ["eu only", "europe only", "uk only", "canada only", "australia only"]):
-                continue
-        
-        # Title must include any of these tokens (strict role focus)
-        if cfg.filters.title_must_include_any:
-            title_lower = job.title.lower()
-            if not any(tok.lower() in title_lower for tok in cfg.filters.title_must_include_any):
-                continue
-        # Company allow/deny
-        if cfg.filters.company_whitelist and job.company.lower() not in cfg.filters.company_whitelist:
-            continue
-        if cfg.filters.company_blacklist and job.company.lower() in cfg.filters.company_blacklist:
-            continue
-
-        # Exclude employment types by simple heuristics
-        title_lower = job.title.lower()
-        combined_lower = text.lower()
-        if cfg.filters.exclude_intern and ("intern" in title_lower or "internship" in combined_lower):
-            continue
-        if cfg.filters.exclude_contract and any(x in combined_lower for x in ["contract", "1099", "c2c"]):
-            continue
-        if cfg.filters.exclude_part_time and any(x in combined_lower for x in ["part-time", "part time"]):
-            continue
-        if cfg.filters.exclude_temp and any(x in combined_lower for x in ["temporary", "temp role"]):
-            continue
-
-        # Exclude obvious non-engineering roles and senior/lead/staff
-        if _is_manager_or_sales(title_lower, combined_lower):
-            continue
-        if _is_senior_level(title_lower, cfg.filters.exclude_title_keywords):
-            continue
-
-        # Keyword scoring (adaptive: if no description available, allow lower threshold)
-        score = _compute_score(text, cfg.filters.include_keywords, cfg.filters.include_bonus_keywords)
-        required_min = 1 if not job.description else cfg.filters.min_score
-        if score < required_min:
-            continue
-
-        # Exclude bad text
-        if cfg.filters.exclude_text_keywords and any(kw.lower() in combined_lower for kw in cfg.filters.exclude_text_keywords):
-            continue
-        # Recency filter
-        if job.posted_at_iso:
-            try:
-                dt = dateparser.parse(job.posted_at_iso)
-                if not dt.tzinfo:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                age_hours = (now - dt).total_seconds() / 3600.0
-                if age_hours > max_age_hours:
-                    continue
-            except Exception:
-                pass
-        results.append(job)
-    return results
+    max_age = cfg.app.max_post_age_hours
+    weekday_max = weekend_max = max_age
+    if cfg.app.adaptive_recency:
+        weekday_max = cfg.app.weekday_max_post_age_hours
+        weekend_max = cfg.app.weekend_max_post_age_hours
+    senior_words = sorted({kw.lower() for kw in f.exclude_title_keywords if kw}, key=len, reverse=True)
+    senior_title = None
+    if senior_words:
+        senior_title = re.compile(r"(?<!\w)(?:" + "|".join(re.escape(w) for w in senior_words) + r")(?!\w)")
+    text_keywords = (
+        tuple(f.include_keywords)
+        + tuple(f.include_bonus_keywords)
+        + tuple(f.exclude_text_keywords)
+        + PARTNER_PHRASES
+        + CONTRACT_TOKENS
+        + PART_TIME_TOKENS
+        + TEMP_TOKENS
+        + ("internship",)
+    )
+    text_matcher = KeywordMatcher(text_keywords)
+    locations = location_index(tuple(cfg.locations.austin_aliases))
+    score_weights = Counter(kw.lower() for kw in list(f.include_keywords) + list(f.include_bonus_keywords) if kw)
+    return FilterPlan(
+        matcher=KeywordMatcher(
+            text_keywords + tuple(f.title_must_include_any) + MANAGER_TOKENS + SALES_TOKENS + ("intern",)
+        ),
+        text_matcher=text_matcher,
+        description_matcher=SplitMatcher(text_keywords, locations.text_phrases if cfg.locations.us_only_remote else ()),
+        company_matches=lru_cache(maxsize=4096)(text_matcher.find),
+        title_must_include_any=_lowered(f.title_must_include_any),
+        score_weights=dict(score_weights),
+        score_keywords=frozenset(score_weights),
+        exclude_text_keywords=_lowered(f.exclude_text_keywords),
+        senior_title=senior_title,
+        company_whitelist=_lowered(f.company_whitelist),
+        company_blacklist=_lowered(f.company_blacklist),
+        min_score=f.min_score,
+        exclude_contract=f.exclude_contract,
+        exclude_intern=f.exclude_intern,
+        exclude_part_time=f.exclude_part_time,
+        exclude_temp=f.exclude_temp,
+        us_only_remote=cfg.locations.us_only_remote,
+        locations=locations,
+        weekday_max_age_hours=float(weekday_max),
+        weekend_max_age_hours=float(weekend_max),
+        fingerprint=hashlib.sha256(
+            repr((FILTER_LOGIC_VERSION, f, cfg.locations)).encode("utf-8")
+        ).hexdigest(),
+    )
+
+
+def filter_plan(cfg: Config) -> FilterPlan:
+    """The plan load_config compiled, or a freshly compiled one for hand-built configs."""
+    if cfg.plan is None:
+        cfg.plan = compile_filter_plan(cfg)
+    return cfg.plan
+
+
+@dataclass(frozen=True)
+class _JobMatches:
+    # title | company | description
+    combined: FrozenSet[str]
+    # Gazetteer phrases in the description; empty unless us_only_remote
+    places: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class _RunContext:
+    now: datetime
+    max_age_hours: float
+    is_new: Optional[Callable[[Job], bool]]
+
+
+class _JobView:
+    """A job plus what the stages computed about it so far."""
+
+    __slots__ = ("job", "run", "title_lower", "title_found", "matches", "score", "verdict_key", "_description_lower")
+
+    def __init__(self, job: Job, run: _RunContext, matcher: KeywordMatcher) -> None:
+        self.job = job
+        self.run = run
+        self.title_lower = job.title.lower()
+        self.title_found = matcher.find(self.title_lower)
+        self.matches: Optional[_JobMatches] = None
+        self.score = 0
+        self.verdict_key: Optional[str] = None
+        self._description_lower: Optional[str] = None
+
+    @property
+    def description_lower(self) -> str:
+        # Decompressed and lowered at most once per evaluation
+        if self._description_lower is None:
+            self._description_lower = self.job.description_lower or ""
+        return self._description_lower
+
 
+class _VerdictMemo:
+    """Adapts a VerdictCache to the pipeline, keyed by job content and plan."""
 
+    def __init__(self, cache: VerdictCache, plan: FilterPlan) -> None:
+        self.cache = cache
+        self.fingerprint = plan.fingerprint
+
+    def lookup(self, view: _JobView) -> Optional[bool]:
+        view.verdict_key = content_key(view.job, self.fingerprint)
+        verdict = self.cache.get(view.verdict_key)
+        if verdict is None:
+            return None
+        view.score = verdict.score
+        return verdict.passed
+
+    def store(self, view: _JobView, passed: bool) -> None:
+        self.cache.put(view.verdict_key, passed, view.score)
+
+
+def _scan_text(view: _JobView, plan: FilterPlan) -> bool:
+    # Text stages only test text_matcher keywords, which the title scan covers too
+    company = plan.company_matches(view.job.company.lower())
+    description, places = plan.description_matcher.find(view.description_lower)
+    view.matches = _JobMatches(combined=view.title_found | company | description, places=places)
+    return True
+
+
+def _is_recent(view: _JobView) -> bool:
+    job = view.job
+    # Jobs from the fetch engine arrive parsed; others are parsed (memoized) here
+    posted_at = job.posted_at or parse_timestamp(job.posted_at_iso, job.source)
+    if posted_at is None:
+        return True
+    age_hours = (view.run.now - posted_at).total_seconds() / 3600.0
+    return age_hours <= view.run.max_age_hours
+
+
+def _has_score(view: _JobView, plan: FilterPlan) -> bool:
+    # Keyword scoring (adaptive: if no description available, allow lower threshold)
+    view.score = _compute_score(view.matches.combined, plan.score_weights, plan.score_keywords)
+    # packed_description is as truthy as the text and never decompresses it
+    required_min = 1 if not view.job.packed_description else plan.min_score
+    return view.score >= required_min
+
+
+# Stage tiers: stages are reordered only within a tier
+TIER_TITLE = 0  # title/company/posting date only
+TIER_DEDUP = 1  # seen-store lookup, before any description work
+TIER_SCAN = 2  # the one pass over company/location/description
+TIER_TEXT = 3  # checks reading the scan result
+
+
+def build_filter_pipeline(plan: FilterPlan, adaptive: bool = True) -> StagePipeline[_JobView]:
+    """The filters as discrete stages; keep one per process to let its ordering learn."""
+    stages: List[FilterStage[_JobView]] = []
+
+    def add(name: str, tier: int, keep: Callable[[_JobView], bool], stable: bool = True) -> None:
+        stages.append(FilterStage(name, tier, keep, stable))
+
+    # Title must include any of these tokens (strict role focus)
+    if plan.title_must_include_any:
+        add("title_must_include_any", TIER_TITLE, lambda v: not v.title_found.isdisjoint(plan.title_must_include_any))
+    # Company allow/deny
+    if plan.company_whitelist:
+        add("company_whitelist", TIER_TITLE, lambda v: v.job.company.lower() in plan.company_whitelist)
+    if plan.company_blacklist:
+        add("company_blacklist", TIER_TITLE, lambda v: v.job.company.lower() not in plan.company_blacklist)
+    if plan.exclude_intern:
+        add("intern_title", TIER_TITLE, lambda v: "intern" not in v.title_found)
+    # Exclude obvious non-engineering roles
+    add("manager_or_sales_title", TIER_TITLE, lambda v: v.title_found.isdisjoint(_MANAGER_OR_SALES_SET))
+    # Exclude senior/lead/staff when configured via exclude_title_keywords
+    if plan.senior_title is not None:
+        add("senior_title", TIER_TITLE, lambda v: plan.senior_title.search(v.title_lower) is None)
+    # Location filtering - enforce US-only if configured; one memoized lookup per distinct location
+    if plan.us_only_remote:
+        add("us_only_location", TIER_TITLE, lambda v: plan.locations.classify(v.job.location or "") != geo.NON_US)
+    add("recency", TIER_TITLE, _is_recent, stable=False)
+
+    add("seen", TIER_DEDUP, lambda v: v.run.is_new is None or v.run.is_new(v.job), stable=False)
+
+    add("scan_text", TIER_SCAN, lambda v: _scan_text(v, plan))
+
+    # A non-US description counts only when the location is not clearly US
+    if plan.us_only_remote:
+        add("us_only_description", TIER_TEXT, lambda v: not plan.locations.is_non_us(v.job.location, phrases=v.matches.places))
+    # Exclude employment types by simple heuristics
+    if plan.exclude_intern:
+        add("internship_text", TIER_TEXT, lambda v: "internship" not in v.matches.combined)
+    if plan.exclude_contract:
+        add("contract_text", TIER_TEXT, lambda v: v.matches.combined.isdisjoint(_CONTRACT_SET))
+    if plan.exclude_part_time:
+        add("part_time_text", TIER_TEXT, lambda v: v.matches.combined.isdisjoint(_PART_TIME_SET))
+    if plan.exclude_temp:
+        add("temp_text", TIER_TEXT, lambda v: v.matches.combined.isdisjoint(_TEMP_SET))
+    add("partner_text", TIER_TEXT, lambda v: v.matches.combined.isdisjoint(_PARTNER_SET))
+    add("score", TIER_TEXT, lambda v: _has_score(v, plan))
+    # Exclude bad text
+    if plan.exclude_text_keywords:
+        add("exclude_text", TIER_TEXT, lambda v: v.matches.combined.isdisjoint(plan.exclude_text_keywords))
+    # Verdicts are looked up (and their key hashed) only for jobs still new after the title checks
+    return StagePipeline(stages, adaptive=adaptive, memo_after=TIER_DEDUP)
+
+
+@lru_cache(maxsize=8)
+def _shared_pipeline(plan: FilterPlan) -> StagePipeline[_JobView]:
+    # For callers without a pipeline of their own. Fixed order: an adaptive one
+    # re-sorts its stage list after each run, which is unsafe across threads.
+    return build_filter_pipeline(plan, adaptive=False)
+
+
+def passes_title_filters(job: Job, cfg: Config) -> bool:
+    """Checks that need only the listing (title, company, location), cheap enough to run before fetching details."""
+    plan = filter_plan(cfg)
+    title_lower = job.title.lower()
+    title_found = plan.matcher.find(title_lower)
+    if plan.title_must_include_any and not _hits_any(title_found, plan.title_must_include_any):
+        return False
+    company = job.company.lower()
+    if plan.company_whitelist and company not in plan.company_whitelist:
+        return False
+    if plan.company_blacklist and company in plan.company_blacklist:
+        return False
+    if plan.exclude_intern and "intern" in title_found:
+        return False
+    if _is_manager_or_sales(title_found, frozenset()):
+        return False
+    if plan.senior_title is not None and plan.senior_title.search(title_lower):
+        return False
+    # Board listings carry the location, so a posting the location stage drops is never hydrated
+    if plan.us_only_remote and plan.locations.is_non_us(job.location):
+        return False
+    return True
+
+
+def _compute_score(found: FrozenSet[str], weights: Mapping[str, int], keywords: FrozenSet[str]) -> int:
+    # ``keywords`` is the key set of ``weights``; intersecting first keeps this a set operation
+    return sum(weights[kw] for kw in found & keywords)
+
+
+def apply_keyword_filters(
+    jobs: Iterable[Job],
+    cfg: Config,
+    pipeline: Optional[StagePipeline[_JobView]] = None,
+    is_new: Optional[Callable[[Job], bool]] = None,
+    verdicts: Optional[VerdictCache] = None,
+) -> List[Job]:
+    """Return the jobs that pass every filter stage.
+
+    Pass a long-lived ``pipeline`` (from build_filter_pipeline) to keep per-stage
+    counters and let the stage order adapt across calls. With ``is_new`` the
+    seen-store check runs as a stage, ahead of any description scanning, and
+    only unseen jobs are returned. With ``verdicts``, a job that passes the
+    title, recency and seen checks and whose content was judged before under
+    the same plan skips the description stages.
+    """
+    plan = filter_plan(cfg)
+    if pipeline is None:
+        pipeline = _shared_pipeline(plan)
+    now = datetime.now(timezone.utc)
+    run = _RunContext(now=now, max_age_hours=plan.max_age_hours(now), is_new=is_new)
+    views = (_JobView(job, run, plan.matcher) for job in jobs)
+    memo = _VerdictMemo(verdicts, plan) if verdicts is not None else None
+    return [view.job for view in pipeline.run(views, memo)]
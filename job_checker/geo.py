@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .matcher import KeywordMatcher
+
+# Location classes, in precedence order
+AUSTIN = "austin"
+US_REMOTE = "us_remote"
+NON_US = "non_us"
+# Remote with no country named; open to US candidates as far as we can tell
+AMBIGUOUS = "ambiguous"
+UNKNOWN = ""
+
+DEFAULT_AUSTIN_ALIASES = ("austin", "round rock", "cedar park", "pflugerville", "leander")
+
+US_PHRASES = (
+    "united states", "united states of america", "usa", "u.s.a", "u.s.a.", "u.s.",
+    "us only", "us-only", "us based", "us-based", "us remote", "remote us", "remote - us",
+    "within the us", "in the us", "eligible to work in the us", "us citizens", "us time zones",
+)
+# Too common as ordinary words to trust outside a location field ("join us")
+US_LOCATION_ONLY = ("us", "u.s")
+
+NON_US_REGIONS = (
+    "eu", "europe", "european union", "emea", "uk", "apac", "latam", "asia", "africa",
+    "eu only", "europe only", "uk only", "canada only", "australia only",
+    "united kingdom", "england", "scotland", "wales", "northern ireland",
+)
+NON_US_COUNTRIES = (
+    "denmark", "sweden", "norway", "finland", "germany", "france", "spain", "italy",
+    "netherlands", "belgium", "switzerland", "austria", "poland", "czech", "czech republic",
+    "hungary", "romania", "bulgaria", "croatia", "slovenia", "slovakia", "estonia", "latvia",
+    "lithuania", "ireland", "portugal", "greece", "cyprus", "malta", "luxembourg", "ukraine",
+    "canada", "australia", "new zealand", "singapore", "japan", "india", "china", "israel",
+    "philippines", "brazil", "argentina", "colombia", "south africa", "nigeria",
+)
+NON_US_CITIES = (
+    "london", "berlin", "paris", "madrid", "rome", "amsterdam", "brussels", "zurich", "vienna",
+    "warsaw", "prague", "budapest", "bucharest", "sofia", "zagreb", "ljubljana", "bratislava",
+    "tallinn", "riga", "vilnius", "dublin", "lisbon", "athens", "nicosia", "valletta",
+    "copenhagen", "stockholm", "oslo", "helsinki", "reykjavik", "moscow", "kyiv", "minsk",
+    "toronto", "vancouver", "montreal", "ottawa", "calgary", "sydney", "melbourne", "tokyo",
+    "bangalore", "bengaluru", "mumbai", "delhi", "hyderabad", "pune",
+)
+REMOTE_PHRASES = ("remote",)
+REMOTE_LOCATION_ONLY = ("anywhere", "worldwide", "north america", "americas")
+
+# Marker kinds; the *_LOC kinds only count when classifying a location field
+_AUSTIN = "austin"
+_US = "us"
+_US_LOC = "us_loc"
+_NON_US = "non_us"
+_REMOTE = "remote"
+_REMOTE_LOC = "remote_loc"
+
+
+def _resolve(kinds: FrozenSet[str], location: bool) -> str:
+    if _AUSTIN in kinds:
+        return AUSTIN
+    if _US in kinds or (location and _US_LOC in kinds):
+        return US_REMOTE
+    if _NON_US in kinds:
+        return NON_US
+    if _REMOTE in kinds or (location and _REMOTE_LOC in kinds):
+        return AMBIGUOUS
+    return UNKNOWN
+
+
+class LocationIndex:
+    """Gazetteer of Austin-metro, US, non-US and remote markers, matched as whole words.
+
+    ``classify`` handles location fields and is memoized per distinct string
+    (boards repeat a few hundred of them); ``classify_text`` handles free text
+    such as descriptions, where bare "us" and "anywhere" are not evidence.
+    An explicit US marker outranks non-US ones, so "Remote - US or Canada" is US.
+    """
+
+    def __init__(self, austin_aliases: Iterable[str] = DEFAULT_AUSTIN_ALIASES, memo_size: int = 4096) -> None:
+        kinds: Dict[str, str] = {}
+        for phrases, kind in (
+            (REMOTE_LOCATION_ONLY, _REMOTE_LOC),
+            (REMOTE_PHRASES, _REMOTE),
+            (NON_US_REGIONS + NON_US_COUNTRIES + NON_US_CITIES, _NON_US),
+            (US_LOCATION_ONLY, _US_LOC),
+            (US_PHRASES, _US),
+            (tuple(a.lower() for a in austin_aliases if a), _AUSTIN),
+        ):
+            for phrase in phrases:
+                kinds[phrase] = kind
+        self._kinds = kinds
+        self._matcher = KeywordMatcher(kinds, whole_words=True)
+        # Free text skips the location-only phrases; "us" alone is most of a description's hits
+        self.text_phrases: FrozenSet[str] = frozenset(
+            phrase for phrase, kind in kinds.items() if kind not in (_US_LOC, _REMOTE_LOC)
+        )
+        self._text_matcher = KeywordMatcher(self.text_phrases, whole_words=True)
+        self.classify = lru_cache(maxsize=memo_size)(self._classify_location)
+
+    def _markers(self, text_lower: str) -> FrozenSet[str]:
+        kinds = self._kinds
+        return frozenset(kinds[phrase] for phrase in self._matcher.find(text_lower))
+
+    def _classify_location(self, location: str) -> str:
+        if not location:
+            return UNKNOWN
+        return _resolve(self._markers(location.lower()), location=True)
+
+    def classify_text(self, text: Optional[str], lowered: bool = False) -> str:
+        if not text:
+            return UNKNOWN
+        return self.classify_phrases(self._text_matcher.find(text if lowered else text.lower()))
+
+    def classify_phrases(self, phrases: Iterable[str]) -> str:
+        """classify_text for the ``text_phrases`` a caller already found as whole words."""
+        kinds = self._kinds
+        return _resolve(frozenset(kinds[phrase] for phrase in phrases), location=False)
+
+    def is_non_us(
+        self,
+        location: str,
+        description: Optional[str] = None,
+        lowered: bool = False,
+        phrases: Optional[FrozenSet[str]] = None,
+    ) -> bool:
+        """The location is non-US, or the description is and the location is not clearly US.
+
+        Pass ``phrases`` instead of ``description`` when the description was
+        already scanned for ``text_phrases``.
+        """
+        region = self.classify(location or "")
+        if region == NON_US:
+            return True
+        if region in (AUSTIN, US_REMOTE):
+            return False
+        if phrases is not None:
+            return self.classify_phrases(phrases) == NON_US
+        if not description:
+            return False
+        return self.classify_text(description, lowered) == NON_US
+
+
+@lru_cache(maxsize=16)
+def location_index(austin_aliases: Tuple[str, ...] = DEFAULT_AUSTIN_ALIASES) -> LocationIndex:
+    """Shared index per alias list, so every caller reuses one memo."""
+    return LocationIndex(austin_aliases)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import requests
+
+from .fetching import ingest_job, note_payload
+from .models import Job
+from .storage import connect
+from .transport import get_session
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    status: int
+    body: bytes
+    not_modified: bool
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(self.body).hexdigest()
+
+
+class HttpCache:
+    """Conditional GET cache keyed by full request URL.
+
+    ETag/Last-Modified validators and the last 200 body are persisted next to the
+    seen table, so a 304 can be served from disk even right after a restart.
+    Parsed jobs are memoized in memory per URL (with the digest of the body they
+    came from) and reused whenever the response body is byte-identical.
+
+    Like SeenStore, it holds one connection for its lifetime, shared by the
+    fetch threads under a lock.
+    """
+
+    def __init__(self, db_path: str = "job_checker.db") -> None:
+        self.db_path = db_path
+        self._parsed: Dict[str, Tuple[str, List[Job]]] = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._conn = connect(db_path, check_same_thread=False)
+        self._ensure()
+
+    def _ensure(self) -> None:
+        with self._db_lock, self._conn as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+
+    def close(self) -> None:
+        with self._db_lock:
+            self._conn.close()
+
+    @staticmethod
+    def cache_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        return requests.Request("GET", url, params=params).prepare().url or url
+
+    def _load(self, key: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[bytes]]]:
+        with self._db_lock:
+            return self._conn.execute(
+                "SELECT etag, last_modified, body FROM http_cache WHERE url = ?", (key,)
+            ).fetchone()
+
+    def _store(self, key: str, etag: Optional[str], last_modified: Optional[str], body: bytes) -> None:
+        with self._db_lock, self._conn as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                (key, etag, last_modified, body),
+            )
+
+    def fetch(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 20,
+    ) -> CachedResponse:
+        key = self.cache_key(url, params)
+        cached = self._load(key)
+        req_headers = dict(headers or {})
+        if cached and cached[2] is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                req_headers["If-None-Match"] = etag
+            if last_modified:
+                req_headers["If-Modified-Since"] = last_modified
+
+        resp = get_session().get(url, params=params, headers=req_headers, timeout=timeout)
+        if resp.status_code == 304 and cached and cached[2] is not None:
+            return CachedResponse(key, 304, cached[2], True)
+        resp.raise_for_status()
+
+        body = resp.content
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._store(key, etag, last_modified, body)
+        return CachedResponse(key, resp.status_code, body, False)
+
+    def get_jobs(
+        self,
+        url: str,
+        parse: Callable[[bytes], List[Job]],
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 20,
+    ) -> List[Job]:
+        """Fetch ``url`` and parse it, reusing the last parse when the body has not changed."""
+        resp = self.fetch(url, params=params, headers=headers, timeout=timeout)
+        digest = resp.digest
+        note_payload(resp.url, digest)
+        with self._lock:
+            memo = self._parsed.get(resp.url)
+        if memo is not None and memo[0] == digest:
+            return memo[1]
+        # Normalized here so the memo holds jobs that need no per-cycle work
+        jobs = [ingest_job(job) for job in parse(resp.body)]
+        with self._lock:
+            self._parsed[resp.url] = (digest, jobs)
+        return jobs
+
+
+_default_cache: Optional[HttpCache] = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> HttpCache:
+    """Process-wide cache shared by all sources so parsed boards survive loop cycles."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
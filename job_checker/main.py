@@ -1,74 +1,494 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import os
 import sys
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
 
-from .config import load_config, Config
-from .filtering import apply_keyword_filters, split_scope
+from .archive import SCOPE_AUSTIN, SCOPE_US_REMOTE, JobArchive
+from .config import DEFAULT_PROFILE, config_fingerprint, load_config, load_profiles, Config
+from .dedup import DuplicateIndex
+from .fetching import FetchEngine, FetchResult, FetchTask, host_of
+from .filtering import apply_keyword_filters, build_filter_pipeline, filter_plan, passes_title_filters, split_scope
+from .metrics import REGISTRY, Family, serve as serve_metrics
 from .models import Job
-from .notifiers import TelegramNotifier
-from .storage import SeenStore
-from .sources.remotive import fetch_remotive
-from .sources.greenhouse import fetch_greenhouse
-from .sources.jobspikr import fetch_jobspikr
-from .sources.jobdataapi import fetch_jobdataapi
-from .sources.lever import fetch_lever
-from .sources.wwr import fetch_wwr
+from .notifiers import EmailNotifier, FanOut, Notifier, TelegramNotifier, WebhookNotifier
+from .outbox import Outbox, OutboxMessage, OutboxWorker
+from .pipeline import StagePipeline
+from .retention import RetentionPolicy, RetentionWorker
+from .scheduler import AdaptiveScheduler
+from .storage import PayloadFingerprints, SeenStore
+from .transport import configure_session
+from .verdicts import VerdictCache
+from .sources.remotive import REMOTIVE_API, fetch_remotive
+from .sources.greenhouse import GREENHOUSE_BOARD_API, fetch_greenhouse_board
+from .sources.jobspikr import JOBSPIKR_ENDPOINT, fetch_jobspikr
+from .sources.jobdataapi import JOBDATAAPI_ENDPOINT, fetch_jobdataapi
+from .sources.lever import LEVER_ENDPOINT, fetch_lever_company
+from .sources.wwr import WWR_CATEGORY_FEEDS, fetch_wwr_category
 
 
-def gather_jobs(cfg: Config) -> List[Job]:
-    jobs: List[Job] = []
+CYCLE_SECONDS = REGISTRY.histogram(
+    "job_checker_cycle_seconds", "Duration of one fetch/filter/queue cycle",
+    buckets=(1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+CYCLE_ERRORS = REGISTRY.counter("job_checker_cycle_errors_total", "Cycles that ended in an error")
+LAST_CYCLE = REGISTRY.gauge("job_checker_last_cycle_seconds", "Duration of the latest cycle")
+LAST_SUCCESS = REGISTRY.gauge("job_checker_last_success_timestamp_seconds", "Unix time the latest successful cycle ended")
+INTERVAL = REGISTRY.gauge("job_checker_interval_seconds", "Configured time between cycles")
+QUEUED_JOBS = REGISTRY.counter("job_checker_new_jobs_total", "New matching jobs marked seen, per profile", ("profile",))
+DUPLICATE_JOBS = REGISTRY.counter(
+    "job_checker_duplicate_jobs_total", "New matches dropped as copies of another posting, per profile", ("profile",)
+)
+
+
+def _greenhouse_hydrate(
+    cfg: Config,
+    store: Optional[SeenStore],
+    profiles: Sequence[Config] = (),
+) -> Optional[Callable[[Job], bool]]:
+    if not cfg.sources.greenhouse.extras.get("delta", True):
+        return None
+    profiles = profiles or [cfg]
+
+    def should_hydrate(job: Job) -> bool:
+        # Worth the detail fetch if any profile could still want the job
+        return any(
+            passes_title_filters(job, profile) and (store is None or store.is_new(job, profile.profile))
+            for profile in profiles
+        )
+
+    return should_hydrate
+
+
+def build_fetch_tasks(
+    cfg: Config,
+    store: Optional[SeenStore] = None,
+    profiles: Sequence[Config] = (),
+) -> List[FetchTask]:
+    """Tasks for every enabled source in ``cfg``; ``profiles`` are the configs the results are judged by."""
+    tasks: List[FetchTask] = []
+    keywords = cfg.filters.include_keywords
     # Remotive
     if cfg.sources.remotive.enabled:
-        jobs.extend(fetch_remotive(cfg.filters.include_keywords))
-    # Greenhouse
+        tasks.append(FetchTask("remotive", host_of(REMOTIVE_API), partial(fetch_remotive, keywords)))
+    # Greenhouse: one task per board so boards fetch concurrently
     if cfg.sources.greenhouse.enabled:
         board_tokens = cfg.sources.greenhouse.extras.get("board_tokens", [])
-        jobs.extend(list(fetch_greenhouse(board_tokens)))
+        host = host_of(GREENHOUSE_BOARD_API)
+        hydrate = _greenhouse_hydrate(cfg, store, profiles)
+        for token in board_tokens:
+            tasks.append(FetchTask(f"greenhouse:{token}", host, partial(fetch_greenhouse_board, token, hydrate)))
     # Lever
     if cfg.sources.lever.enabled:
         companies = cfg.sources.lever.extras.get("companies", [])
-        jobs.extend(list(fetch_lever(companies)))
+        host = host_of(LEVER_ENDPOINT)
+        for company in companies:
+            tasks.append(FetchTask(f"lever:{company}", host, partial(fetch_lever_company, company)))
     # We Work Remotely (RSS)
-    if getattr(cfg.sources, 'wwr', None) and cfg.sources.wwr.enabled:
-        cats = cfg.sources.wwr.extras.get("categories", ["devops-sysadmin"])  # type: ignore[attr-defined]
-        jobs.extend(list(fetch_wwr(cats)))
+    if cfg.sources.wwr.enabled:
+        cats = cfg.sources.wwr.extras.get("categories", ["devops-sysadmin"])
+        for cat in cats:
+            feed_url = WWR_CATEGORY_FEEDS.get(cat, "")
+            tasks.append(FetchTask(f"wwr:{cat}", host_of(feed_url), partial(fetch_wwr_category, cat)))
     # JobsPikr (optional)
     if cfg.sources.jobspikr.enabled:
         loc_q = cfg.sources.jobspikr.extras.get("location_query", "Austin, TX OR Remote US")
-        jobs.extend(list(fetch_jobspikr(cfg.filters.include_keywords, loc_q)))
+        tasks.append(FetchTask("jobspikr", host_of(JOBSPIKR_ENDPOINT), partial(fetch_jobspikr, keywords, loc_q)))
     # Jobdataapi (optional)
     if cfg.sources.jobdataapi.enabled:
         loc_q = cfg.sources.jobdataapi.extras.get("location_query", "Austin, TX OR Remote US")
-        jobs.extend(list(fetch_jobdataapi(cfg.filters.include_keywords, loc_q)))
+        tasks.append(FetchTask("jobdataapi", host_of(JOBDATAAPI_ENDPOINT), partial(fetch_jobdataapi, keywords, loc_q)))
+    return tasks
+
+
+def fetch_results(
+    cfg: Config,
+    store: Optional[SeenStore] = None,
+    scheduler: Optional[AdaptiveScheduler] = None,
+    fingerprints: Optional[Mapping[str, str]] = None,
+    profiles: Sequence[Config] = (),
+) -> List[FetchResult]:
+    """Fetch every enabled source and return per-task results.
+
+    ``store`` lets Greenhouse skip detail fetches for jobs every profile has
+    seen, a ``scheduler`` restricts the fetch to tasks that are due, and
+    ``fingerprints`` makes tasks with byte-identical payloads come back empty
+    and ``unchanged``.
+    """
+    configure_session(cfg.app.per_host_concurrency)
+    engine = FetchEngine(cfg.app.max_concurrency, cfg.app.per_host_concurrency, fingerprints)
+    tasks = build_fetch_tasks(cfg, store, profiles)
+    if scheduler is not None:
+        tasks = scheduler.due(tasks)
+    results = engine.fetch(tasks)
+    if scheduler is not None:
+        for result in results:
+            scheduler.record(result.task.name, result.jobs)
+    return results
+
+
+def stream_results(
+    cfg: Config,
+    store: Optional[SeenStore] = None,
+    scheduler: Optional[AdaptiveScheduler] = None,
+    fingerprints: Optional[Mapping[str, str]] = None,
+    profiles: Sequence[Config] = (),
+) -> Iterator[List[FetchResult]]:
+    """Like fetch_results, but yields batches of results as their tasks finish."""
+    configure_session(cfg.app.per_host_concurrency)
+    engine = FetchEngine(cfg.app.max_concurrency, cfg.app.per_host_concurrency, fingerprints)
+    tasks = build_fetch_tasks(cfg, store, profiles)
+    if scheduler is not None:
+        tasks = scheduler.due(tasks)
+    for batch in engine.stream(tasks):
+        if scheduler is not None:
+            for result in batch:
+                scheduler.record(result.task.name, result.jobs)
+        yield batch
+
+
+def gather_jobs(
+    cfg: Config,
+    store: Optional[SeenStore] = None,
+    scheduler: Optional[AdaptiveScheduler] = None,
+    profiles: Sequence[Config] = (),
+) -> List[Job]:
+    jobs: List[Job] = []
+    for result in fetch_results(cfg, store, scheduler, profiles=profiles):
+        jobs.extend(result.jobs)
     return jobs
 
 
-def run_once(cfg: Config) -> None:
+def make_verdict_cache(cfg: Config) -> Optional[VerdictCache]:
+    if cfg.app.verdict_cache_size <= 0:
+        return None
+    return VerdictCache(
+        cfg.app.verdict_cache_size,
+        cfg.app.verdict_ttl_hours * 3600.0,
+        "job_checker.db" if cfg.app.persist_verdicts else None,
+    )
+
+
+def make_notifiers(cfg: Config) -> List[Notifier]:
+    """Every configured channel; a channel missing its settings is skipped with a warning."""
     load_dotenv()
-    bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
-    core_chat_id = os.getenv("TELEGRAM_CORE_CHAT_ID")
-    stretch_chat_id = os.getenv("TELEGRAM_STRETCH_CHAT_ID")
-    if not bot_token or not core_chat_id or not stretch_chat_id:
-        print("Missing Telegram env: TELEGRAM_BOT_TOKEN/CORE_CHAT_ID/STRETCH_CHAT_ID", file=sys.stderr)
+    notifiers: List[Notifier] = []
+    if cfg.notifiers.telegram:
+        bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        core_chat_id = os.getenv(cfg.telegram.core_chat_id_env)
+        stretch_chat_id = os.getenv(cfg.telegram.stretch_chat_id_env)
+        if not bot_token or not core_chat_id or not stretch_chat_id:
+            print(
+                f"Missing Telegram env: TELEGRAM_BOT_TOKEN/{cfg.telegram.core_chat_id_env}"
+                f"/{cfg.telegram.stretch_chat_id_env}",
+                file=sys.stderr,
+            )
+        else:
+            notifiers.append(TelegramNotifier(
+                bot_token,
+                core_chat_id,
+                stretch_chat_id,
+                digest=cfg.telegram.digest,
+                per_chat_per_minute=cfg.telegram.per_chat_per_minute,
+                per_chat_burst=cfg.telegram.per_chat_burst,
+            ))
+    webhook = cfg.notifiers.webhook
+    if webhook.enabled:
+        if not webhook.url:
+            print("Webhook notifier enabled without a url", file=sys.stderr)
+        else:
+            headers = dict(webhook.headers)
+            token = os.getenv("WEBHOOK_TOKEN")
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
+            notifiers.append(WebhookNotifier(webhook.url, headers, timeout=webhook.timeout_seconds))
+    email = cfg.notifiers.email
+    if email.enabled:
+        if not email.sender or not email.recipients:
+            print("Email notifier enabled without sender/recipients", file=sys.stderr)
+        else:
+            notifiers.append(EmailNotifier(
+                email.host,
+                email.port,
+                email.sender,
+                email.recipients,
+                username=os.getenv("SMTP_USERNAME"),
+                password=os.getenv("SMTP_PASSWORD"),
+                starttls=email.starttls,
+                use_ssl=email.use_ssl,
+                timeout=email.timeout_seconds,
+            ))
+    if cfg.profile:
+        # Outbox channels are per profile, so each profile's messages go through its own notifiers
+        for notifier in notifiers:
+            notifier.name = f"{notifier.name}:{cfg.profile}"
+    return notifiers
+
+
+def make_outbox_workers(cfg: Config, outbox: Outbox, notifiers: List[Notifier]) -> List[OutboxWorker]:
+    """One worker per channel, so a slow or failing channel never delays another."""
+    return [
+        OutboxWorker(outbox, {n.name: n.deliver}, max_attempts=cfg.app.outbox_max_attempts, channel=n.name)
+        for n in notifiers
+    ]
+
+
+def _drain(cfg: Config, outbox: Outbox, notifiers: List[Notifier]) -> None:
+    workers = make_outbox_workers(cfg, outbox, notifiers)
+    if workers:
+        with ThreadPoolExecutor(max_workers=len(workers), thread_name_prefix="drain") as pool:
+            list(pool.map(lambda worker: worker.drain(), workers))
+
+
+def make_seen_store(cfg: Config) -> SeenStore:
+    return SeenStore(
+        bloom_capacity=cfg.app.seen_bloom_capacity,
+        bloom_error_rate=cfg.app.seen_bloom_error_rate,
+    )
+
+
+def make_job_archive(cfg: Config) -> Optional[JobArchive]:
+    return JobArchive() if cfg.app.archive_jobs else None
+
+
+def archive_scope(cfg: Config) -> Callable[[Job], Tuple[str, bool]]:
+    """split_scope with the archive's scope labels instead of Telegram tags."""
+    labels = {cfg.telegram.tag_austin: SCOPE_AUSTIN, cfg.telegram.tag_us_remote: SCOPE_US_REMOTE}
+
+    def scope_of(job: Job) -> Tuple[str, bool]:
+        tag, is_stretch = split_scope(job, cfg)
+        return labels.get(tag, ""), is_stretch
+
+    return scope_of
+
+
+def _archive(cfg: Config, archive: Optional[JobArchive], jobs: List[Job], accepted: List[Job]) -> None:
+    if archive is None:
+        return
+    scope_of = archive_scope(cfg)
+    archive.record(accepted, True, scope_of)
+    if cfg.app.archive_rejected:
+        passed = {id(job) for job in accepted}
+        archive.record((job for job in jobs if id(job) not in passed), False, scope_of)
+
+
+def make_retention_worker(cfg: Config) -> RetentionWorker:
+    policy = RetentionPolicy(cfg.app.seen_retention_days, dict(cfg.app.seen_retention_days_by_source))
+    return RetentionWorker(
+        policy,
+        interval_seconds=cfg.app.retention_interval_minutes * 60.0,
+        vacuum_interval_seconds=cfg.app.vacuum_interval_hours * 3600.0,
+        duplicate_days=cfg.app.duplicate_window_days if cfg.app.collapse_duplicates else 0,
+    )
+
+
+def _duplicate_index(cfg: Config) -> Optional[DuplicateIndex]:
+    if not cfg.app.collapse_duplicates:
+        return None
+    return DuplicateIndex(
+        threshold=cfg.app.duplicate_threshold,
+        namespace=cfg.profile,
+        window_days=cfg.app.duplicate_window_days,
+    )
+
+
+@dataclass
+class Profile:
+    """One filter config judged against the shared fetch, with its own pipeline and channels."""
+
+    cfg: Config
+    pipeline: StagePipeline
+    notifiers: List[Notifier]
+
+    @property
+    def name(self) -> str:
+        return self.cfg.profile or DEFAULT_PROFILE
+
+
+def make_profiles(configs: Sequence[Config], with_notifiers: bool = True) -> List[Profile]:
+    return [
+        Profile(cfg, build_filter_pipeline(filter_plan(cfg)), make_notifiers(cfg) if with_notifiers else [])
+        for cfg in configs
+    ]
+
+
+def _profiles_fingerprint(cfg: Config, profiles: Sequence[Profile]) -> str:
+    """config_fingerprint of ``cfg``, covering every profile's config when there are several."""
+    hashes = [config_fingerprint(cfg)] + [config_fingerprint(p.cfg) for p in profiles if p.cfg is not cfg]
+    if len(hashes) == 1:
+        return hashes[0]
+    return hashlib.sha256("|".join(hashes).encode("utf-8")).hexdigest()
+
+
+def collect_metrics(profiles: Sequence[Profile], store: SeenStore, outbox: Optional[Outbox] = None) -> Iterable[Family]:
+    """Filter stage, seen store and outbox counters, read when /metrics is scraped."""
+    stages_in, stages_out, stage_seconds, memo = [], [], [], []
+    for profile in profiles:
+        for row in profile.pipeline.stats():
+            labels = {"profile": profile.name, "stage": row["stage"]}
+            stages_in.append((labels, row["seen"]))
+            stages_out.append((labels, row["seen"] - row["dropped"]))
+            stage_seconds.append((labels, row["total_ms"] / 1000.0))
+        memo.append(({"profile": profile.name, "result": "hit"}, profile.pipeline.memo_hits))
+        memo.append(({"profile": profile.name, "result": "miss"}, profile.pipeline.memo_misses))
+    yield "job_checker_filter_stage_in_total", "counter", "Jobs entering each filter stage", stages_in
+    yield "job_checker_filter_stage_out_total", "counter", "Jobs passing each filter stage", stages_out
+    yield "job_checker_filter_stage_seconds_total", "counter", "Time spent in each filter stage", stage_seconds
+    yield "job_checker_verdict_cache_total", "counter", "Verdict cache lookups by result", memo
+    bloom_skips, db_lookups, db_hits = store.lookup_stats()
+    yield "job_checker_seen_lookups_total", "counter", "Seen store lookups: new by Bloom filter, new or seen by SQLite", [
+        ({"result": "bloom_new"}, bloom_skips),
+        ({"result": "db_new"}, db_lookups - db_hits),
+        ({"result": "db_seen"}, db_hits),
+    ]
+    if outbox is not None:
+        counts = outbox.counts()
+        yield "job_checker_outbox_messages", "gauge", "Outbox rows by status", [
+            ({"status": status}, counts.get(status, 0)) for status in ("pending", "sent", "failed")
+        ]
+
+
+def print_stage_stats(pipeline: StagePipeline, store: Optional[SeenStore] = None) -> None:
+    print("stage                      tier      seen   dropped   drop%    avg_us  total_ms", file=sys.stderr)
+    for row in pipeline.stats():
+        print(
+            f"{row['stage']:<26} {row['tier']:>4} {row['seen']:>9} {row['dropped']:>9}"
+            f" {row['drop_rate'] * 100:>6.1f} {row['avg_us']:>9.1f} {row['total_ms']:>9.1f}",
+            file=sys.stderr,
+        )
+    print(f"verdict cache: {pipeline.memo_hits} hits, {pipeline.memo_misses} misses", file=sys.stderr)
+    if store is not None:
+        bloom_skips, db_lookups, _ = store.lookup_stats()
+        print(f"seen store: {bloom_skips} bloom skips, {db_lookups} db lookups", file=sys.stderr)
+
+
+def _print_profile_stats(profiles: Sequence[Profile], store: SeenStore) -> None:
+    for profile in profiles:
+        if len(profiles) > 1:
+            print(f"profile {profile.name}:", file=sys.stderr)
+        print_stage_stats(profile.pipeline, store if profile is profiles[-1] else None)
+
+
+def run_once(
+    cfg: Config,
+    scheduler: Optional[AdaptiveScheduler] = None,
+    pipeline: Optional[StagePipeline] = None,
+    verdicts: Optional[VerdictCache] = None,
+    store: Optional[SeenStore] = None,
+    archive: Optional[JobArchive] = None,
+    notifiers: Optional[List[Notifier]] = None,
+    outbox: Optional[Outbox] = None,
+    profiles: Optional[List[Profile]] = None,
+) -> None:
+    """One fetch/filter cycle. New matches are queued in ``outbox`` for its worker.
+
+    Without an ``outbox`` one is opened and drained before returning. With
+    ``profiles`` (which replace ``pipeline`` and ``notifiers``) ``cfg`` only
+    drives the fetch, and every batch is judged by all profiles in parallel.
+    """
+    if profiles is None:
+        notifiers = make_notifiers(cfg) if notifiers is None else notifiers
+        profiles = [Profile(cfg, pipeline or build_filter_pipeline(filter_plan(cfg)), notifiers)]
+    profiles = [profile for profile in profiles if profile.notifiers]
+    if not profiles:
+        print("No notification channel configured", file=sys.stderr)
         return
+    store = store or make_seen_store(cfg)
+    fingerprints: Optional[PayloadFingerprints] = None
+    if cfg.app.skip_unchanged_payloads:
+        fingerprints = PayloadFingerprints(_profiles_fingerprint(cfg, profiles))
 
-    notifier = TelegramNotifier(bot_token, core_chat_id, stretch_chat_id)
-    store = SeenStore()
+    # Collapse copies of one posting from several sources (or already sent under another URL)
+    dedup = {profile.name: _duplicate_index(profile.cfg) for profile in profiles}
+    queue = outbox or Outbox()
+    configs = [profile.cfg for profile in profiles]
+    with ThreadPoolExecutor(max_workers=len(profiles), thread_name_prefix="profile") as pool:
+        # Each batch of finished sources goes through filter, dedup and the outbox
+        # while slower sources are still fetching
+        for results in stream_results(cfg, store, scheduler, fingerprints.load() if fingerprints else None, configs):
+            jobs: List[Job] = []
+            for result in results:
+                jobs.extend(result.jobs)
+            if len(profiles) == 1:
+                _process_batch(profiles[0], jobs, verdicts, store, archive, queue, dedup[profiles[0].name])
+            else:
+                list(pool.map(
+                    lambda profile: _process_batch(profile, jobs, verdicts, store, archive, queue, dedup[profile.name]),
+                    profiles,
+                ))
+            # Only now are these payloads fully processed; unchanged repeats can be skipped
+            if fingerprints is not None:
+                fingerprints.update(p for result in results if not result.unchanged for p in result.payloads)
+    if outbox is None:
+        _drain(cfg, queue, [n for profile in profiles for n in profile.notifiers])
+        queue.close()
+    store.save_bloom()
+    if verdicts is not None:
+        verdicts.flush()
 
-    jobs = gather_jobs(cfg)
-    jobs = apply_keyword_filters(jobs, cfg)
 
-    # New only
-    new_jobs = [j for j in jobs if store.is_new(j)]
+def _process_batch(
+    profile: Profile,
+    jobs: List[Job],
+    verdicts: Optional[VerdictCache],
+    store: SeenStore,
+    archive: Optional[JobArchive],
+    outbox: Outbox,
+    dedup: Optional[DuplicateIndex],
+) -> None:
+    cfg, namespace = profile.cfg, profile.cfg.profile
+    # New only: one bulk lookup for the batch, so seen jobs never reach the filters (or the verdict cache)
+    unseen_jobs = store.filter_new(jobs, namespace)
+    new_jobs = apply_keyword_filters(unseen_jobs, cfg, profile.pipeline, verdicts=verdicts)
+    _archive(cfg, archive, unseen_jobs, new_jobs)
     if not new_jobs:
         return
+    # Earlier batches are already indexed, so a copy arriving later from a slower source is caught
+    unique_jobs = dedup.partition(new_jobs)[0] if dedup else new_jobs
+    QUEUED_JOBS.inc(len(new_jobs), profile=profile.name)
+    DUPLICATE_JOBS.inc(len(new_jobs) - len(unique_jobs), profile=profile.name)
+    messages = _render(cfg, profile.notifiers, unique_jobs)
+    # Mark seen (duplicates included) and queue the messages in one transaction
+    store.add(new_jobs, also=lambda conn: outbox.enqueue(conn, messages), namespace=namespace)
+    outbox.notify()
+    if dedup:
+        dedup.add(unique_jobs)
 
+
+def _timed_cycle(
+    cfg: Config,
+    scheduler: Optional[AdaptiveScheduler],
+    verdicts: Optional[VerdictCache],
+    store: SeenStore,
+    archive: Optional[JobArchive],
+    outbox: Outbox,
+    profiles: List[Profile],
+) -> None:
+    """run_once, recording its duration and outcome in the metrics."""
+    started = time.perf_counter()
+    try:
+        run_once(cfg, scheduler, verdicts=verdicts, store=store, archive=archive, outbox=outbox, profiles=profiles)
+    except Exception:
+        CYCLE_ERRORS.inc()
+        raise
+    else:
+        LAST_SUCCESS.set(time.time())
+    finally:
+        elapsed = time.perf_counter() - started
+        CYCLE_SECONDS.observe(elapsed)
+        LAST_CYCLE.set(elapsed)
+
+
+def _groups(cfg: Config, new_jobs: List[Job]) -> List[Tuple[List[Job], str, bool]]:
+    """(jobs, scope_tag, is_stretch) for the Austin/US x core/stretch groups."""
     # Group by scope and level
     austin_core: List[Job] = []
     austin_stretch: List[Job] = []
@@ -84,18 +504,20 @@ def run_once(cfg: Config) -> None:
         elif scope_tag == cfg.telegram.tag_us_remote:
             (us_stretch if is_stretch else us_core).append(job)
 
-    # Notify
-    if austin_core:
-        notifier.send(austin_core, cfg.telegram.tag_austin, is_stretch=False)
-    if austin_stretch:
-        notifier.send(austin_stretch, cfg.telegram.tag_austin, is_stretch=True)
-    if us_core:
-        notifier.send(us_core, cfg.telegram.tag_us_remote, is_stretch=False)
-    if us_stretch:
-        notifier.send(us_stretch, cfg.telegram.tag_us_remote, is_stretch=True)
+    return [
+        (austin_core, cfg.telegram.tag_austin, False),
+        (austin_stretch, cfg.telegram.tag_austin, True),
+        (us_core, cfg.telegram.tag_us_remote, False),
+        (us_stretch, cfg.telegram.tag_us_remote, True),
+    ]
+
 
-    # Mark seen
-    store.add(new_jobs)
+def _render(cfg: Config, notifiers: List[Notifier], new_jobs: List[Job]) -> List[OutboxMessage]:
+    messages = []
+    for channel, delivery in FanOut(notifiers).render(_groups(cfg, new_jobs)):
+        keys = [SeenStore.make_key(job) for job in delivery.jobs]
+        messages.append(OutboxMessage.for_jobs(channel, delivery.target, delivery.text, keys))
+    return messages
 
 
 def main() -> None:
@@ -107,29 +529,79 @@ def main() -> None:
     parser.add_argument(
         "--interval-seconds", type=int, default=None, help="Override interval from config"
     )
+    parser.add_argument("--stats", action="store_true", help="Print per-stage filter counters to stderr after each run")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Serve Prometheus metrics at /metrics on this port")
+    parser.add_argument("--metrics-host", default="127.0.0.1", help="Address for --metrics-port (default: localhost only)")
     args = parser.parse_args()
 
+    # The top-level config drives fetching; profiles (or the config itself) judge the results
     cfg = load_config(args.config)
     interval = args.interval_seconds or cfg.app.interval_seconds
+    # One pipeline per profile for the process, so stage counters and ordering carry across cycles
+    profiles = make_profiles(load_profiles(args.config), with_notifiers=not args.bootstrap)
+    configs = [profile.cfg for profile in profiles]
+    # Verdicts are keyed by filter plan, so profiles share one cache
+    verdicts = make_verdict_cache(cfg)
+    # One connection to the seen store for the process
+    store = make_seen_store(cfg)
+    archive = make_job_archive(cfg)
+    notifiers = [notifier for profile in profiles for notifier in profile.notifiers]
+    outbox = Outbox()
+    INTERVAL.set(interval)
+    REGISTRY.register_collector(partial(collect_metrics, profiles, store, outbox))
+    if args.metrics_port:
+        serve_metrics(args.metrics_port, args.metrics_host)
 
     if args.once or not args.loop:
         if args.bootstrap:
-            # gather + mark seen only
-            from .storage import SeenStore
-            store = SeenStore()
-            jobs = gather_jobs(cfg)
-            jobs = apply_keyword_filters(jobs, cfg)
-            store.add(jobs)
-        else:
-            run_once(cfg)
+            # gather once + mark seen for every profile only
+            all_jobs = gather_jobs(cfg, store, profiles=configs)
+            for profile in profiles:
+                jobs = apply_keyword_filters(all_jobs, profile.cfg, profile.pipeline)
+                store.add(jobs, namespace=profile.cfg.profile)
+                _archive(profile.cfg, archive, [], jobs)
+                dedup = _duplicate_index(profile.cfg)
+                if dedup:
+                    dedup.add(dedup.partition(jobs)[0])
+        elif notifiers:
+            _timed_cycle(cfg, None, verdicts, store, archive, outbox, profiles)
+            # Whatever this and earlier runs queued, before exiting
+            _drain(cfg, outbox, notifiers)
+            make_retention_worker(cfg).run_pass()
+        if args.stats:
+            _print_profile_stats(profiles, store)
+        outbox.close()
+        if verdicts is not None:
+            verdicts.close()
+        if archive is not None:
+            archive.close()
+        store.close()
+        return
+
+    scheduler: Optional[AdaptiveScheduler] = None
+    if cfg.app.adaptive_polling:
+        scheduler = AdaptiveScheduler(cfg.app.min_poll_seconds, cfg.app.max_poll_seconds, interval)
+    if not notifiers:
+        print("No notification channel configured", file=sys.stderr)
         return
+    # Deletes and compaction run on their own thread, between and during cycles
+    make_retention_worker(cfg).start()
+    # So does delivery: a cycle only queues its messages
+    for worker in make_outbox_workers(cfg, outbox, notifiers):
+        worker.start()
 
     while True:
         try:
-            run_once(cfg)
+            _timed_cycle(cfg, scheduler, verdicts, store, archive, outbox, profiles)
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
-        time.sleep(interval)
+        if args.stats:
+            _print_profile_stats(profiles, store)
+        if scheduler is not None:
+            # Wake for whichever board is due next, never busy-looping
+            time.sleep(max(1.0, scheduler.seconds_until_next_due()))
+        else:
+            time.sleep(interval)
 
 
 if __name__ == "__main__":
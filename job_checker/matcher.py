@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional C accelerator
+    ahocorasick = None
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """Regex alternation factored as a trie, so each text position costs one branch per character."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        alternation = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # A keyword ends here; the greedy optional still prefers the longer keyword
+            return "(?:" + alternation + ")?"
+        return alternation
+
+    return build(trie)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum()
+
+
+class KeywordMatcher:
+    """Find every keyword occurring in a text in one scan, with plain substring semantics.
+
+    Keywords are lowercased once at build time; texts must already be lowercase.
+    Uses a real Aho-Corasick automaton when ``pyahocorasick`` is installed.
+    Otherwise a trie-shaped regex reports the longest keyword starting at each
+    position; every shorter keyword starting there is one of its prefixes, so
+    the precomputed prefix closure recovers exactly what ``kw in text`` finds.
+
+    With ``whole_words`` a keyword only counts when it is not glued to letters or
+    digits on either side, so "eu" no longer matches inside "neural".
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False) -> None:
+        words = sorted({kw.lower() for kw in keywords if kw})
+        self.keywords: FrozenSet[str] = frozenset(words)
+        self.whole_words = whole_words
+        self._automaton = None
+        self._pattern = None
+        self._closure: Dict[str, FrozenSet[str]] = {}
+        if not words:
+            return
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for word in words:
+                automaton.add_word(word, word)
+            automaton.make_automaton()
+            self._automaton = automaton
+            return
+        if whole_words:
+            # The longest keyword that ends on a boundary; its shorter prefixes
+            # also ended on one exactly when the next keyword character is not a word char
+            self._pattern = re.compile(r"(?<![^\W_])(?=(" + _trie_pattern(words) + r")(?![^\W_]))")
+            self._closure = {
+                word: frozenset(
+                    p for p in words if word.startswith(p) and (len(p) == len(word) or not _is_word_char(word[len(p)]))
+                )
+                for word in words
+            }
+            return
+        self._pattern = re.compile("(?=(" + _trie_pattern(words) + "))")
+        self._closure = {word: frozenset(p for p in words if word.startswith(p)) for word in words}
+
+    def find(self, text: str) -> FrozenSet[str]:
+        if not text:
+            return frozenset()
+        if self._automaton is not None:
+            if self.whole_words:
+                return self._find_whole_words(text)
+            return frozenset(word for _, word in self._automaton.iter(text))
+        if self._pattern is None:
+            return frozenset()
+        longest = set(self._pattern.findall(text))
+        longest.discard("")
+        if not longest:
+            return frozenset()
+        found = set()
+        for word in longest:
+            found |= self._closure[word]
+        return frozenset(found)
+
+    def _find_whole_words(self, text: str) -> FrozenSet[str]:
+        last = len(text) - 1
+        found = set()
+        for end, word in self._automaton.iter(text):
+            start = end - len(word) + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end < last and _is_word_char(text[end + 1]):
+                continue
+            found.add(word)
+        return frozenset(found)
+
+
+class SplitMatcher:
+    """Substring keywords and whole-word keywords found in one pass over a text.
+
+    ``find`` returns (substring hits, whole-word hits), each with the semantics
+    of the matching KeywordMatcher; a keyword on both lists is judged separately
+    for each. With ``pyahocorasick`` both come from a single automaton scan,
+    which is most of the cost on a long description; otherwise this is two
+    KeywordMatcher scans.
+    """
+
+    def __init__(self, keywords: Iterable[str], words: Iterable[str]) -> None:
+        self.keywords = KeywordMatcher(keywords)
+        self.words = KeywordMatcher(words, whole_words=True)
+        self._automaton = None
+        if ahocorasick is None or not (self.keywords.keywords or self.words.keywords):
+            return
+        automaton = ahocorasick.Automaton()
+        for word in self.keywords.keywords | self.words.keywords:
+            automaton.add_word(word, (word, len(word), word in self.keywords.keywords, word in self.words.keywords))
+        automaton.make_automaton()
+        self._automaton = automaton
+
+    def find(self, text: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        if self._automaton is None:
+            return self.keywords.find(text), self.words.find(text)
+        if not text:
+            return frozenset(), frozenset()
+        last = len(text) - 1
+        found: List[str] = []
+        whole: List[str] = []
+        for end, (word, size, substring, whole_word) in self._automaton.iter(text):
+            if substring:
+                found.append(word)
+            if whole_word:
+                # _is_word_char, inlined: this loop sees every hit in the text
+                start = end - size + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end < last and text[end + 1].isalnum():
+                    continue
+                whole.append(word)
+        return frozenset(found), frozenset(whole)
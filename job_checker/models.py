@@ -1,25 +1,155 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import sys
+import zlib
+from datetime import datetime
+from typing import Any, Optional, Tuple, Union
+
+STRETCH_KEYWORDS = ("senior", "staff", "principal", "lead")
+
+# Descriptions at least this long are kept zlib-compressed until read
+COMPRESS_MIN_CHARS = 512
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _pack(description: Optional[str]) -> Union[None, str, bytes]:
+    if description is None or len(description) < COMPRESS_MIN_CHARS:
+        return description
+    return zlib.compress(description.encode("utf-8"), 1)
+
+
+def _unpack(stored: Union[None, str, bytes]) -> Optional[str]:
+    if isinstance(stored, bytes):
+        return zlib.decompress(stored).decode("utf-8")
+    return stored
 
 
-@dataclass(frozen=True)
 class Job:
+    """One posting. Immutable and compact, since the web view keeps large windows in RAM.
+
+    Slotted instead of a dataclass; source, company and location are interned,
+    as they repeat across thousands of postings; long descriptions are stored
+    compressed and only decompressed when read; the stretch flag is computed
+    once from the title. ``normalized`` marks jobs that went through ingestion.
+
+    Nothing derived from the description is kept on the job, so a window of
+    jobs stays compact after the filters read it; ``packed_description``
+    lets callers hash the text without decompressing it. Equality and
+    hashing use the cheap identity fields, never the description.
+    """
+
+    __slots__ = (
+        "source",
+        "id",
+        "title",
+        "company",
+        "location",
+        "url",
+        "_description",
+        "posted_at_iso",
+        # posted_at_iso parsed to aware UTC once at ingestion; None if absent or unparseable
+        "posted_at",
+        "normalized",
+        "_stretch",
+    )
+
+    _FIELDS = (
+        "source", "id", "title", "company", "location", "url",
+        "description", "posted_at_iso", "posted_at", "normalized",
+    )
+    _IDENTITY = ("source", "id", "title", "company", "location", "url", "posted_at_iso")
+
     source: str
     id: str
     title: str
     company: str
     location: str
     url: str
-    description: Optional[str] = None
-    posted_at_iso: Optional[str] = None
+    posted_at_iso: Optional[str]
+    posted_at: Optional[datetime]
+    normalized: bool
+
+    def __init__(
+        self,
+        source: str,
+        id: str,
+        title: str,
+        company: str,
+        location: str,
+        url: str,
+        description: Optional[str] = None,
+        posted_at_iso: Optional[str] = None,
+        posted_at: Optional[datetime] = None,
+        normalized: bool = False,
+    ) -> None:
+        init = object.__setattr__
+        init(self, "source", _intern(source))
+        init(self, "id", id)
+        init(self, "title", title)
+        init(self, "company", _intern(company))
+        init(self, "location", _intern(location))
+        init(self, "url", url)
+        init(self, "_description", _pack(description))
+        init(self, "posted_at_iso", posted_at_iso)
+        init(self, "posted_at", posted_at)
+        init(self, "normalized", normalized)
+        lowered = title.lower()
+        init(self, "_stretch", any(keyword in lowered for keyword in STRETCH_KEYWORDS))
+
+    @property
+    def description(self) -> Optional[str]:
+        return _unpack(self._description)
+
+    @property
+    def description_lower(self) -> Optional[str]:
+        description = self.description
+        return description.lower() if description else None
+
+    @property
+    def packed_description(self) -> Union[None, str, bytes]:
+        """The description as stored: zlib-compressed bytes when long, else the text."""
+        return self._description
 
     def is_stretch(self) -> bool:
-        lowered = self.title.lower()
-        for keyword in ("senior", "staff", "principal", "lead"):
-            if keyword in lowered:
-                return True
-        return False
+        return self._stretch
+
+    def replace(self, **changes: Any) -> "Job":
+        """Copy with some fields changed, like dataclasses.replace."""
+        values = {name: getattr(self, name) for name in self._FIELDS if name != "description"}
+        values.update(changes)
+        if "description" in changes:
+            return Job(**values)
+        # Carry the stored form over without a decompress/compress round trip
+        clone = Job(**values)
+        object.__setattr__(clone, "_description", self._description)
+        return clone
+
+    def _astuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot assign to field {name!r}; Job is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r}; Job is immutable")
+
+    def _identity(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._IDENTITY)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._identity() == other._identity()
+
+    def __hash__(self) -> int:
+        return hash(self._identity())
 
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"Job({fields})"
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Job, self._astuple())
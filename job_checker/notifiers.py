@@ -1,60 +1,423 @@
 from __future__ import annotations
 
-import os
+import json
+import smtplib
+import sys
+import threading
 import time
-from typing import Iterable
-from dateutil import parser as dateparser
+from dataclasses import dataclass
+from email import message_from_string, policy
+from email.message import EmailMessage
+from typing import Dict, List, Optional, Sequence, Tuple
 import pytz
-
 import requests
 
+from .metrics import REGISTRY
 from .models import Job
+from .timeparse import parse_timestamp
+from .transport import build_session, get_delivery_session
+
+
+_CENTRAL = pytz.timezone("America/Chicago")
+
+# Telegram rejects longer message texts
+MAX_MESSAGE_CHARS = 4096
+# Bot-wide ceiling Telegram documents for bulk sends
+GLOBAL_MESSAGES_PER_SECOND = 25.0
+
+TELEGRAM_SECONDS = REGISTRY.histogram(
+    "job_checker_telegram_request_seconds", "sendMessage round trip, rate-limit waits excluded"
+)
+TELEGRAM_REQUESTS = REGISTRY.counter(
+    "job_checker_telegram_requests_total", "sendMessage calls by HTTP status, or error", ("code",)
+)
+
+
+class TokenBucket:
+    """Blocking token bucket: ``rate`` tokens per second, holding at most ``capacity``.
+
+    ``penalize`` holds every caller for a while, for a server that answered
+    429 with a ``retry_after``; afterwards one token is available and the
+    bucket refills from there.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now > self._updated:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 1.0
+            self._updated = self._blocked_until
+
+
+# Telegram limits a bot and a chat, whichever notifier (profile) sends, so
+# notifiers sharing a bot token share these buckets
+_BUCKETS: Dict[Tuple[str, str], TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def _shared_bucket(key: Tuple[str, str], rate: float, capacity: float) -> TokenBucket:
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(key)
+        if bucket is None:
+            bucket = _BUCKETS[key] = TokenBucket(rate, capacity)
+        return bucket
+
+
+def pack_digests(header: str, entries: Sequence[str], limit: int = MAX_MESSAGE_CHARS) -> List[Tuple[str, List[int]]]:
+    """Pack ``entries`` behind ``header`` into as few messages of at most ``limit`` chars as possible.
+
+    Returns (text, indexes of the entries it carries); entries keep their order.
+    An entry too long for a message on its own is cut.
+    """
+    messages: List[Tuple[str, List[int]]] = []
+    text, carried = header, []
+    for i, entry in enumerate(entries):
+        entry = entry[:limit - len(header) - 2]
+        if carried and len(text) + 2 + len(entry) > limit:
+            messages.append((text, carried))
+            text, carried = header, []
+        text += "\n\n" + entry
+        carried.append(i)
+    if carried:
+        messages.append((text, carried))
+    return messages
+
+
+@dataclass(frozen=True)
+class Delivery:
+    """One rendered message: where it goes, its text, and the jobs it carries."""
+
+    target: str
+    text: str
+    jobs: Tuple[Job, ...]
+
+
+# (jobs, scope_tag, is_stretch), as run_once groups new matches
+Group = Tuple[List[Job], str, bool]
+
+
+def level_tag(is_stretch: bool) -> str:
+    return "[STRETCH]" if is_stretch else "[CORE]"
+
+
+def posted_central(job: Job) -> str:
+    """Posting time in US Central Time, or "" if unknown."""
+    dt = job.posted_at or parse_timestamp(job.posted_at_iso, job.source)
+    if dt is None:
+        return ""
+    return dt.astimezone(_CENTRAL).strftime("%b %d, %I:%M %p %Z")
+
+
+def format_entry(job: Job) -> str:
+    posted = posted_central(job)
+    posted_part = f" (Posted: {posted})" if posted else ""
+    return f"{job.title.strip()} — {job.company.strip()} — {job.location.strip()}{posted_part}\n{job.url}"
+
+
+class Notifier:
+    """A delivery channel: ``render`` turns a group of jobs into messages,
+    ``deliver`` sends one (retrying as the channel sees fit) and reports success.
+
+    ``name`` identifies the channel in the outbox.
+    """
+
+    name = ""
+
+    def render(self, jobs: Sequence[Job], scope_tag: str, is_stretch: bool) -> List[Delivery]:
+        raise NotImplementedError
 
+    def deliver(self, target: str, text: str) -> bool:
+        raise NotImplementedError
 
-class TelegramNotifier:
-    def __init__(self, bot_token: str, core_chat_id: str, stretch_chat_id: str) -> None:
+
+class TelegramNotifier(Notifier):
+    """Posts jobs to the core and stretch chats.
+
+    Every chat has its own token bucket (Telegram allows about 20 messages a
+    minute into a group) under a bot-wide one, shared with other notifiers
+    for the same bot, and a 429's ``retry_after``
+    pauses the chat's bucket before the message is retried. In digest mode a
+    group of jobs goes out as few messages as fit in 4096 characters.
+    """
+
+    name = "telegram"
+
+    def __init__(
+        self,
+        bot_token: str,
+        core_chat_id: str,
+        stretch_chat_id: str,
+        digest: bool = True,
+        per_chat_per_minute: float = 20.0,
+        per_chat_burst: int = 3,
+        max_attempts: int = 4,
+        timeout: float = 10.0,
+    ) -> None:
         self.base_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
         self.core_chat_id = core_chat_id
         self.stretch_chat_id = stretch_chat_id
+        self.digest = digest
+        self.per_chat_per_minute = per_chat_per_minute
+        self.per_chat_burst = per_chat_burst
+        self.max_attempts = max(1, max_attempts)
+        self.timeout = timeout
+        self._global = _shared_bucket((self.base_url, ""), GLOBAL_MESSAGES_PER_SECOND, GLOBAL_MESSAGES_PER_SECOND)
 
-    def _format_message(self, job: Job, scope_tag: str, level_tag: str) -> str:
-        title = job.title.strip()
-        company = job.company.strip()
-        location = job.location.strip()
-        url = job.url
-        # Format posted time in US Central Time if available
-        posted_part = ""
-        if job.posted_at_iso:
-            try:
-                dt = dateparser.parse(job.posted_at_iso)
-                if dt is not None:
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=pytz.UTC)
-                    ct = pytz.timezone("America/Chicago")
-                    dt_ct = dt.astimezone(ct)
-                    posted_str = dt_ct.strftime("%b %d, %I:%M %p %Z")
-                    posted_part = f" (Posted: {posted_str})"
-            except Exception:
-                pass
-        return f"{scope_tag} {level_tag} {title} — {company} — {location}{posted_part}\n{url}"
+    def _bucket(self, chat_id: str) -> TokenBucket:
+        return _shared_bucket((self.base_url, chat_id), self.per_chat_per_minute / 60.0, self.per_chat_burst)
+
+    def _format_message(self, job: Job, scope_tag: str, level: str) -> str:
+        return f"{scope_tag} {level} {format_entry(job)}"
+
+    def chat_for(self, is_stretch: bool) -> str:
+        return self.stretch_chat_id if is_stretch else self.core_chat_id
 
-    def send(self, jobs: Iterable[Job], scope_tag: str, is_stretch: bool) -> None:
-        level_tag = "[STRETCH]" if is_stretch else "[CORE]"
-        chat_id = self.stretch_chat_id if is_stretch else self.core_chat_id
-        for job in jobs:
-            text = self._format_message(job, scope_tag, level_tag)
+    def render(self, jobs: Sequence[Job], scope_tag: str, is_stretch: bool) -> List[Delivery]:
+        chat_id = self.chat_for(is_stretch)
+        level = level_tag(is_stretch)
+        if not self.digest or len(jobs) == 1:
+            return [Delivery(chat_id, self._format_message(job, scope_tag, level), (job,)) for job in jobs]
+        header = f"{scope_tag} {level} {len(jobs)} new jobs"
+        packed = pack_digests(header, [format_entry(job) for job in jobs])
+        return [Delivery(chat_id, text, tuple(jobs[i] for i in carried)) for text, carried in packed]
+
+    def deliver(self, chat_id: str, text: str) -> bool:
+        """Post one message, retrying 429s after ``retry_after`` and transient failures with backoff."""
+        bucket = self._bucket(chat_id)
+        for attempt in range(self.max_attempts):
+            bucket.acquire()
+            self._global.acquire()
+            started = time.perf_counter()
             try:
-                requests.post(
+                resp = get_delivery_session().post(
                     self.base_url,
                     json={
                         "chat_id": chat_id,
                         "text": text,
                         "disable_web_page_preview": True,
                     },
-                    timeout=10,
+                    timeout=self.timeout,
                 )
+            except Exception as e:
+                TELEGRAM_SECONDS.observe(time.perf_counter() - started)
+                TELEGRAM_REQUESTS.inc(code="error")
+                # Not the message: it would include the URL, and with it the bot token
+                print(f"telegram: {type(e).__name__}", file=sys.stderr)
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+            TELEGRAM_SECONDS.observe(time.perf_counter() - started)
+            TELEGRAM_REQUESTS.inc(code=str(resp.status_code))
+            if resp.status_code == 200:
+                return True
+            if resp.status_code == 429:
+                try:
+                    retry_after = float(resp.json().get("parameters", {}).get("retry_after", 1))
+                except ValueError:
+                    retry_after = float(resp.headers.get("Retry-After") or 1)
+                bucket.penalize(retry_after)
+                continue
+            if resp.status_code < 500:
+                # Bad request, unknown chat, bot blocked: retrying will not help
+                print(f"telegram: HTTP {resp.status_code}: {resp.text[:200]}", file=sys.stderr)
+                return False
+            time.sleep(0.5 * 2 ** attempt)
+        return False
+
+
+class WebhookNotifier(Notifier):
+    """POSTs each group as one JSON document to ``url``.
+
+    Has its own connection pool, so a slow consumer only ties up its own
+    sockets; each attempt is bounded by ``timeout``.
+    """
+
+    name = "webhook"
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 5.0,
+        max_attempts: int = 3,
+        pool_maxsize: int = 4,
+    ) -> None:
+        self.url = url
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.timeout = timeout
+        self.max_attempts = max(1, max_attempts)
+        self._session = build_session(pool_maxsize, statuses=())
+
+    def render(self, jobs: Sequence[Job], scope_tag: str, is_stretch: bool) -> List[Delivery]:
+        if not jobs:
+            return []
+        payload = {
+            "scope": scope_tag,
+            "level": level_tag(is_stretch),
+            "jobs": [
+                {
+                    "source": job.source,
+                    "id": job.id,
+                    "title": job.title,
+                    "company": job.company,
+                    "location": job.location,
+                    "url": job.url,
+                    "posted_at": job.posted_at.isoformat() if job.posted_at else job.posted_at_iso,
+                }
+                for job in jobs
+            ],
+        }
+        return [Delivery(self.url, json.dumps(payload, ensure_ascii=False), tuple(jobs))]
+
+    def deliver(self, url: str, text: str) -> bool:
+        for attempt in range(self.max_attempts):
+            try:
+                resp = self._session.post(url, data=text.encode("utf-8"), headers=self.headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                print(f"webhook: {type(e).__name__}", file=sys.stderr)
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+            if 200 <= resp.status_code < 300:
+                return True
+            if resp.status_code != 429 and resp.status_code < 500:
+                print(f"webhook: HTTP {resp.status_code}", file=sys.stderr)
+                return False
+            time.sleep(0.5 * 2 ** attempt)
+        return False
+
+
+class EmailNotifier(Notifier):
+    """Mails each group as one plain-text digest over SMTP.
+
+    Keeps one SMTP connection open between messages and reconnects when the
+    server has dropped it; each network operation is bounded by ``timeout``.
+    """
+
+    name = "email"
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        recipients: Sequence[str],
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = False,
+        use_ssl: bool = False,
+        timeout: float = 10.0,
+        max_attempts: int = 3,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = list(recipients)
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.max_attempts = max(1, max_attempts)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+
+    def render(self, jobs: Sequence[Job], scope_tag: str, is_stretch: bool) -> List[Delivery]:
+        if not jobs:
+            return []
+        msg = EmailMessage()
+        noun = "job" if len(jobs) == 1 else "jobs"
+        msg["Subject"] = f"{scope_tag} {level_tag(is_stretch)} {len(jobs)} new {noun}"
+        msg["From"] = self.sender
+        msg["To"] = ", ".join(self.recipients)
+        msg.set_content("\n\n".join(format_entry(job) for job in jobs))
+        return [Delivery(",".join(self.recipients), msg.as_string(), tuple(jobs))]
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.use_ssl:
+            smtp: smtplib.SMTP = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.starttls:
+                smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password or "")
+        return smtp
+
+    def _drop(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
             except Exception:
-                # Best-effort notifier; ignore transient errors
-                time.sleep(0.5)
+                pass
+            self._smtp = None
+
+    def deliver(self, recipients: str, text: str) -> bool:
+        msg = message_from_string(text, policy=policy.default)
+        to_addrs = [addr for addr in recipients.split(",") if addr]
+        for attempt in range(self.max_attempts):
+            with self._lock:
+                try:
+                    if self._smtp is None:
+                        self._smtp = self._connect()
+                    self._smtp.send_message(msg, from_addr=self.sender, to_addrs=to_addrs)
+                    return True
+                except smtplib.SMTPRecipientsRefused as e:
+                    print(f"email: recipients refused: {list(e.recipients)}", file=sys.stderr)
+                    return False
+                except (smtplib.SMTPException, OSError) as e:
+                    print(f"email: {type(e).__name__}", file=sys.stderr)
+                    self._drop()
+            time.sleep(0.5 * 2 ** attempt)
+        return False
+
+    def close(self) -> None:
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    pass
+                self._smtp = None
+
+
+class FanOut:
+    """Renders the same groups for several notifiers.
+
+    The messages go to the outbox; make_outbox_workers drains it with one
+    worker per channel, so one channel's errors or slowness never hold up or
+    fail another.
+    """
 
+    def __init__(self, notifiers: Sequence[Notifier]) -> None:
+        self.notifiers = list(notifiers)
 
+    def render(self, groups: Sequence[Group]) -> List[Tuple[str, Delivery]]:
+        """(channel name, message) for every channel and group."""
+        return [
+            (notifier.name, delivery)
+            for notifier in self.notifiers
+            for jobs, scope_tag, is_stretch in groups
+            if jobs
+            for delivery in notifier.render(jobs, scope_tag, is_stretch)
+        ]
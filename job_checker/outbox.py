@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from .metrics import REGISTRY
+from .storage import connect
+
+PENDING = "pending"
+SENT = "sent"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """One rendered notification; ``key`` makes enqueueing it idempotent."""
+
+    channel: str
+    target: str
+    text: str
+    key: str
+
+    @classmethod
+    def for_jobs(cls, channel: str, target: str, text: str, job_keys: Iterable[str]) -> "OutboxMessage":
+        """Keyed by destination and the jobs carried, so a re-rendered cycle maps to the same row."""
+        h = hashlib.sha256(f"{channel}|{target}".encode("utf-8"))
+        for key in sorted(job_keys):
+            h.update(b"\x1f")
+            h.update(key.encode("utf-8"))
+        return cls(channel, target, text, h.hexdigest())
+
+
+@dataclass(frozen=True)
+class _Row:
+    id: int
+    channel: str
+    target: str
+    text: str
+    attempts: int
+
+
+# A sender posts one message and reports success; it may retry internally
+Sender = Callable[[str, str], bool]
+
+NOTIFY_SECONDS = REGISTRY.histogram(
+    "job_checker_notify_seconds", "Time to deliver one queued message, retries included", ("channel",)
+)
+NOTIFY_MESSAGES = REGISTRY.counter(
+    "job_checker_notify_messages_total", "Delivery attempts by outcome: sent, retry or failed", ("channel", "result")
+)
+
+
+class Outbox:
+    """Durable queue of notifications awaiting delivery, in job_checker.db.
+
+    ``enqueue`` takes the caller's connection so messages commit in the same
+    transaction as the seen marks: a crash either loses both or keeps both.
+    Delivery is at least once; a crash between a send and ``mark_sent``
+    resends that message. One connection serves the workers of every channel
+    under a lock, as in SeenStore.
+    """
+
+    def __init__(self, db_path: str = "job_checker.db") -> None:
+        self.db_path = db_path
+        # One event per worker, set on notify so a waiting worker starts at once
+        self._listeners: List[threading.Event] = []
+        self._lock = threading.Lock()
+        self._conn = connect(db_path, check_same_thread=False)
+        self._ensure()
+
+    def _ensure(self) -> None:
+        with self._lock, self._conn as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY,
+                    idem_key TEXT UNIQUE NOT NULL,
+                    channel TEXT,
+                    target TEXT,
+                    text TEXT,
+                    status TEXT DEFAULT 'pending',
+                    attempts INTEGER DEFAULT 0,
+                    next_attempt_at REAL DEFAULT 0,
+                    last_error TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    sent_at TIMESTAMP
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt_at)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(self, conn: sqlite3.Connection, messages: Sequence[OutboxMessage]) -> None:
+        """Insert ``messages`` on ``conn``, inside the caller's transaction; the caller commits."""
+        conn.executemany(
+            "INSERT OR IGNORE INTO outbox (idem_key, channel, target, text) VALUES (?, ?, ?, ?)",
+            [(m.key, m.channel, m.target, m.text) for m in messages],
+        )
+
+    def subscribe(self) -> threading.Event:
+        event = threading.Event()
+        self._listeners.append(event)
+        return event
+
+    def notify(self) -> None:
+        for event in self._listeners:
+            event.set()
+
+    def due(self, channel: Optional[str] = None, limit: int = 100, now: Optional[float] = None) -> List[_Row]:
+        """Pending messages whose next attempt is due, oldest first; ``channel`` narrows to one channel."""
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT id, channel, target, text, attempts FROM outbox o
+                WHERE status = 'pending' AND next_attempt_at <= ? AND (? IS NULL OR channel = ?)
+                AND NOT EXISTS (
+                    -- an earlier message to the same target is waiting out a retry
+                    SELECT 1 FROM outbox p
+                    WHERE p.status = 'pending' AND p.channel = o.channel AND p.target = o.target
+                    AND p.id < o.id AND p.next_attempt_at > ?
+                )
+                ORDER BY id LIMIT ?
+                """,
+                (now, channel, channel, now, limit),
+            ).fetchall()
+        return [_Row(*row) for row in rows]
+
+    def mark_sent(self, row_id: int) -> None:
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "UPDATE outbox SET status = 'sent', attempts = attempts + 1, sent_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (row_id,),
+            )
+
+    def mark_failed(self, row: _Row, error: str, retry_in: Optional[float]) -> None:
+        """Schedule another attempt in ``retry_in`` seconds, or give up when it is None."""
+        status, next_at = (FAILED, 0.0) if retry_in is None else (PENDING, time.time() + retry_in)
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, attempts = attempts + 1, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                (status, next_at, error[:500], row.id),
+            )
+
+    def prune(self, days: int = 7) -> int:
+        """Drop sent and failed rows older than ``days``."""
+        with self._lock, self._conn as conn:
+            cur = conn.execute(
+                "DELETE FROM outbox WHERE status != 'pending' AND created_at < datetime('now', ?)",
+                (f"-{days} days",),
+            )
+        return cur.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+
+
+class OutboxWorker:
+    """Drains an Outbox through per-channel senders, off the fetch loop.
+
+    Messages to different targets go out concurrently; one target's messages
+    stay in order. A failed message is retried with exponential backoff (30 s
+    doubling to an hour) and abandoned after ``max_attempts``. With
+    ``channel`` the worker only takes that channel's messages, so one worker
+    per channel keeps a slow channel from delaying the others.
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        senders: Dict[str, Sender],
+        max_attempts: int = 8,
+        poll_seconds: float = 30.0,
+        max_workers: int = 4,
+        channel: Optional[str] = None,
+    ) -> None:
+        self.outbox = outbox
+        self.senders = senders
+        self.channel = channel
+        self._wake = threading.Event()
+        self.max_attempts = max(1, max_attempts)
+        self.poll_seconds = poll_seconds
+        self.max_workers = max(1, max_workers)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _deliver_target(self, rows: List[_Row]) -> int:
+        sent = 0
+        for row in rows:
+            sender = self.senders.get(row.channel)
+            started = time.perf_counter()
+            try:
+                ok = sender is not None and sender(row.target, row.text)
+                error = "" if ok else f"{row.channel}: delivery failed"
+            except Exception as e:
+                ok, error = False, f"{row.channel}: {type(e).__name__}"
+            NOTIFY_SECONDS.observe(time.perf_counter() - started, channel=row.channel)
+            if ok:
+                self.outbox.mark_sent(row.id)
+                NOTIFY_MESSAGES.inc(channel=row.channel, result="sent")
+                sent += 1
+                continue
+            attempts = row.attempts + 1
+            retry_in = None if attempts >= self.max_attempts else min(3600.0, 30.0 * 2 ** (attempts - 1))
+            self.outbox.mark_failed(row, error, retry_in)
+            NOTIFY_MESSAGES.inc(channel=row.channel, result="failed" if retry_in is None else "retry")
+            # Keep this target's order: later messages wait for the next pass
+            break
+        return sent
+
+    def drain(self) -> int:
+        """Deliver everything currently due; returns how many messages were sent."""
+        sent = 0
+        while not self._stop.is_set():
+            rows = self.outbox.due(self.channel)
+            if not rows:
+                break
+            by_target: Dict[tuple, List[_Row]] = {}
+            for row in rows:
+                by_target.setdefault((row.channel, row.target), []).append(row)
+            workers = min(self.max_workers, len(by_target))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outbox") as pool:
+                batch = sum(pool.map(self._deliver_target, by_target.values()))
+            sent += batch
+            if not batch:
+                break
+        return sent
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.drain()
+                self.outbox.prune()
+            except Exception as e:
+                print(f"outbox error: {e}", file=sys.stderr)
+            self._wake.wait(self.poll_seconds)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._wake = self.outbox.subscribe()
+            name = f"outbox-{self.channel}" if self.channel else "outbox"
+            self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, Protocol, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+# Assumed cost of a stage that has not run yet; small, so new stages get sampled early
+_PRIOR_NANOS = 1_000
+# Time one call in this many (a power of two) per stage; the clock costs as much as a cheap stage
+_TIMING_SAMPLE = 16
+
+
+@dataclass
+class StageStats:
+    seen: int = 0
+    dropped: int = 0
+    # Estimated total time; each of the ``timed`` calls stands for _TIMING_SAMPLE calls
+    nanos: int = 0
+    timed: int = 0
+
+    @property
+    def drop_rate(self) -> float:
+        # Laplace-smoothed so a stage with few samples is neither 0% nor 100% selective
+        return (self.dropped + 1) / (self.seen + 2)
+
+    @property
+    def avg_nanos(self) -> float:
+        return (self.nanos / _TIMING_SAMPLE + _PRIOR_NANOS) / (self.timed + 1)
+
+    @property
+    def rank(self) -> float:
+        """Expected cost paid per job this stage removes; lower runs earlier."""
+        return self.avg_nanos / self.drop_rate
+
+
+@dataclass(frozen=True)
+class FilterStage(Generic[T]):
+    """One reject check. ``keep`` returns False to drop the item.
+
+    Stages are only reordered within their ``tier``; tiers encode dependencies
+    (e.g. everything that reads the description runs after the text scan).
+    A ``stable`` stage depends on nothing but the item, so its outcome may be
+    memoized; volatile stages (clock, seen store) always rerun.
+    """
+
+    name: str
+    tier: int
+    keep: Callable[[T], bool]
+    stable: bool = True
+
+
+# (keep, stats, stable) per stage, in execution order
+_Active = List[Tuple[Callable[[T], bool], StageStats, bool]]
+
+
+class VerdictMemo(Protocol[T]):
+    """Remembers whether an item passed every stable stage after the pipeline's ``memo_after`` tier."""
+
+    def lookup(self, item: T) -> Optional[bool]: ...
+
+    def store(self, item: T, passed: bool) -> None: ...
+
+
+class StagePipeline(Generic[T]):
+    """Runs independent reject stages cheapest-and-most-selective first.
+
+    Every stage records how many items it saw and dropped and, on a sample
+    of its calls, the time it spent. After each ``run`` the order within each
+    tier is re-sorted by cost / drop-rate, the classic ordering for
+    independent filters.
+
+    Stages in tiers up to ``memo_after`` run on every item before a memo is
+    consulted, so cheap checks are never paid for with a memo key.
+    """
+
+    def __init__(
+        self,
+        stages: Iterable[FilterStage[T]],
+        adaptive: bool = True,
+        memo_after: Optional[int] = None,
+    ) -> None:
+        self._stages: List[FilterStage[T]] = sorted(stages, key=lambda s: s.tier)
+        self._stats: Dict[str, StageStats] = {s.name: StageStats() for s in self._stages}
+        self.adaptive = adaptive
+        self.memo_after = memo_after
+        self.memo_hits = 0
+        self.memo_misses = 0
+        # (head, tail, volatile part of tail) for the current order; see _layout
+        self._split: Optional[Tuple[_Active[T], _Active[T], _Active[T]]] = None
+
+    @property
+    def order(self) -> List[str]:
+        return [s.name for s in self._stages]
+
+    def run(self, items: Iterable[T], memo: Optional[VerdictMemo[T]] = None) -> Iterator[T]:
+        """Yield the items that pass every stage.
+
+        With a ``memo``, an item that passed the stages up to ``memo_after``
+        and has a remembered verdict skips the stable stages after them: a
+        remembered failure is dropped outright and a remembered pass only
+        reruns the volatile ones. Verdicts cover those later stages and are
+        stored once known, i.e. when an item passes or one of them drops it.
+        """
+        clock = time.perf_counter_ns
+        untimed = _TIMING_SAMPLE - 1
+
+        def passes(item: T, active: _Active[T], store: bool) -> bool:
+            for keep, stats, stable in active:
+                if stats.seen & untimed:
+                    ok = keep(item)
+                else:
+                    start = clock()
+                    ok = keep(item)
+                    stats.nanos += (clock() - start) * _TIMING_SAMPLE
+                    stats.timed += 1
+                stats.seen += 1
+                if not ok:
+                    stats.dropped += 1
+                    if store and stable:
+                        memo.store(item, False)
+                    return False
+            return True
+
+        head, tail, tail_volatile = self._layout()
+        try:
+            for item in items:
+                if not passes(item, head, False):
+                    continue
+                if memo is None:
+                    if passes(item, tail, False):
+                        yield item
+                    continue
+                verdict = memo.lookup(item)
+                if verdict is None:
+                    self.memo_misses += 1
+                    if passes(item, tail, True):
+                        memo.store(item, True)
+                        yield item
+                else:
+                    self.memo_hits += 1
+                    if verdict and passes(item, tail_volatile, False):
+                        yield item
+        finally:
+            if self.adaptive:
+                self.optimize()
+
+    def _layout(self) -> Tuple[_Active[T], _Active[T], _Active[T]]:
+        # Built once per order rather than per run, which matters for one-item runs
+        split = self._split
+        if split is None:
+            stages = [(s.keep, self._stats[s.name], s.stable) for s in self._stages]
+            cut = 0
+            if self.memo_after is not None:
+                cut = sum(1 for s in self._stages if s.tier <= self.memo_after)
+            head, tail = stages[:cut], stages[cut:]
+            split = self._split = (head, tail, [entry for entry in tail if not entry[2]])
+        return split
+
+    def optimize(self) -> None:
+        # Python's sort is stable, so ties keep their declared order. A new list
+        # rather than an in-place sort, which would look empty to other threads.
+        self._stages = sorted(self._stages, key=lambda s: (s.tier, self._stats[s.name].rank))
+        self._split = None
+
+    def stats(self) -> List[Dict[str, Union[str, int, float]]]:
+        """Per-stage counters in current execution order."""
+        rows: List[Dict[str, Union[str, int, float]]] = []
+        for stage in self._stages:
+            st = self._stats[stage.name]
+            rows.append(
+                {
+                    "stage": stage.name,
+                    "tier": stage.tier,
+                    "seen": st.seen,
+                    "dropped": st.dropped,
+                    "drop_rate": st.dropped / st.seen if st.seen else 0.0,
+                    "avg_us": st.nanos / (st.timed * _TIMING_SAMPLE) / 1000 if st.timed else 0.0,
+                    "total_ms": st.nanos / 1e6,
+                }
+            )
+        return rows
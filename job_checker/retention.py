@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .storage import connect
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long ``seen`` rows are kept: ``default_days``, or per source; 0 keeps them forever.
+
+    Rows expire by when they were first seen, not last seen. A posting still
+    listed when its row expires is notified again if it passes the recency
+    filter, which it can long after it opened: Greenhouse reports edits as
+    ``updated_at`` and undated jobs always count as recent. So only set a TTL
+    for sources whose listings are dropped well before it.
+    """
+
+    default_days: int = 0
+    by_source: Dict[str, int] = field(default_factory=dict)
+
+    def rules(self) -> List[Tuple[str, Tuple[object, ...], int]]:
+        """(WHERE clause, params, days) per rule; sources with an override are excluded from the default."""
+        rules: List[Tuple[str, Tuple[object, ...], int]] = []
+        for source, days in sorted(self.by_source.items()):
+            if days > 0:
+                rules.append(("source = ?", (source,), days))
+        if self.default_days > 0:
+            overridden = tuple(sorted(self.by_source))
+            if overridden:
+                placeholders = ",".join("?" * len(overridden))
+                rules.append((f"(source IS NULL OR source NOT IN ({placeholders}))", overridden, self.default_days))
+            else:
+                rules.append(("1", (), self.default_days))
+        return rules
+
+
+def purge_expired(
+    db_path: str,
+    policy: RetentionPolicy,
+    batch_size: int = 500,
+    pause_seconds: float = 0.05,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """Delete expired ``seen`` rows in small transactions; returns the count.
+
+    Each batch holds the write lock only briefly and is followed by a pause,
+    so a concurrent poll cycle or web request never waits long.
+    """
+    deleted = 0
+    conn = connect(db_path)
+    try:
+        for where, params, days in policy.rules():
+            while stop is None or not stop.is_set():
+                with conn:
+                    cur = conn.execute(
+                        f"""
+                        DELETE FROM seen WHERE rowid IN (
+                            SELECT rowid FROM seen
+                            WHERE created_at < datetime('now', ?) AND {where}
+                            LIMIT ?
+                        )
+                        """,
+                        (f"-{days} days", *params, batch_size),
+                    )
+                deleted += cur.rowcount
+                if cur.rowcount < batch_size:
+                    break
+                time.sleep(pause_seconds)
+    finally:
+        conn.close()
+    return deleted
+
+
+def purge_duplicates(
+    db_path: str,
+    days: float,
+    batch_size: int = 500,
+    pause_seconds: float = 0.05,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """Delete duplicate-index rows older than ``days`` (and their buckets) in small transactions."""
+    if days <= 0:
+        return 0
+    deleted = 0
+    conn = connect(db_path)
+    try:
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'dedup_jobs'").fetchone():
+            return 0
+        while stop is None or not stop.is_set():
+            with conn:
+                ids = [row[0] for row in conn.execute(
+                    "SELECT id FROM dedup_jobs WHERE created_at < datetime('now', ?) LIMIT ?",
+                    (f"-{days} days", batch_size),
+                )]
+                if ids:
+                    placeholders = ",".join("?" * len(ids))
+                    conn.execute(f"DELETE FROM dedup_buckets WHERE job_id IN ({placeholders})", ids)
+                    conn.execute(f"DELETE FROM dedup_jobs WHERE id IN ({placeholders})", ids)
+            deleted += len(ids)
+            if len(ids) < batch_size:
+                break
+            time.sleep(pause_seconds)
+    finally:
+        conn.close()
+    return deleted
+
+
+def database_size(db_path: str) -> int:
+    """Bytes on disk for the database and its WAL."""
+    return sum(os.path.getsize(p) for p in (db_path, f"{db_path}-wal") if os.path.exists(p))
+
+
+def _compaction_due(db_path: str, interval_seconds: float) -> bool:
+    """Whether the last compaction (by any process) is older than ``interval_seconds``; claims it if so."""
+    now = time.time()
+    with connect(db_path) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS maintenance (task TEXT PRIMARY KEY, ran_at REAL)")
+        row = conn.execute("SELECT ran_at FROM maintenance WHERE task = 'compact'").fetchone()
+        if row is not None and now - row[0] < interval_seconds:
+            return False
+        conn.execute("INSERT OR REPLACE INTO maintenance (task, ran_at) VALUES ('compact', ?)", (now,))
+    return True
+
+
+# auto_vacuum value for INCREMENTAL
+_INCREMENTAL = 2
+
+
+def compact(
+    db_path: str,
+    step_pages: int = 1024,
+    pause_seconds: float = 0.05,
+    stop: Optional[threading.Event] = None,
+    convert_max_bytes: int = 64 * 2**20,
+) -> Tuple[int, int]:
+    """Return free pages to the filesystem; (size before, size after) in bytes.
+
+    Free pages are released ``step_pages`` at a time, each step a short write
+    transaction followed by a pause, until none are left or ``stop`` is set.
+    That needs incremental auto-vacuum, which new files get from ``connect``.
+    An older file is switched over with one full VACUUM, but only while it is
+    at most ``convert_max_bytes``; a larger one is left alone (VACUUM it once
+    offline), as the rewrite would hold the write lock throughout.
+    """
+    conn = connect(db_path)
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        before = database_size(db_path)
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != _INCREMENTAL:
+            if before > convert_max_bytes:
+                print(
+                    f"retention: {db_path} is not in incremental auto-vacuum mode and too large to convert"
+                    " online; run VACUUM on it once while job_checker is stopped",
+                    file=sys.stderr,
+                )
+                return before, before
+            conn.execute("VACUUM")
+        while stop is None or not stop.is_set():
+            if not conn.execute("PRAGMA freelist_count").fetchone()[0]:
+                break
+            # The pragma frees pages as its rows are stepped, so drain them
+            conn.execute(f"PRAGMA incremental_vacuum({int(step_pages)})").fetchall()
+            time.sleep(pause_seconds)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        after = database_size(db_path)
+    finally:
+        conn.close()
+    return before, after
+
+
+class RetentionWorker:
+    """Purges expired ``seen`` rows, then compacts the file, off the poll loop.
+
+    Duplicate-index rows older than ``duplicate_days`` (the dedup window) go
+    in the same pass; 0 keeps them.
+
+    ``start`` runs a pass every ``interval_seconds`` on a daemon thread;
+    ``run_pass`` does one pass inline (for ``--once``). Compaction runs at
+    most every ``vacuum_interval_seconds`` across processes, tracked in the
+    ``maintenance`` table (0 disables it).
+    """
+
+    def __init__(
+        self,
+        policy: RetentionPolicy,
+        db_path: str = "job_checker.db",
+        interval_seconds: float = 3600.0,
+        vacuum_interval_seconds: float = 86400.0,
+        duplicate_days: float = 0,
+    ) -> None:
+        self.policy = policy
+        self.duplicate_days = duplicate_days
+        self.db_path = db_path
+        self.interval_seconds = interval_seconds
+        self.vacuum_interval_seconds = vacuum_interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_pass(self) -> None:
+        deleted = purge_expired(self.db_path, self.policy, stop=self._stop)
+        if deleted:
+            print(f"retention: deleted {deleted} expired seen rows", file=sys.stderr)
+        deleted = purge_duplicates(self.db_path, self.duplicate_days, stop=self._stop)
+        if deleted:
+            print(f"retention: deleted {deleted} expired duplicate-index rows", file=sys.stderr)
+        if self.vacuum_interval_seconds > 0 and _compaction_due(self.db_path, self.vacuum_interval_seconds):
+            before, after = compact(self.db_path, stop=self._stop)
+            print(
+                f"retention: compacted {self.db_path} from {before / 2**20:.1f} MiB to {after / 2**20:.1f} MiB",
+                file=sys.stderr,
+            )
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_pass()
+            except Exception as e:
+                print(f"retention error: {e}", file=sys.stderr)
+            self._stop.wait(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="retention", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from .fetching import FetchTask
+from .models import Job
+
+
+@dataclass
+class _TaskState:
+    interval: float
+    next_due: float = 0.0
+    known_ids: FrozenSet[str] = field(default_factory=frozenset)
+    primed: bool = False
+
+
+class AdaptiveScheduler:
+    """Per-task poll intervals that follow each board's observed change rate.
+
+    A poll that turns up postings we have not listed before halves the task's
+    interval; a quiet poll stretches it by ``slowdown``. Intervals stay within
+    ``[min_seconds, max_seconds]``, so busy boards converge on the floor and
+    dormant ones on the ceiling.
+    """
+
+    def __init__(
+        self,
+        min_seconds: float,
+        max_seconds: float,
+        initial_seconds: Optional[float] = None,
+        speedup: float = 0.5,
+        slowdown: float = 1.25,
+    ) -> None:
+        self.min_seconds = max(1.0, float(min_seconds))
+        self.max_seconds = max(self.min_seconds, float(max_seconds))
+        initial = self.min_seconds if initial_seconds is None else float(initial_seconds)
+        self.initial_seconds = self._clamp(initial)
+        self.speedup = speedup
+        self.slowdown = slowdown
+        self._states: Dict[str, _TaskState] = {}
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.max_seconds, max(self.min_seconds, seconds))
+
+    def _state(self, name: str) -> _TaskState:
+        state = self._states.get(name)
+        if state is None:
+            state = _TaskState(interval=self.initial_seconds)
+            self._states[name] = state
+        return state
+
+    def due(self, tasks: Iterable[FetchTask], now: Optional[float] = None) -> List[FetchTask]:
+        now = time.monotonic() if now is None else now
+        return [t for t in tasks if self._state(t.name).next_due <= now]
+
+    def record(self, name: str, jobs: Iterable[Job], now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        state = self._state(name)
+        ids = frozenset(job.id for job in jobs)
+        if state.primed:
+            if ids - state.known_ids:
+                state.interval = self._clamp(state.interval * self.speedup)
+            else:
+                state.interval = self._clamp(state.interval * self.slowdown)
+        if ids:
+            # An empty poll is usually a failed fetch; keep the last listing to diff against
+            state.known_ids = ids
+        state.primed = True
+        state.next_due = now + state.interval
+
+    def seconds_until_next_due(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        if not self._states:
+            return self.initial_seconds
+        return max(0.0, min(s.next_due for s in self._states.values()) - now)
+
+    def intervals(self) -> Dict[str, float]:
+        return {name: state.interval for name, state in self._states.items()}
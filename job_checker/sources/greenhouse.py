@@ -1,50 +1,105 @@
 from __future__ import annotations
 
-from typing import Iterable, List
-
-import requests
+import html
+import json
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Iterable, List, Optional, Tuple
 
+from ..fetching import note_failure, payload_unchanged
+from ..httpcache import default_cache
 from ..models import Job
+from ..transport import get_session
 
 
 GREENHOUSE_BOARD_API = "https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
+GREENHOUSE_JOB_API = "https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs/{job_id}"
+# Postings we already hydrated; kept so a filtered-out posting is not refetched every cycle
+CONTENT_MEMO_SIZE = 5000
+
+_content_memo: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+_content_lock = threading.Lock()
 
 
-def fetch_greenhouse(board_tokens: List[str]) -> Iterable[Job]:
+def _parse_board(token: str, body: bytes) -> List[Job]:
+    data = json.loads(body)
     jobs: List[Job] = []
-    for token in board_tokens:
-        token = token.strip()
-        if not token:
-            continue
-        try:
-            resp = requests.get(
-                GREENHOUSE_BOARD_API.format(board_token=token),
-                params={"content": "true"},  # include content/metadata when available
-                timeout=20,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception:
-            continue
-
-        for item in data.get("jobs", []) or []:
-            title = item.get("title") or ""
-            location = (item.get("location") or {}).get("name") or ""
-            url = item.get("absolute_url") or ""
-            posted = item.get("updated_at") or item.get("created_at") or ""
-            company = token
-            jobs.append(
-                Job(
-                    source="greenhouse",
-                    id=str(item.get("id") or url or title),
-                    title=title,
-                    company=company,
-                    location=location,
-                    url=url,
-                    description=None,
-                    posted_at_iso=posted,
-                )
+    for item in data.get("jobs", []) or []:
+        title = item.get("title") or ""
+        location = (item.get("location") or {}).get("name") or ""
+        url = item.get("absolute_url") or ""
+        posted = item.get("updated_at") or item.get("created_at") or ""
+        company = token
+        jobs.append(
+            Job(
+                source="greenhouse",
+                id=str(item.get("id") or url or title),
+                title=title,
+                company=company,
+                location=location,
+                url=url,
+                description=None,
+                posted_at_iso=posted,
             )
+        )
     return jobs
 
 
+def _fetch_content(token: str, job_id: str) -> Optional[str]:
+    key = (token, job_id)
+    with _content_lock:
+        if key in _content_memo:
+            _content_memo.move_to_end(key)
+            return _content_memo[key]
+    try:
+        resp = get_session().get(GREENHOUSE_JOB_API.format(board_token=token, job_id=job_id), timeout=20)
+        resp.raise_for_status()
+        # Greenhouse returns the posting HTML entity-escaped
+        content = html.unescape(resp.json().get("content") or "") or None
+    except Exception as e:
+        note_failure(f"greenhouse:{token}", e)
+        return None
+    with _content_lock:
+        _content_memo[key] = content
+        while len(_content_memo) > CONTENT_MEMO_SIZE:
+            _content_memo.popitem(last=False)
+    return content
+
+
+def fetch_greenhouse_board(token: str, hydrate: Optional[Callable[[Job], bool]] = None) -> List[Job]:
+    """Fetch the lightweight job list for a board, then pull content only where ``hydrate`` says so.
+
+    ``hydrate`` is called per listed job; typically "not seen yet and passes the title checks".
+    """
+    token = token.strip()
+    if not token:
+        return []
+    try:
+        listed = default_cache().get_jobs(
+            GREENHOUSE_BOARD_API.format(board_token=token),
+            partial(_parse_board, token),
+            timeout=20,
+        )
+    except Exception as e:
+        note_failure(f"greenhouse:{token}", e)
+        return []
+    if hydrate is None or payload_unchanged():
+        return listed
+
+    jobs: List[Job] = []
+    for job in listed:
+        if hydrate(job):
+            content = _fetch_content(token, job.id)
+            if content:
+                # Raw HTML again: let the fetch engine normalize it
+                job = job.replace(description=content, normalized=False)
+        jobs.append(job)
+    return jobs
+
+
+def fetch_greenhouse(board_tokens: List[str], hydrate: Optional[Callable[[Job], bool]] = None) -> Iterable[Job]:
+    jobs: List[Job] = []
+    for token in board_tokens:
+        jobs.extend(fetch_greenhouse_board(token, hydrate))
+    return jobs
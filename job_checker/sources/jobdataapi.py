@@ -1,36 +1,19 @@
 from __future__ import annotations
 
+import json
 import os
 from typing import Iterable, List
 
-import requests
-
+from ..fetching import note_failure
+from ..httpcache import default_cache
 from ..models import Job
 
 
 JOBDATAAPI_ENDPOINT = "https://api.jobdataapi.com/v1/jobs/search"
 
 
-def fetch_jobdataapi(keywords: List[str], location_query: str) -> Iterable[Job]:
-    api_key = os.getenv("JOBDATAAPI_KEY")
-    if not api_key:
-        return []
-    try:
-        resp = requests.get(
-            JOBDATAAPI_ENDPOINT,
-            headers={"Authorization": f"Bearer {api_key}"},
-            params={
-                "query": " ".join(keywords),
-                "location": location_query,
-                "page_size": 50,
-            },
-            timeout=25,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception:
-        return []
-
+def _parse_jobs(body: bytes) -> List[Job]:
+    data = json.loads(body)
     jobs: List[Job] = []
     for item in data.get("results", []) or []:
         title = item.get("title") or ""
@@ -54,3 +37,22 @@ def fetch_jobdataapi(keywords: List[str], location_query: str) -> Iterable[Job]:
     return jobs
 
 
+def fetch_jobdataapi(keywords: List[str], location_query: str) -> Iterable[Job]:
+    api_key = os.getenv("JOBDATAAPI_KEY")
+    if not api_key:
+        return []
+    try:
+        return default_cache().get_jobs(
+            JOBDATAAPI_ENDPOINT,
+            _parse_jobs,
+            headers={"Authorization": f"Bearer {api_key}"},
+            params={
+                "query": " ".join(keywords),
+                "location": location_query,
+                "page_size": 50,
+            },
+            timeout=25,
+        )
+    except Exception as e:
+        note_failure("jobdataapi", e)
+        return []
@@ -1,36 +1,19 @@
 from __future__ import annotations
 
+import json
 import os
 from typing import Iterable, List
 
-import requests
-
+from ..fetching import note_failure
+from ..httpcache import default_cache
 from ..models import Job
 
 
 JOBSPIKR_ENDPOINT = "https://api.jobspikr.com/v3/jobs"
 
 
-def fetch_jobspikr(keywords: List[str], location_query: str) -> Iterable[Job]:
-    api_key = os.getenv("JOBSPIKR_API_KEY")
-    if not api_key:
-        return []
-    try:
-        resp = requests.get(
-            JOBSPIKR_ENDPOINT,
-            headers={"x-api-key": api_key},
-            params={
-                "q": " ".join(keywords),
-                "l": location_query,
-                "num": 50,
-            },
-            timeout=25,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception:
-        return []
-
+def _parse_jobs(body: bytes) -> List[Job]:
+    data = json.loads(body)
     jobs: List[Job] = []
     for item in data.get("data", []) or []:
         title = item.get("job_title") or ""
@@ -54,3 +37,22 @@ def fetch_jobspikr(keywords: List[str], location_query: str) -> Iterable[Job]:
     return jobs
 
 
+def fetch_jobspikr(keywords: List[str], location_query: str) -> Iterable[Job]:
+    api_key = os.getenv("JOBSPIKR_API_KEY")
+    if not api_key:
+        return []
+    try:
+        return default_cache().get_jobs(
+            JOBSPIKR_ENDPOINT,
+            _parse_jobs,
+            headers={"x-api-key": api_key},
+            params={
+                "q": " ".join(keywords),
+                "l": location_query,
+                "num": 50,
+            },
+            timeout=25,
+        )
+    except Exception as e:
+        note_failure("jobspikr", e)
+        return []
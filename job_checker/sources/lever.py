@@ -1,48 +1,62 @@
 from __future__ import annotations
 
+import json
+from functools import partial
 from typing import Iterable, List
 
-import requests
-
+from ..fetching import note_failure
+from ..httpcache import default_cache
 from ..models import Job
+from ..timeparse import from_epoch
 
 
 LEVER_ENDPOINT = "https://api.lever.co/v0/postings/{company}?mode=json"
 
 
-def fetch_lever(companies: List[str]) -> Iterable[Job]:
+def _parse_postings(token: str, body: bytes) -> List[Job]:
+    data = json.loads(body)
     jobs: List[Job] = []
-    for company in companies:
-        token = company.strip()
-        if not token:
-            continue
-        try:
-            resp = requests.get(LEVER_ENDPOINT.format(company=token), timeout=20)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception:
-            continue
-        for item in data or []:
-            title = item.get("text") or item.get("title") or ""
-            location = item.get("categories", {}).get("location") or ""
-            url = item.get("hostedUrl") or item.get("applyUrl") or ""
-            posted = item.get("createdAt") or item.get("listedAt") or ""
-            # Lever timestamps are epoch ms; convert to ISO 8601 string
-            if isinstance(posted, (int, float)):
-                import datetime
-                posted = datetime.datetime.utcfromtimestamp(int(posted)/1000).isoformat()+"Z"
-            jobs.append(
-                Job(
-                    source="lever",
-                    id=str(item.get("id") or url or title),
-                    title=title,
-                    company=token,
-                    location=location,
-                    url=url,
-                    description=None,
-                    posted_at_iso=str(posted),
-                )
+    for item in data or []:
+        title = item.get("text") or item.get("title") or ""
+        location = item.get("categories", {}).get("location") or ""
+        url = item.get("hostedUrl") or item.get("applyUrl") or ""
+        posted = item.get("createdAt") or item.get("listedAt") or ""
+        posted_at = None
+        # Lever timestamps are epoch ms; convert to ISO 8601 string
+        if isinstance(posted, (int, float)):
+            posted_at = from_epoch(int(posted))
+            posted = posted_at.replace(tzinfo=None).isoformat() + "Z"
+        jobs.append(
+            Job(
+                source="lever",
+                id=str(item.get("id") or url or title),
+                title=title,
+                company=token,
+                location=location,
+                url=url,
+                description=None,
+                posted_at_iso=str(posted),
+                posted_at=posted_at,
             )
+        )
     return jobs
 
 
+def fetch_lever_company(company: str) -> List[Job]:
+    token = company.strip()
+    if not token:
+        return []
+    try:
+        return default_cache().get_jobs(
+            LEVER_ENDPOINT.format(company=token), partial(_parse_postings, token), timeout=20
+        )
+    except Exception as e:
+        note_failure(f"lever:{token}", e)
+        return []
+
+
+def fetch_lever(companies: List[str]) -> Iterable[Job]:
+    jobs: List[Job] = []
+    for company in companies:
+        jobs.extend(fetch_lever_company(company))
+    return jobs
@@ -1,27 +1,19 @@
 from __future__ import annotations
 
-import requests
+import json
 from typing import Iterable, List
 
+from ..geo import location_index
+from ..fetching import note_failure
+from ..httpcache import default_cache
 from ..models import Job
 
 
 REMOTIVE_API = "https://remotive.com/api/remote-jobs"
 
 
-def fetch_remotive(keywords: List[str]) -> Iterable[Job]:
-    query = "+".join(keywords)
-    try:
-        resp = requests.get(
-            REMOTIVE_API,
-            params={"search": query},
-            timeout=15,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception:
-        return []
-
+def _parse_jobs(body: bytes) -> List[Job]:
+    data = json.loads(body)
     jobs = []
     for item in data.get("jobs", []):
         title = item.get("title") or ""
@@ -31,27 +23,7 @@ def fetch_remotive(keywords: List[str]) -> Iterable[Job]:
         desc = item.get("description")
         posted = item.get("publication_date")
         # Heuristic: Remotive includes non-US remote; filter out obvious non-US jobs
-        loc_lower = (location or "").lower()
-        desc_lower = (desc or "").lower()
-        
-        # Skip obvious non-US jobs
-        if any(country in loc_lower or country in desc_lower for country in [
-            "denmark", "sweden", "norway", "finland", "germany", "france", "spain", "italy",
-            "netherlands", "belgium", "switzerland", "austria", "poland", "czech", "hungary",
-            "romania", "bulgaria", "croatia", "slovenia", "slovakia", "estonia", "latvia",
-            "lithuania", "ireland", "portugal", "greece", "cyprus", "malta", "luxembourg",
-            "uk", "united kingdom", "england", "scotland", "wales", "northern ireland"
-        ]):
-            continue
-            
-        # Skip jobs with obvious non-US city mentions
-        if any(city in loc_lower or city in desc_lower for city in [
-            "london", "berlin", "paris", "madrid", "rome", "amsterdam", "brussels",
-            "zurich", "vienna", "warsaw", "prague", "budapest", "bucharest", "sofia",
-            "zagreb", "ljubljana", "bratislava", "tallinn", "riga", "vilnius", "dublin",
-            "lisbon", "athens", "nicosia", "valletta", "copenhagen", "stockholm", "oslo",
-            "helsinki", "reykjavik", "moscow", "kyiv", "minsk"
-        ]):
+        if location_index().is_non_us(location, desc):
             continue
         jobs.append(
             Job(
@@ -68,3 +40,10 @@ def fetch_remotive(keywords: List[str]) -> Iterable[Job]:
     return jobs
 
 
+def fetch_remotive(keywords: List[str]) -> Iterable[Job]:
+    query = "+".join(keywords)
+    try:
+        return default_cache().get_jobs(REMOTIVE_API, _parse_jobs, params={"search": query}, timeout=15)
+    except Exception as e:
+        note_failure("remotive", e)
+        return []
@@ -4,6 +4,9 @@ from typing import Iterable, List
 
 import feedparser
 
+from ..geo import NON_US, location_index
+from ..fetching import note_failure
+from ..httpcache import default_cache
 from ..models import Job
 
 
@@ -13,60 +16,51 @@ WWR_CATEGORY_FEEDS = {
 }
 
 
-def fetch_wwr(categories: List[str]) -> Iterable[Job]:
-    jobs = []
-    for category in categories:
-        feed_url = WWR_CATEGORY_FEEDS.get(category)
-        if not feed_url:
+def _parse_feed(body: bytes) -> List[Job]:
+    jobs: List[Job] = []
+    feed = feedparser.parse(body)
+    for entry in getattr(feed, "entries", []) or []:
+        title = entry.get("title") or ""
+        link = entry.get("link") or ""
+        summary = entry.get("summary") or entry.get("description") or ""
+        company = ""
+        if ":" in title:
+            parts = title.split(":", 1)
+            company = parts[0].strip()
+            title = parts[1].strip()
+        
+        # Filter out obvious non-US jobs; the feed has no location field
+        if location_index().classify_text(f"{title} {company} {summary}") == NON_US:
             continue
-        try:
-            feed = feedparser.parse(feed_url)
-        except Exception:
-            continue
-        for entry in getattr(feed, "entries", []) or []:
-            title = entry.get("title") or ""
-            link = entry.get("link") or ""
-            summary = entry.get("summary") or entry.get("description") or ""
-            company = ""
-            if ":" in title:
-                parts = title.split(":", 1)
-                company = parts[0].strip()
-                title = parts[1].strip()
-            
-            # Filter out obvious non-US jobs
-            combined_text = f"{title} {company} {summary}".lower()
-            
-            # Skip jobs with European country mentions
-            if any(country in combined_text for country in [
-                "denmark", "sweden", "norway", "finland", "germany", "france", "spain", "italy",
-                "netherlands", "belgium", "switzerland", "austria", "poland", "czech", "hungary",
-                "romania", "bulgaria", "croatia", "slovenia", "slovakia", "estonia", "latvia",
-                "lithuania", "ireland", "portugal", "greece", "cyprus", "malta", "luxembourg",
-                "uk", "united kingdom", "england", "scotland", "wales", "northern ireland"
-            ]):
-                continue
-                
-            # Skip jobs with obvious non-US city mentions
-            if any(city in combined_text for city in [
-                "london", "berlin", "paris", "madrid", "rome", "amsterdam", "brussels",
-                "zurich", "vienna", "warsaw", "prague", "budapest", "bucharest", "sofia",
-                "zagreb", "ljubljana", "bratislava", "tallinn", "riga", "vilnius", "dublin",
-                "lisbon", "athens", "nicosia", "valletta", "copenhagen", "stockholm", "oslo",
-                "helsinki", "reykjavik", "moscow", "kyiv", "minsk"
-            ]):
-                continue
-            jobs.append(
-                Job(
-                    source="wwr",
-                    id=link,
-                    title=title,
-                    company=company,
-                    location="Remote",
-                    url=link,
-                    description=summary,
-                    posted_at_iso=str(entry.get("published") or entry.get("updated") or ""),
-                )
+        jobs.append(
+            Job(
+                source="wwr",
+                id=link,
+                title=title,
+                company=company,
+                location="Remote",
+                url=link,
+                description=summary,
+                posted_at_iso=str(entry.get("published") or entry.get("updated") or ""),
             )
+        )
     return jobs
 
 
+def fetch_wwr_category(category: str) -> List[Job]:
+    feed_url = WWR_CATEGORY_FEEDS.get(category)
+    if not feed_url:
+        return []
+    try:
+        # Fetch through the shared cache (validators + timeout); feedparser only parses
+        return default_cache().get_jobs(feed_url, _parse_feed, timeout=20)
+    except Exception as e:
+        note_failure(f"wwr:{category}", e)
+        return []
+
+
+def fetch_wwr(categories: List[str]) -> Iterable[Job]:
+    jobs: List[Job] = []
+    for category in categories:
+        jobs.extend(fetch_wwr_category(category))
+    return jobs
@@ -3,29 +3,144 @@ from __future__ import annotations
 import hashlib
 import os
 import sqlite3
-from typing import Iterable
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from .bloom import BloomFilter
 from .models import Job
 
+# How long a writer waits on another process's lock before "database is locked"
+BUSY_TIMEOUT_SECONDS = 30.0
+# Stay well under SQLITE_MAX_VARIABLE_NUMBER (999 on older builds)
+_IN_CHUNK = 500
+
+
+def connect(db_path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open ``db_path`` with the settings shared by every store in job_checker.db.
+
+    WAL lets the web process read while the poller writes; the busy timeout
+    makes competing writers wait instead of failing. A new database file gets
+    incremental auto-vacuum (the pragma is a no-op once tables exist), so
+    retention can free pages in bounded steps instead of a full VACUUM.
+    """
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=check_same_thread)
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
 
 class SeenStore:
-    def __init__(self, db_path: str = "job_checker.db") -> None:
+    """Keys of every job already notified (or bootstrapped).
+
+    Holds one connection for its lifetime, shared by the fetch threads (the
+    Greenhouse hydration check) under a lock.
+
+    With ``bloom_capacity`` a Bloom filter over the keys sits in front of the
+    table: a key it has never seen is new without a query, and only "maybe
+    seen" keys are confirmed in SQLite, which stays authoritative. The filter
+    is saved to ``bloom_path`` and, on load, catches up with rows inserted
+    since (by rowid) instead of being rebuilt.
+
+    ``namespace`` keeps separate histories in one table (one per profile);
+    the empty namespace uses the plain job keys.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "job_checker.db",
+        bloom_capacity: int = 1_000_000,
+        bloom_error_rate: float = 0.001,
+        bloom_path: Optional[str] = None,
+    ) -> None:
         self.db_path = db_path
+        self.bloom_path = bloom_path or f"{db_path}.bloom"
+        self._lock = threading.Lock()
+        # Writers to the filter (adds, syncs); lookups read it without locking
+        self._bloom_lock = threading.Lock()
+        self._conn = connect(db_path, check_same_thread=False)
         self._ensure()
+        self._bloom: Optional[BloomFilter] = None
+        self._bloom_dirty = False
+        # Lookups answered by the filter alone vs. sent to SQLite, and of those, keys found.
+        # Lookups run on several threads; a lock of their own keeps bloom-only
+        # lookups from queueing behind SQLite.
+        self._stats_lock = threading.Lock()
+        self.bloom_skips = 0
+        self.db_lookups = 0
+        self.db_hits = 0
+        if bloom_capacity > 0:
+            self._open_bloom(bloom_capacity, bloom_error_rate)
 
     def _ensure(self) -> None:
-        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS seen (
                     key TEXT PRIMARY KEY,
                     url TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    source TEXT
                 )
                 """
             )
-            conn.commit()
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(seen)")}
+            if "source" not in columns:
+                # Databases from before per-source retention; old rows keep NULL
+                conn.execute("ALTER TABLE seen ADD COLUMN source TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_created_at ON seen (created_at)")
+
+    def _open_bloom(self, capacity: int, error_rate: float) -> None:
+        bloom = BloomFilter.load(self.bloom_path)
+        with self._lock:
+            rows = self._conn.execute("SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM seen").fetchone()
+        total, last_rowid = rows
+        # Rows past the mark were deleted (rowids may be reused): start over
+        if bloom is not None and (
+            bloom.error_rate != error_rate or bloom.capacity < capacity or bloom.mark > last_rowid
+        ):
+            bloom = None
+        if bloom is None:
+            bloom = BloomFilter(max(capacity, 2 * total), error_rate)
+        self._bloom = bloom
+        self._sync_bloom()
+
+    def _fold(self, bloom: BloomFilter) -> int:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid, key FROM seen WHERE rowid > ? ORDER BY rowid", (bloom.mark,)
+            ).fetchall()
+        for rowid, key in rows:
+            bloom.add(key)
+            bloom.mark = rowid
+        return len(rows)
+
+    def _sync_bloom(self) -> None:
+        """Fold in rows inserted since the filter's mark, e.g. by another process."""
+        with self._bloom_lock:
+            bloom = self._bloom
+            folded = self._fold(bloom)
+            if bloom.saturated:
+                # Past its capacity the false-positive rate climbs; rebuild twice as
+                # large, and only swap it in once full so lookups never see it partial
+                fresh = BloomFilter(2 * bloom.count, bloom.error_rate)
+                self._fold(fresh)
+                self._bloom = fresh
+            self._bloom_dirty = self._bloom_dirty or bool(folded)
+
+    def save_bloom(self) -> None:
+        """Write the filter file if keys were added; ``close`` does this too."""
+        with self._bloom_lock:
+            if self._bloom is not None and self._bloom_dirty:
+                self._bloom.save(self.bloom_path)
+                self._bloom_dirty = False
+
+    def close(self) -> None:
+        self.save_bloom()
+        with self._lock:
+            self._conn.close()
 
     @staticmethod
     def make_key(job: Job) -> str:
@@ -34,25 +149,122 @@ class SeenStore:
         composite = f"{job.source}|{job.company.lower()}|{job.title.lower()}|{job.location.lower()}"
         return hashlib.sha256(composite.encode("utf-8")).hexdigest()
 
-    def is_new(self, job: Job) -> bool:
-        key = self.make_key(job)
-        with sqlite3.connect(self.db_path) as conn:
-            cur = conn.execute("SELECT 1 FROM seen WHERE key = ?", (key,))
-            row = cur.fetchone()
-            return row is None
+    @classmethod
+    def key(cls, job: Job, namespace: str = "") -> str:
+        """make_key, prefixed with ``namespace`` if there is one."""
+        key = cls.make_key(job)
+        return f"{namespace}:{key}" if namespace else key
 
-    def add(self, jobs: Iterable[Job]) -> None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executemany(
-                "INSERT OR IGNORE INTO seen (key, url) VALUES (?, ?)",
-                [
-                    (
-                        self.make_key(job),
-                        job.url,
-                    )
-                    for job in jobs
-                ],
+    def _count(self, bloom_skips: int = 0, db_lookups: int = 0, db_hits: int = 0) -> None:
+        with self._stats_lock:
+            self.bloom_skips += bloom_skips
+            self.db_lookups += db_lookups
+            self.db_hits += db_hits
+
+    def lookup_stats(self) -> Tuple[int, int, int]:
+        """``(bloom_skips, db_lookups, db_hits)`` read together."""
+        with self._stats_lock:
+            return self.bloom_skips, self.db_lookups, self.db_hits
+
+    def is_new(self, job: Job, namespace: str = "") -> bool:
+        key = self.key(job, namespace)
+        if self._bloom is not None and key not in self._bloom:
+            self._count(bloom_skips=1)
+            return True
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone()
+        self._count(db_lookups=1, db_hits=int(row is not None))
+        return row is None
+
+    def seen_keys(self, keys: Sequence[str]) -> set:
+        """The subset of ``keys`` already stored, in chunked IN queries."""
+        skipped = 0
+        if self._bloom is not None:
+            self._sync_bloom()
+            maybe = [key for key in keys if key in self._bloom]
+            skipped = len(keys) - len(maybe)
+            keys = maybe
+        seen = set()
+        with self._lock:
+            for i in range(0, len(keys), _IN_CHUNK):
+                chunk = keys[i:i + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key FROM seen WHERE key IN ({placeholders})", chunk)
+                seen.update(key for key, in rows)
+        self._count(bloom_skips=skipped, db_lookups=len(keys), db_hits=len(seen))
+        return seen
+
+    def filter_new(self, jobs: Iterable[Job], namespace: str = "") -> List[Job]:
+        """Jobs whose key is not stored yet, in input order."""
+        jobs = list(jobs)
+        keys = [self.key(job, namespace) for job in jobs]
+        seen = self.seen_keys(keys)
+        return [job for job, key in zip(jobs, keys) if key not in seen]
+
+    def add(
+        self,
+        jobs: Iterable[Job],
+        also: Optional[Callable[[sqlite3.Connection], None]] = None,
+        namespace: str = "",
+    ) -> None:
+        """Mark ``jobs`` seen in one transaction; ``also`` writes more in that same transaction."""
+        rows = [(self.key(job, namespace), job.url, job.source) for job in jobs]
+        if not rows and also is None:
+            return
+        with self._lock, self._conn as conn:
+            conn.executemany("INSERT OR IGNORE INTO seen (key, url, source) VALUES (?, ?, ?)", rows)
+            if also is not None:
+                also(conn)
+        if self._bloom is not None:
+            # Added directly too, in case deletes let SQLite reuse rowids below the mark
+            with self._bloom_lock:
+                for key, _, _ in rows:
+                    self._bloom.add(key)
+                self._bloom_dirty = True
+            self._sync_bloom()
+
+
+class PayloadFingerprints:
+    """Body digest of the last response the pipeline fully processed, per URL.
+
+    ``config_hash`` ties fingerprints to the filter config that processed them,
+    so editing config.yml makes every payload count as changed again.
+    """
+
+    def __init__(self, config_hash: str, db_path: str = "job_checker.db") -> None:
+        self.config_hash = config_hash
+        self.db_path = db_path
+        self._ensure()
+
+    def _ensure(self) -> None:
+        with connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS payload_fingerprints (
+                    url TEXT PRIMARY KEY,
+                    digest TEXT,
+                    config_hash TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """
             )
             conn.commit()
 
+    def load(self) -> Dict[str, str]:
+        with connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT url, digest FROM payload_fingerprints WHERE config_hash = ?",
+                (self.config_hash,),
+            ).fetchall()
+        return {url: digest for url, digest in rows}
 
+    def update(self, payloads: Iterable[Tuple[str, str]]) -> None:
+        with connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO payload_fingerprints (url, digest, config_hash, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                [(url, digest, self.config_hash) for url, digest in payloads],
+            )
+            conn.commit()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import html
+import re
+from typing import List, Optional
+
+# Upper bound on the description text kept per job
+MAX_DESCRIPTION_CHARS = 6000
+
+_DROP_ELEMENTS = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.S | re.I)
+_BLOCK_TAGS = re.compile(
+    r"<\s*/?\s*(?:p|div|br|li|ul|ol|h[1-6]|tr|table|section|article|header|footer|blockquote)\b[^>]*>", re.I
+)
+_TAGS = re.compile(r"<[^>]*>")
+_SPACES = re.compile(r"\s+")
+_BREAK = "\n"
+
+# Section headings worth keeping when a description must be cut, and those to drop first
+_RELEVANT_HEADING = re.compile(
+    r"requirement|qualification|responsibilit|what you|you will|you'll|about the (?:role|job|position)"
+    r"|the role|experience|skills|location|remote|eligib|employment|schedule",
+    re.I,
+)
+_BOILERPLATE_HEADING = re.compile(
+    r"benefit|perk|about us|about the company|who we are|our company|equal opportunity|eeo|diversity"
+    r"|accommodation|privacy|how to apply",
+    re.I,
+)
+_HEADING_MAX_CHARS = 80
+
+
+def html_to_blocks(raw: str) -> List[str]:
+    """Plain-text paragraphs of an HTML (or plain) description, whitespace collapsed."""
+    text = raw
+    if "<" in text:
+        text = _DROP_ELEMENTS.sub(" ", text)
+        text = _BLOCK_TAGS.sub(_BREAK, text)
+        text = _TAGS.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    blocks = []
+    for line in text.split(_BREAK):
+        line = _SPACES.sub(" ", line).strip()
+        if line:
+            blocks.append(line)
+    return blocks
+
+
+def _priorities(blocks: List[str]) -> List[int]:
+    # 0 = intro or a relevant section, 1 = unlabelled, 2 = boilerplate section
+    priorities = []
+    section = 1
+    for i, block in enumerate(blocks):
+        if len(block) <= _HEADING_MAX_CHARS:
+            if _BOILERPLATE_HEADING.search(block):
+                section = 2
+            elif _RELEVANT_HEADING.search(block):
+                section = 0
+        priorities.append(0 if i == 0 else section)
+    return priorities
+
+
+def normalize_description(raw: Optional[str], limit: int = MAX_DESCRIPTION_CHARS) -> Optional[str]:
+    """Strip markup, collapse whitespace and keep at most ``limit`` characters.
+
+    When the text is too long, paragraphs are kept by section relevance (the
+    intro and requirements/location sections first, benefits and EEO boilerplate
+    last) and emitted in their original order. Returns None if nothing is left.
+    """
+    if not raw:
+        return None
+    blocks = html_to_blocks(raw)
+    if not blocks:
+        return None
+    text = " ".join(blocks)
+    if len(text) <= limit:
+        return text
+
+    priorities = _priorities(blocks)
+    kept: List[Optional[str]] = [None] * len(blocks)
+    budget = limit
+    for i in sorted(range(len(blocks)), key=lambda i: (priorities[i], i)):
+        if budget <= 0:
+            break
+        block = blocks[i]
+        if len(block) >= budget:
+            # Paragraph too long for what is left: keep its head, cut at a word boundary
+            block = block[:budget].rsplit(" ", 1)[0]
+        kept[i] = block
+        budget -= len(block) + 1
+    return " ".join(block for block in kept if block)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from dateutil import parser as dateparser
+
+_Parser = Callable[[str], Optional[datetime]]
+
+# Epoch values above this are milliseconds (year ~5138 in seconds)
+_EPOCH_MS_THRESHOLD = 100_000_000_000
+
+
+def _utc(dt: datetime) -> datetime:
+    # Sources without an offset publish UTC
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def from_epoch(value: Union[int, float]) -> datetime:
+    """UTC datetime from epoch seconds or milliseconds."""
+    seconds = value / 1000 if abs(value) >= _EPOCH_MS_THRESHOLD else value
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+
+def _parse_epoch(value: str) -> Optional[datetime]:
+    if not value.isdigit():
+        return None
+    return from_epoch(int(value))
+
+
+def _parse_iso(value: str) -> Optional[datetime]:
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_rfc822(value: str) -> Optional[datetime]:
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+# Known formats per source, tried in order before the generic fallback
+_SOURCE_PARSERS: Dict[str, Tuple[_Parser, ...]] = {
+    "lever": (_parse_epoch, _parse_iso),
+    "greenhouse": (_parse_iso,),
+    "remotive": (_parse_iso,),
+    "wwr": (_parse_rfc822,),
+}
+_DEFAULT_PARSERS: Tuple[_Parser, ...] = (_parse_iso, _parse_rfc822, _parse_epoch)
+
+
+@lru_cache(maxsize=8192)
+def _parse_cached(value: str, source: str) -> Optional[datetime]:
+    for parse in _SOURCE_PARSERS.get(source, _DEFAULT_PARSERS):
+        dt = parse(value)
+        if dt is not None:
+            return _utc(dt)
+    try:
+        return _utc(dateparser.parse(value))
+    except Exception:
+        return None
+
+
+def parse_timestamp(value: Optional[str], source: str = "") -> Optional[datetime]:
+    """Parse a posting timestamp into an aware UTC datetime, or None if unparseable.
+
+    Each source's native format is tried first (fromisoformat, RFC 822, epoch);
+    dateutil only sees strings none of them accept. Results are memoized, since
+    the same boards repeat the same timestamps every cycle.
+    """
+    if not value:
+        return None
+    return _parse_cached(value.strip(), source)
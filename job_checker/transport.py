@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+from .metrics import REGISTRY, fetch_source
+
+DEFAULT_POOL_MAXSIZE = 10
+# Distinct hosts kept warm: Greenhouse, Lever, Remotive, WWR, Telegram, paid APIs
+POOL_CONNECTIONS = 16
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+HTTP_RESPONSES = REGISTRY.counter(
+    "job_checker_http_responses_total", "Source HTTP responses by status code", ("source", "code")
+)
+HTTP_BYTES = REGISTRY.counter(
+    "job_checker_http_response_bytes_total", "Decoded source response body bytes", ("source",)
+)
+
+
+def _observe_response(resp: requests.Response, *args: object, **kwargs: object) -> None:
+    # Labelled by the fetch task making the request, or by host outside one
+    source = fetch_source.get() or urlsplit(resp.url).netloc
+    HTTP_RESPONSES.inc(source=source, code=str(resp.status_code))
+    # No source streams, so the body is read here rather than by the caller
+    HTTP_BYTES.inc(len(resp.content), source=source)
+
+
+class _Retry(Retry):
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            # Only a 429 guarantees the POST was not acted on, so only that is resent
+            return status_code == 429 and 429 in (self.status_forcelist or ())
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _make_retry(statuses: Tuple[int, ...] = RETRY_STATUSES) -> Retry:
+    kwargs = dict(
+        total=3,
+        connect=3,
+        read=2,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=statuses,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return _Retry(backoff_jitter=0.5, **kwargs)
+    except TypeError:
+        # urllib3 < 2 has no jitter support
+        return _Retry(**kwargs)
+
+
+def build_session(pool_maxsize: int, statuses: Tuple[int, ...] = RETRY_STATUSES) -> requests.Session:
+    """A new keep-alive session; most callers want the shared ``get_session``."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        max_retries=_make_retry(statuses),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # gzip/deflate always; br when the optional brotli package is installed
+    session.headers.update(make_headers(accept_encoding=True))
+    session.headers["User-Agent"] = "job-checker/1.0"
+    return session
+
+
+_session: Optional[requests.Session] = None
+_delivery_session: Optional[requests.Session] = None
+_pool_maxsize = DEFAULT_POOL_MAXSIZE
+_lock = threading.Lock()
+
+
+def configure_session(pool_maxsize: int) -> None:
+    """Resize the per-host keep-alive pools; a no-op when the size is unchanged."""
+    global _session, _pool_maxsize
+    pool_maxsize = max(1, pool_maxsize)
+    with _lock:
+        if pool_maxsize == _pool_maxsize and _session is not None:
+            return
+        old, _session, _pool_maxsize = _session, None, pool_maxsize
+    if old is not None:
+        old.close()
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session with bounded retries used by every source and notifier."""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = build_session(_pool_maxsize)
+            _session.hooks["response"].append(_observe_response)
+        return _session
+
+
+def get_delivery_session() -> requests.Session:
+    """Keep-alive session for notifiers, retrying connection errors only.
+
+    Notifiers handle 429 and 5xx themselves: a 429's retry_after pauses the
+    whole chat, where urllib3 would resend the one request at once.
+    """
+    global _delivery_session
+    with _lock:
+        if _delivery_session is None:
+            _delivery_session = build_session(DEFAULT_POOL_MAXSIZE, statuses=())
+        return _delivery_session
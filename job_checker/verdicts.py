@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .models import Job
+from .storage import connect
+
+
+@dataclass(frozen=True)
+class Verdict:
+    """Outcome of the time-independent filter stages for one job's content."""
+
+    passed: bool
+    score: int
+    stored_at: float
+
+
+def content_key(job: Job, plan_fingerprint: str) -> str:
+    """Hash of the fields the filters read, scoped to one filter plan.
+
+    The description is hashed in its stored form, compressed when long, so a
+    lookup never decompresses it; equal text always packs to equal bytes.
+    """
+    h = hashlib.sha256(plan_fingerprint.encode("utf-8"))
+    for part in (job.title, job.company, job.location or ""):
+        h.update(b"\x1f")
+        h.update(part.encode("utf-8"))
+    packed = job.packed_description
+    if isinstance(packed, bytes):
+        h.update(b"\x1fz")
+        h.update(packed)
+    else:
+        h.update(b"\x1ft")
+        h.update((packed or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+class VerdictCache:
+    """LRU cache of filter verdicts with a TTL, optionally persisted to SQLite.
+
+    In ``--loop`` mode the same postings come back every cycle; a hit lets the
+    pipeline skip every stage except the clock- and store-dependent ones. With
+    ``db_path`` the unexpired entries are loaded at start-up and ``flush`` writes
+    new ones back, so a restart begins warm, over one connection held for the
+    cache's lifetime.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 20000,
+        ttl_seconds: float = 86400.0,
+        db_path: Optional[str] = None,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, Verdict]" = OrderedDict()
+        self._dirty: Dict[str, Verdict] = {}
+        self._lock = threading.Lock()
+        # Flushes run while profiles keep reading and filling the cache
+        self._db_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._conn = connect(db_path, check_same_thread=False)
+            self._ensure()
+            self._load()
+
+    def _ensure(self) -> None:
+        with self._db_lock, self._conn as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS filter_verdicts (
+                    key TEXT PRIMARY KEY,
+                    passed INTEGER,
+                    score INTEGER,
+                    stored_at REAL
+                )
+                """
+            )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._db_lock:
+                self._conn.close()
+
+    def _load(self) -> None:
+        cutoff = time.time() - self.ttl_seconds
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT key, passed, score, stored_at FROM filter_verdicts"
+                " WHERE stored_at >= ? ORDER BY stored_at DESC LIMIT ?",
+                (cutoff, self.max_entries),
+            ).fetchall()
+        # Oldest first, so the LRU order matches insertion age
+        for key, passed, score, stored_at in reversed(rows):
+            self._entries[key] = Verdict(bool(passed), int(score), float(stored_at))
+
+    def get(self, key: str, now: Optional[float] = None) -> Optional[Verdict]:
+        now = time.time() if now is None else now
+        with self._lock:
+            verdict = self._entries.get(key)
+            if verdict is None:
+                return None
+            if now - verdict.stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return verdict
+
+    def put(self, key: str, passed: bool, score: int, now: Optional[float] = None) -> None:
+        verdict = Verdict(passed, score, time.time() if now is None else now)
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self.db_path:
+                self._dirty[key] = verdict
+
+    def flush(self) -> None:
+        """Persist verdicts added since the last flush and drop expired rows."""
+        if not self.db_path:
+            return
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        cutoff = time.time() - self.ttl_seconds
+        with self._db_lock, self._conn as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO filter_verdicts (key, passed, score, stored_at) VALUES (?, ?, ?, ?)",
+                [(key, int(v.passed), v.score, v.stored_at) for key, v in dirty.items()],
+            )
+            conn.execute("DELETE FROM filter_verdicts WHERE stored_at < ?", (cutoff,))
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Run against the checkout, as the benchmarks do, without installing it
+sys.path.insert(0, str(Path(__file__).parent.parent))
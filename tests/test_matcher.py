@@ -0,0 +1,68 @@
+"""KeywordMatcher must find exactly what plain substring checks find."""
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from job_checker import matcher as matcher_module
+from job_checker.matcher import KeywordMatcher, SplitMatcher
+
+KEYWORDS = [
+    "python", "py", "go", "golang", "rust", "c++", "c#", ".net", "node.js", "k8s", "kubernetes",
+    "part-time", "part time", "1099", "c2c", "eu", "europe", "us", "u.s.", "intern", "internship",
+    "ml", "mlops", "data", "database", "a", "aa", "aaa",
+]
+ALPHABET = "abceglnoprstuy .-+#19k2"
+
+
+def _texts(count: int = 400):
+    rng = random.Random(7)
+    words = KEYWORDS + ["the", "team", "prometheus", "neural", "europa", "usa", "pythonic"]
+    for _ in range(count):
+        if rng.random() < 0.5:
+            yield " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        else:
+            yield "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 60)))
+
+
+def _whole_word(text: str, keyword: str) -> bool:
+    return re.search(r"(?<![^\W_])" + re.escape(keyword) + r"(?![^\W_])", text) is not None
+
+
+@pytest.fixture(params=["ahocorasick", "regex"])
+def backend(request, monkeypatch):
+    if request.param == "regex":
+        monkeypatch.setattr(matcher_module, "ahocorasick", None)
+    elif matcher_module.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    return request.param
+
+
+def test_find_matches_substring_checks(backend):
+    m = KeywordMatcher(KEYWORDS)
+    for text in _texts():
+        assert m.find(text) == {kw for kw in KEYWORDS if kw in text}, text
+
+
+def test_find_matches_whole_word_checks(backend):
+    m = KeywordMatcher(KEYWORDS, whole_words=True)
+    for text in _texts():
+        assert m.find(text) == {kw for kw in KEYWORDS if _whole_word(text, kw)}, text
+
+
+def test_keywords_are_lowercased_and_empty_ones_ignored(backend):
+    m = KeywordMatcher(["Python", "", "K8S"])
+    assert m.keywords == {"python", "k8s"}
+    assert m.find("python on k8s") == {"python", "k8s"}
+    assert m.find("") == frozenset()
+    assert KeywordMatcher([]).find("anything") == frozenset()
+
+
+def test_split_matcher_agrees_with_two_matchers(backend):
+    substrings, words = KEYWORDS[:18], KEYWORDS[10:]
+    split = SplitMatcher(substrings, words)
+    plain, whole = KeywordMatcher(substrings), KeywordMatcher(words, whole_words=True)
+    for text in _texts():
+        assert split.find(text) == (plain.find(text), whole.find(text)), text
@@ -0,0 +1,245 @@
+"""Notifier channels against local stand-ins, and per-channel isolation in delivery."""
+from __future__ import annotations
+
+import json
+import socketserver
+import threading
+import time
+from email import message_from_bytes
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from job_checker.config import AppConfig, Config, FiltersConfig, LocationsConfig, SourcesConfig, TelegramConfig
+from job_checker.main import make_outbox_workers
+from job_checker.models import Job
+from job_checker.notifiers import Delivery, EmailNotifier, FanOut, Notifier, WebhookNotifier
+from job_checker.outbox import Outbox, OutboxMessage
+from job_checker.storage import connect
+
+
+def _job(i: int) -> Job:
+    return Job("lever", str(i), f"Backend Engineer {i}", "Acme", "Remote - US", f"https://jobs.example/{i}")
+
+
+# --- webhook -----------------------------------------------------------------
+
+
+class _Hook(BaseHTTPRequestHandler):
+    # Status codes to answer with, in order; 204 once they run out
+    statuses: List[int] = []
+    received: List[Tuple[str, bytes]] = []
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.received.append((self.headers["Content-Type"], body))
+        self.send_response(self.statuses.pop(0) if self.statuses else 204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def hook_server() -> Iterator[Tuple[str, type]]:
+    handler = type("Hook", (_Hook,), {"statuses": [], "received": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/hook", handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_webhook_posts_one_json_payload_per_group(hook_server):
+    url, handler = hook_server
+    notifier = WebhookNotifier(url, headers={"X-Token": "t"})
+    jobs = [_job(1), _job(2)]
+    [delivery] = notifier.render(jobs, "[US-REMOTE]", False)
+    assert delivery.jobs == tuple(jobs)
+    assert notifier.deliver(delivery.target, delivery.text)
+    [(content_type, body)] = handler.received
+    assert content_type == "application/json"
+    payload = json.loads(body)
+    assert payload["scope"] == "[US-REMOTE]"
+    assert payload["level"] == "[CORE]"
+    assert [j["url"] for j in payload["jobs"]] == [job.url for job in jobs]
+
+
+def test_webhook_retries_server_errors_but_not_client_errors(hook_server):
+    url, handler = hook_server
+    notifier = WebhookNotifier(url, max_attempts=3)
+    handler.statuses[:] = [503]
+    assert notifier.deliver(url, "{}")
+    assert len(handler.received) == 2
+    handler.statuses[:] = [400]
+    assert not notifier.deliver(url, "{}")
+    assert len(handler.received) == 3
+
+
+# --- email -------------------------------------------------------------------
+
+
+class _SmtpSink(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: accepts every message and records it."""
+
+    messages: List[Tuple[str, List[str], bytes]] = []
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self) -> None:
+        self._reply("220 sink ready")
+        sender, recipients = "", []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii").strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 sink")
+            elif verb == "MAIL":
+                sender, recipients = command.split(":", 1)[1].strip(" <>"), []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(command.split(":", 1)[1].strip(" <>"))
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 end with .")
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b".\r\n", b""):
+                        break
+                    data.append(chunk[1:] if chunk.startswith(b"..") else chunk)
+                self.messages.append((sender, recipients, b"".join(data)))
+                self._reply("250 queued")
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+@pytest.fixture
+def smtp_sink() -> Iterator[Tuple[int, type]]:
+    handler = type("Sink", (_SmtpSink,), {"messages": []})
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1], handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_email_sends_a_digest_per_group_over_one_connection(smtp_sink):
+    port, handler = smtp_sink
+    notifier = EmailNotifier("127.0.0.1", port, "jobs@example.com", ["a@example.com", "b@example.com"])
+    try:
+        for is_stretch in (False, True):
+            [delivery] = notifier.render([_job(1), _job(2)], "[AUSTIN]", is_stretch)
+            assert notifier.deliver(delivery.target, delivery.text)
+    finally:
+        notifier.close()
+    assert len(handler.messages) == 2
+    sender, recipients, data = handler.messages[0]
+    assert sender == "jobs@example.com"
+    assert recipients == ["a@example.com", "b@example.com"]
+    msg = message_from_bytes(data, policy=default_policy)
+    assert msg["Subject"] == "[AUSTIN] [CORE] 2 new jobs"
+    assert "https://jobs.example/2" in msg.get_content()
+    assert message_from_bytes(handler.messages[1][2], policy=default_policy)["Subject"].startswith("[AUSTIN] [STRETCH]")
+
+
+def test_email_reports_failure_when_the_server_is_gone():
+    # Nothing listens on a port the OS just handed out and took back
+    with socketserver.TCPServer(("127.0.0.1", 0), socketserver.BaseRequestHandler) as probe:
+        port = probe.server_address[1]
+    notifier = EmailNotifier("127.0.0.1", port, "jobs@example.com", ["a@example.com"], timeout=1.0, max_attempts=1)
+    [delivery] = notifier.render([_job(1)], "[AUSTIN]", False)
+    assert not notifier.deliver(delivery.target, delivery.text)
+
+
+# --- fan-out -----------------------------------------------------------------
+
+
+class _Channel(Notifier):
+    def __init__(self, name: str, behaviour: str) -> None:
+        self.name = name
+        self.behaviour = behaviour
+        self.release = threading.Event()
+        self.delivered: List[str] = []
+
+    def render(self, jobs, scope_tag, is_stretch):
+        return [Delivery(f"{self.name}-target", f"{scope_tag} {len(jobs)}", tuple(jobs))]
+
+    def deliver(self, target: str, text: str) -> bool:
+        if self.behaviour == "hang":
+            self.release.wait(10)
+        elif self.behaviour == "raise":
+            raise RuntimeError("channel down")
+        self.delivered.append(text)
+        return True
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _attempts(outbox: Outbox, channel: str) -> List[Tuple[int, str]]:
+    with connect(outbox.db_path) as conn:
+        return conn.execute(
+            "SELECT attempts, COALESCE(last_error, '') FROM outbox WHERE channel = ? ORDER BY id", (channel,)
+        ).fetchall()
+
+
+def _config() -> Config:
+    return Config(AppConfig(outbox_max_attempts=2), FiltersConfig(), LocationsConfig(), SourcesConfig(), TelegramConfig())
+
+
+def test_fanout_isolates_a_hanging_and_a_raising_channel(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    hanging, raising, healthy = _Channel("slow", "hang"), _Channel("broken", "raise"), _Channel("ok", "ok")
+    notifiers = [hanging, raising, healthy]
+    groups = [([_job(1)], "[AUSTIN]", False), ([], "[AUSTIN]", True), ([_job(2), _job(3)], "[US-REMOTE]", False)]
+    rendered = FanOut(notifiers).render(groups)
+    # Empty groups render nothing; every channel gets every other group
+    assert sorted(channel for channel, _ in rendered) == ["broken", "broken", "ok", "ok", "slow", "slow"]
+    messages = [
+        OutboxMessage.for_jobs(channel, d.target, d.text, [job.url for job in d.jobs]) for channel, d in rendered
+    ]
+    with connect(outbox.db_path) as conn:
+        outbox.enqueue(conn, messages)
+    workers = make_outbox_workers(_config(), outbox, notifiers)
+    for worker in workers:
+        worker.start()
+    outbox.notify()
+    try:
+        assert _wait_until(lambda: len(healthy.delivered) == 2 and _attempts(outbox, "broken")[0][0] == 1)
+        # The healthy channel is done while the slow one is still stuck on its first message
+        assert healthy.delivered == ["[AUSTIN] 1", "[US-REMOTE] 2"]
+        assert hanging.delivered == []
+        # The raising channel's first message waits for a retry, and its second waits behind it
+        assert _attempts(outbox, "broken") == [(1, "broken: RuntimeError"), (0, "")]
+        assert outbox.counts() == {"sent": 2, "pending": 4}
+    finally:
+        hanging.release.set()
+        for worker in workers:
+            worker.stop()
+    assert _wait_until(lambda: len(hanging.delivered) >= 1)
+    assert hanging.delivered[0] == "[AUSTIN] 1"
+    outbox.close()
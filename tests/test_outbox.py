@@ -0,0 +1,95 @@
+"""Outbox round trips: enqueue, delivery, retries and ordering per target."""
+from __future__ import annotations
+
+import time
+
+from job_checker.outbox import Outbox, OutboxMessage, OutboxWorker
+from job_checker.storage import connect
+
+
+def _message(channel: str, target: str, text: str) -> OutboxMessage:
+    return OutboxMessage.for_jobs(channel, target, text, [text])
+
+
+def _enqueue(outbox: Outbox, *messages: OutboxMessage) -> None:
+    with connect(outbox.db_path) as conn:
+        outbox.enqueue(conn, messages)
+
+
+def test_enqueue_is_idempotent_per_destination_and_jobs(tmp_path):
+    outbox = Outbox(str(tmp_path / "o.db"))
+    first = OutboxMessage.for_jobs("telegram", "chat", "text", ["b", "a"])
+    again = OutboxMessage.for_jobs("telegram", "chat", "re-rendered text", ["a", "b"])
+    assert first.key == again.key
+    assert first.key != OutboxMessage.for_jobs("email", "chat", "text", ["a", "b"]).key
+    _enqueue(outbox, first)
+    _enqueue(outbox, again)
+    [row] = outbox.due()
+    assert (row.channel, row.target, row.text, row.attempts) == ("telegram", "chat", "text", 0)
+    outbox.close()
+
+
+def test_enqueue_rolls_back_with_the_callers_transaction(tmp_path):
+    outbox = Outbox(str(tmp_path / "o.db"))
+    conn = connect(outbox.db_path)
+    try:
+        with conn:
+            outbox.enqueue(conn, [_message("telegram", "chat", "lost")])
+            raise RuntimeError("crash before commit")
+    except RuntimeError:
+        pass
+    finally:
+        conn.close()
+    assert outbox.due() == []
+    outbox.close()
+
+
+def test_worker_delivers_in_order_and_marks_sent(tmp_path):
+    outbox = Outbox(str(tmp_path / "o.db"))
+    _enqueue(outbox, *(_message("telegram", "chat", f"m{i}") for i in range(3)), _message("email", "a@x", "e0"))
+    sent = []
+    worker = OutboxWorker(outbox, {"telegram": lambda t, text: sent.append((t, text)) or True}, channel="telegram")
+    assert worker.drain() == 3
+    assert sent == [("chat", "m0"), ("chat", "m1"), ("chat", "m2")]
+    # Another channel's message is left for that channel's worker
+    assert [row.text for row in outbox.due()] == ["e0"]
+    assert outbox.counts() == {"sent": 3, "pending": 1}
+    outbox.close()
+
+
+def test_failure_backs_off_and_holds_later_messages_to_the_same_target(tmp_path):
+    outbox = Outbox(str(tmp_path / "o.db"))
+    _enqueue(outbox, _message("hook", "u1", "a"), _message("hook", "u1", "b"), _message("hook", "u2", "c"))
+    delivered = []
+
+    def flaky(target: str, text: str) -> bool:
+        if text == "a":
+            raise ConnectionError("down")
+        delivered.append(text)
+        return True
+
+    worker = OutboxWorker(outbox, {"hook": flaky}, max_attempts=2)
+    assert worker.drain() == 1
+    assert delivered == ["c"]
+    # "a" waits out its backoff, and "b" waits behind it
+    assert outbox.due() == []
+    [a, b] = outbox.due(now=time.time() + 31)
+    assert (a.text, a.attempts, b.text) == ("a", 1, "b")
+    # Once the backoff is over, the second failure reaches max_attempts: "a" is abandoned and "b" goes out
+    with connect(outbox.db_path) as conn:
+        conn.execute("UPDATE outbox SET next_attempt_at = 0")
+    assert worker.drain() == 0
+    assert outbox.counts() == {"failed": 1, "pending": 1, "sent": 1}
+    assert worker.drain() == 1
+    assert delivered == ["c", "b"]
+    outbox.close()
+
+
+def test_outbox_survives_reopening(tmp_path):
+    path = str(tmp_path / "o.db")
+    outbox = Outbox(path)
+    _enqueue(outbox, _message("telegram", "chat", "kept"))
+    outbox.close()
+    reopened = Outbox(path)
+    assert [row.text for row in reopened.due()] == ["kept"]
+    reopened.close()
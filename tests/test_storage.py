@@ -0,0 +1,115 @@
+"""SeenStore round trips through SQLite."""
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from job_checker.models import Job
+from job_checker.storage import SeenStore
+
+
+def _jobs(start: int, stop: int):
+    return [
+        Job("lever", str(i), f"Engineer {i}", "Acme", "Remote", f"https://jobs.example/{i}") for i in range(start, stop)
+    ]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "seen.db")
+
+
+def test_add_then_lookup(db_path):
+    store = SeenStore(db_path, bloom_capacity=0)
+    jobs = _jobs(0, 1200)
+    assert store.filter_new(jobs) == jobs
+    store.add(jobs[:700])
+    # More keys than one IN chunk, answered in input order
+    assert store.filter_new(jobs) == jobs[700:]
+    assert not store.is_new(jobs[0])
+    assert store.is_new(jobs[-1])
+    store.close()
+
+
+def test_namespaces_keep_separate_histories(db_path):
+    store = SeenStore(db_path, bloom_capacity=0)
+    jobs = _jobs(0, 3)
+    store.add(jobs, namespace="remote")
+    assert store.filter_new(jobs) == jobs
+    assert store.filter_new(jobs, namespace="remote") == []
+    assert store.filter_new(jobs, namespace="austin") == jobs
+    store.close()
+
+
+def test_add_writes_the_extra_rows_in_the_same_transaction(db_path):
+    store = SeenStore(db_path, bloom_capacity=0)
+
+    def fail(conn: sqlite3.Connection) -> None:
+        conn.execute("CREATE TABLE IF NOT EXISTS side (x)")
+        conn.execute("INSERT INTO side VALUES (1)")
+        raise RuntimeError("crash mid-transaction")
+
+    with pytest.raises(RuntimeError):
+        store.add(_jobs(0, 2), also=fail)
+    assert store.filter_new(_jobs(0, 2)) == _jobs(0, 2)
+    store.add(_jobs(0, 2), also=lambda conn: conn.execute("CREATE TABLE side (x)"))
+    assert store.filter_new(_jobs(0, 2)) == []
+    store.close()
+
+
+def test_history_survives_reopening(db_path):
+    store = SeenStore(db_path, bloom_capacity=0)
+    store.add(_jobs(0, 5))
+    store.close()
+    reopened = SeenStore(db_path, bloom_capacity=0)
+    assert reopened.filter_new(_jobs(0, 10)) == _jobs(5, 10)
+    reopened.close()
+
+
+def test_bloom_answers_new_keys_without_sqlite(db_path):
+    store = SeenStore(db_path, bloom_capacity=10_000)
+    seen, fresh = _jobs(0, 100), _jobs(100, 1100)
+    store.add(seen)
+    assert store.filter_new(seen + fresh) == fresh
+    bloom_skips, db_lookups, db_hits = store.lookup_stats()
+    # Every seen key goes to SQLite; all but a few false positives of the new ones do not
+    assert db_hits == 100
+    assert bloom_skips >= 990 and bloom_skips + db_lookups == 1100
+    store.close()
+
+
+def test_bloom_is_saved_and_catches_up_with_other_writers(db_path):
+    store = SeenStore(db_path, bloom_capacity=10_000)
+    store.add(_jobs(0, 10))
+    store.close()
+    # Another process marks more jobs while this one is down
+    other = SeenStore(db_path, bloom_capacity=0)
+    other.add(_jobs(10, 20))
+    other.close()
+    reopened = SeenStore(db_path, bloom_capacity=10_000)
+    assert reopened._bloom.mark == 20
+    assert reopened.filter_new(_jobs(0, 30)) == _jobs(20, 30)
+    reopened.close()
+
+
+def test_bloom_is_rebuilt_when_rows_behind_its_mark_were_deleted(db_path):
+    store = SeenStore(db_path, bloom_capacity=10_000)
+    store.add(_jobs(0, 10))
+    store.close()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM seen WHERE rowid > 5")
+    reopened = SeenStore(db_path, bloom_capacity=10_000)
+    assert reopened._bloom.mark == 5
+    assert reopened.filter_new(_jobs(0, 10)) == _jobs(5, 10)
+    reopened.close()
+
+
+def test_saturated_bloom_grows_without_losing_keys(db_path):
+    store = SeenStore(db_path, bloom_capacity=50)
+    jobs = _jobs(0, 400)
+    for i in range(0, 400, 40):
+        store.add(jobs[i:i + 40])
+    assert store._bloom.capacity >= 400
+    assert store.filter_new(jobs) == []
+    store.close()
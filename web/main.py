@@ -1,7 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
@@ -15,7 +15,11 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 try:
     from job_checker.main import gather_jobs, apply_keyword_filters
+    from job_checker.archive import JobArchive
     from job_checker.config import load_config
+    from job_checker.filtering import filter_plan
+    from job_checker.geo import AUSTIN
+    from job_checker.metrics import CONTENT_TYPE, render as render_metrics
     from job_checker.models import Job
     JOB_CHECKER_AVAILABLE = True
 except ImportError:
@@ -91,6 +95,34 @@ MOCK_JOBS = [
     }
 ]
 
+_config_cache = {}
+
+def get_config():
+    """Load config.yml once and reuse it (and its compiled filter plan) until the file changes"""
+    config_path = Path(__file__).parent.parent / "config.yml"
+    mtime = config_path.stat().st_mtime
+    cached = _config_cache.get(str(config_path))
+    if cached and cached[0] == mtime:
+        return cached[1]
+    print(f"Loading config from: {config_path}")
+    config = load_config(str(config_path))
+    _config_cache[str(config_path)] = (mtime, config)
+    return config
+
+_archive = None
+
+def get_archive():
+    """The poller's job archive in the project-root job_checker.db, or None if it is empty"""
+    global _archive
+    if not JOB_CHECKER_AVAILABLE:
+        return None
+    db_path = Path(__file__).parent.parent / "job_checker.db"
+    if not db_path.exists():
+        return None
+    if _archive is None:
+        _archive = JobArchive(str(db_path))
+    return _archive if len(_archive) else None
+
 def get_real_jobs():
     """Fetch real jobs from the job_checker module"""
     if not JOB_CHECKER_AVAILABLE:
@@ -98,10 +130,7 @@ def get_real_jobs():
         return MOCK_JOBS
     
     try:
-        # Load config from the parent directory
-        config_path = Path(__file__).parent.parent / "config.yml"
-        print(f"Loading config from: {config_path}")
-        config = load_config(str(config_path))
+        config = get_config()
         print(f"Config loaded, fetching jobs...")
         jobs = list(gather_jobs(config))
         print(f"Found {len(jobs)} jobs before filtering")
@@ -109,13 +138,14 @@ def get_real_jobs():
         print(f"Found {len(jobs)} jobs after filtering")
         
         # Convert to the format expected by the web app
+        locations = filter_plan(config).locations
         web_jobs = []
         for job in jobs:
             # Determine scope and stretch based on location
             scope = "US Remote"
             is_stretch = False
             
-            if job.location and any(alias in job.location.lower() for alias in ["austin", "texas", "tx"]):
+            if job.location and locations.classify(job.location) == AUSTIN:
                 scope = "Austin"
                 is_stretch = False
             elif job.location and "remote" in job.location.lower():
@@ -163,6 +193,24 @@ async def get_jobs(
 ):
     """Get paginated job listings with optional filters"""
     try:
+        archive = get_archive()
+        if archive is not None:
+            # Indexed search over everything the poller has accepted
+            found, total = archive.search(
+                search=search,
+                company=company,
+                scope=scope,
+                source=source,
+                limit=per_page,
+                offset=(page - 1) * per_page,
+            )
+            return SearchResponse(
+                jobs=[JobResponse(**job.as_dict()) for job in found],
+                total=total,
+                page=page,
+                per_page=per_page
+            )
+
         # Get real jobs or fall back to mock data
         all_jobs = get_real_jobs()
         
@@ -220,6 +268,10 @@ async def get_jobs(
 async def get_jobs_today():
     """Get jobs posted today"""
     try:
+        archive = get_archive()
+        if archive is not None:
+            return [JobResponse(**job.as_dict()) for job in archive.posted_today()]
+
         today = datetime.now().date()
         all_jobs = get_real_jobs()
         today_jobs = []
@@ -242,6 +294,11 @@ async def get_jobs_today():
 async def get_stats():
     """Get job statistics"""
     try:
+        archive = get_archive()
+        if archive is not None:
+            # Counted in SQL over everything the poller has accepted
+            return JobStats(**archive.stats())
+
         all_jobs = get_real_jobs()
         total_jobs = len(all_jobs)
         
@@ -287,6 +344,13 @@ async def refresh_jobs():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error refreshing jobs: {str(e)}")
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics of this process: live fetches made for /api/jobs (the poller serves its own)"""
+    if not JOB_CHECKER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="job_checker module not available")
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""